@@ -19,4 +19,17 @@ except Exception:
 __author__ = "Kim Asplund"
 __email__ = "kim.asplund@gmail.com"
 
-from mcp_pypi.server import PyPIMCPServer
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from mcp_pypi.server import PyPIMCPServer
+
+
+def __getattr__(name: str) -> Any:
+    # The MCP server pulls in the whole mcp SDK, so it is only imported when
+    # first used; plain client and CLI use starts much faster.
+    if name == "PyPIMCPServer":
+        from mcp_pypi.server import PyPIMCPServer
+
+        return PyPIMCPServer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
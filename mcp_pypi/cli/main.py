@@ -3,7 +3,6 @@ Command Line Interface for the MCP-PyPI client.
 """
 
 import asyncio
-import json
 import logging
 import os
 import sys
@@ -20,8 +19,8 @@ from rich.table import Table
 from mcp_pypi.cli.server_command import serve_command
 from mcp_pypi.core import PyPIClient
 from mcp_pypi.core.models import PyPIClientConfig
-from mcp_pypi.server import PyPIMCPServer
 from mcp_pypi.utils import configure_logging
+from mcp_pypi.utils.common.serialization import json_dumps_pretty
 
 # Set up consoles
 console = Console()
@@ -338,11 +337,11 @@ def get_config() -> PyPIClientConfig:
 def output_json(data: Mapping[str, Any], color: bool = True) -> None:
     """Output JSON data to the console."""
     if color:
-        json_str = json.dumps(data, indent=2)
+        json_str = json_dumps_pretty(data)
         syntax = Syntax(json_str, "json", theme="monokai", line_numbers=False)
         console.print(syntax)
     else:
-        print(json.dumps(data, indent=2))
+        print(json_dumps_pretty(data))
 
 
 def print_error(message: str) -> None:
@@ -4,17 +4,131 @@ Handles JSON-RPC 2.0 requests and responses.
 """
 
 import asyncio
-import json
+import gc
 import logging
+import os
+import re
+import select
+import signal
 import socket
+import stat
 import sys
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from mcp_pypi.core import PyPIClient
 from mcp_pypi.core.models import PyPIClientConfig
+from mcp_pypi.utils.common.serialization import JSONDecodeError, json_dumps, json_loads
 
 logger = logging.getLogger("mcp-pypi.server")
 
+# Maximum number of bytes pulled from stdin per read
+STDIN_READ_SIZE = 64 * 1024
+
+# Maximum number of buffers passed to a single os.writev call
+IOV_MAX = 1024
+
+# Maximum number of stdin requests handled concurrently
+MAX_CONCURRENT_REQUESTS = 32
+
+# Automatic GC is paused while stdin requests are in flight and run when the
+# server goes idle; past this many net young-generation allocations a young
+# collection runs anyway, promoted to older generations on the interpreter's
+# usual thresholds, so sustained load cannot grow unbounded
+GC_DEFERRED_ALLOCATIONS = 50_000
+
+# Seconds without any request in flight before the deferred full collection
+# runs; a request arriving sooner postpones it again
+GC_IDLE_DELAY = 1.0
+
+# Read-only methods whose results can be reused across requests for a short
+# time; feeds and requirements-file checks are excluded since they change, and
+# get_dependency_tree since each call writes a fresh visualization file.
+CACHEABLE_METHODS = frozenset(
+    {
+        "search_packages",
+        "get_dependencies",
+        "check_package_exists",
+        "get_package_metadata",
+        "get_package_stats",
+        "get_package_info",
+        "get_latest_version",
+        "get_package_releases",
+        "get_release_urls",
+        "get_documentation_url",
+        "compare_versions",
+    }
+)
+RESULT_CACHE_TTL = 300  # seconds
+RESULT_CACHE_MAX_SIZE = 512
+
+# Dispatch table: JSON-RPC method name -> (PyPIClient attribute, parameter coercions).
+# Coercions convert loosely typed JSON params (e.g. "3") to what the client expects.
+DISPATCH: Dict[str, Tuple[str, Dict[str, Callable[[Any], Any]]]] = {
+    "search_packages": ("search_packages", {"page": int}),
+    "get_dependencies": ("get_dependencies", {}),
+    "check_package_exists": ("check_package_exists", {}),
+    "get_package_metadata": ("get_package_metadata", {}),
+    "get_package_stats": ("get_package_stats", {}),
+    "get_dependency_tree": ("get_dependency_tree", {"depth": int}),
+    "get_package_info": ("get_package_info", {}),
+    "get_latest_version": ("get_latest_version", {}),
+    "get_package_releases": ("get_package_releases", {}),
+    "get_release_urls": ("get_release_urls", {}),
+    "get_newest_packages": ("get_newest_packages", {}),
+    "get_latest_updates": ("get_latest_updates", {}),
+    "get_project_releases": ("get_project_releases", {}),
+    "get_documentation_url": ("get_documentation_url", {}),
+    "check_requirements_file": ("check_requirements_file", {}),
+    "compare_versions": ("compare_versions", {}),
+}
+
+
+# Responses are rendered from fixed templates so only the variable parts
+# (result, code, message, data, id) are serialized, without building envelope
+# dicts per request; constant errors are fully prebuilt.
+_RESULT_TEMPLATE = '{"jsonrpc":"2.0","result":%s,"id":%s}'
+_ERROR_TEMPLATE = '{"jsonrpc":"2.0","error":{"code":%d,"message":%s%s},"id":%s}'
+
+
+def format_error_response(
+    code: int,
+    message: str,
+    data: Optional[Any] = None,
+    request_id: Optional[Any] = None,
+) -> str:
+    """Format a JSON-RPC 2.0 error response from the precompiled template."""
+    data_field = f',"data":{json_dumps(data)}' if data else ""
+    return _ERROR_TEMPLATE % (
+        code,
+        json_dumps(message),
+        data_field,
+        json_dumps(request_id),
+    )
+
+
+# Canonical ping request, e.g. {"jsonrpc": "2.0", "method": "ping", "id": 1};
+# anything else (other key order, extra fields) takes the regular path
+_PING_REQUEST_RE = re.compile(
+    rb'\s*\{\s*"jsonrpc"\s*:\s*"2\.0"\s*,\s*"method"\s*:\s*"ping"\s*'
+    rb'(?:,\s*"id"\s*:\s*(-?\d+|"[^"\\]*"|null)\s*)?\}\s*\Z'
+)
+
+PARSE_ERROR_RESPONSE = format_error_response(-32700, "Parse error", "Invalid JSON")
+
 
 class RPCServer:
     """JSON-RPC 2.0 server for MCP-PyPI."""
@@ -23,33 +137,50 @@ class RPCServer:
         """Initialize the RPC server."""
         self.client = client or PyPIClient()
 
-    async def handle_request(self, request_data: str) -> str:
+        # Resolve bound client methods once instead of rebuilding a map per request
+        self._dispatch: Dict[str, Tuple[Any, Dict[str, Callable[[Any], Any]]]] = {
+            method: (getattr(self.client, attr), coercions)
+            for method, (attr, coercions) in DISPATCH.items()
+        }
+
+        # Short-lived cache of successful results for read-only methods,
+        # keyed by (method, params); values are (expires_at, result)
+        self._result_cache: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+
+    async def handle_request(self, request_data: Union[str, bytes]) -> str:
         """Handle a JSON-RPC request."""
+        # Fast path: answer canonical ping requests without a full JSON parse
+        if isinstance(request_data, bytes) and b'"ping"' in request_data:
+            match = _PING_REQUEST_RE.match(request_data)
+            if match:
+                return _RESULT_TEMPLATE % ('"pong"', (match[1] or b"null").decode())
+
         try:
             # Parse the request
-            request = json.loads(request_data)
+            request = json_loads(request_data)
+
+            # Extract each field with a single lookup
+            request_id = request.get("id")
+            method = request.get("method")
+            params = request.get("params", {})
 
             # Validate request format
-            if "jsonrpc" not in request or request["jsonrpc"] != "2.0":
+            if request.get("jsonrpc") != "2.0":
                 return self._format_error(
                     -32600,
                     "Invalid Request",
                     "Not a valid JSON-RPC 2.0 request",
-                    request.get("id"),
+                    request_id,
                 )
 
-            if "method" not in request:
+            if method is None:
                 return self._format_error(
                     -32600,
                     "Invalid Request",
                     "Method field is required",
-                    request.get("id"),
+                    request_id,
                 )
 
-            method = request["method"]
-            params = request.get("params", {})
-            request_id = request.get("id")
-
             # Process the request
             try:
                 result = await self._dispatch_method(method, params)
@@ -65,18 +196,16 @@ class RPCServer:
                     )
 
                 # Format success response
-                return json.dumps(
-                    {"jsonrpc": "2.0", "result": result, "id": request_id}
-                )
+                return _RESULT_TEMPLATE % (json_dumps(result), json_dumps(request_id))
 
             except Exception as e:
-                logger.exception(f"Error processing method {method}: {e}")
+                logger.exception("Error processing method %s: %s", method, e)
                 return self._format_error(-32603, "Internal error", str(e), request_id)
 
-        except json.JSONDecodeError:
-            return self._format_error(-32700, "Parse error", "Invalid JSON", None)
+        except JSONDecodeError:
+            return PARSE_ERROR_RESPONSE
         except Exception as e:
-            logger.exception(f"Unexpected error handling request: {e}")
+            logger.exception("Unexpected error handling request: %s", e)
             return self._format_error(-32603, "Internal error", str(e), None)
 
     def _format_error(
@@ -87,14 +216,7 @@ class RPCServer:
         request_id: Optional[Any] = None,
     ) -> str:
         """Format a JSON-RPC 2.0 error response."""
-        error_obj = {"code": code, "message": message}
-
-        if data:
-            error_obj["data"] = data
-
-        response = {"jsonrpc": "2.0", "error": error_obj, "id": request_id}
-
-        return json.dumps(response)
+        return format_error_response(code, message, data, request_id)
 
     def _map_error_code(self, code_str: str) -> int:
         """Map internal error codes to JSON-RPC error codes."""
@@ -122,62 +244,231 @@ class RPCServer:
                 "name": "mcp-pypi",
                 "version": __version__,
                 "description": "PyPI package search and info via MCP",
-                "methods": [
-                    "search_packages",
-                    "get_dependencies",
-                    "check_package_exists",
-                    "get_package_metadata",
-                    "get_package_stats",
-                    "get_dependency_tree",
-                    "get_package_info",
-                    "get_latest_version",
-                    "get_package_releases",
-                    "get_release_urls",
-                    "get_newest_packages",
-                    "get_latest_updates",
-                    "get_project_releases",
-                    "get_documentation_url",
-                    "check_requirements_file",
-                    "compare_versions",
-                ],
+                "methods": list(DISPATCH),
             }
 
         if method == "ping":
             return "pong"
 
-        method_map = {
-            "search_packages": self.client.search_packages,
-            "get_dependencies": self.client.get_dependencies,
-            "check_package_exists": self.client.check_package_exists,
-            "get_package_metadata": self.client.get_package_metadata,
-            "get_package_stats": self.client.get_package_stats,
-            "get_dependency_tree": self.client.get_dependency_tree,
-            "get_package_info": self.client.get_package_info,
-            "get_latest_version": self.client.get_latest_version,
-            "get_package_releases": self.client.get_package_releases,
-            "get_release_urls": self.client.get_release_urls,
-            "get_newest_packages": self.client.get_newest_packages,
-            "get_latest_updates": self.client.get_latest_updates,
-            "get_project_releases": self.client.get_project_releases,
-            "get_documentation_url": self.client.get_documentation_url,
-            "check_requirements_file": self.client.check_requirements_file,
-            "compare_versions": self.client.compare_versions,
-        }
-
-        if method not in method_map:
+        handler, coercions = self._dispatch.get(method, (None, None))
+        if handler is None:
             raise ValueError(f"Unknown method: {method}")
 
-        method_func = method_map[method]
+        # Coerce first so equivalent params (e.g. "2" and 2) share a cache entry
+        if isinstance(params, dict) and params:
+            params = _coerce_params(params, coercions)
+
+        cache_key = (
+            _make_cache_key(method, params) if method in CACHEABLE_METHODS else None
+        )
+        if cache_key is not None:
+            cached = self._result_cache.get(cache_key)
+            if cached is not None and cached[0] > time.monotonic():
+                self._result_cache.move_to_end(cache_key)
+                return cached[1]
 
         # Convert params to args and kwargs based on method signature
         if isinstance(params, dict) and params:
-            return await method_func(**params)  # type: ignore[misc]
+            result = await handler(**params)
         elif isinstance(params, list) and params:
-            return await method_func(*params)  # type: ignore[misc]
+            result = await handler(*params)
         else:
             # Empty params - this is an error for methods that require args
             raise ValueError(f"Method {method} requires parameters")
 
+        if cache_key is not None and not (
+            isinstance(result, dict) and "error" in result
+        ):
+            self._result_cache[cache_key] = (
+                time.monotonic() + RESULT_CACHE_TTL,
+                result,
+            )
+            self._result_cache.move_to_end(cache_key)
+            if len(self._result_cache) > RESULT_CACHE_MAX_SIZE:
+                self._result_cache.popitem(last=False)
+
+        return result
+
+
+def _make_cache_key(method: str, params: Any) -> Optional[Hashable]:
+    """Build a hashable result-cache key, or None if params are not hashable."""
+    try:
+        if isinstance(params, dict):
+            key: Hashable = (method, frozenset(params.items()))
+        elif isinstance(params, list):
+            key = (method, tuple(params))
+        else:
+            return None
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _coerce_params(
+    params: Dict[str, Any], coercions: Dict[str, Callable[[Any], Any]]
+) -> Dict[str, Any]:
+    """Apply the per-method type coercions to named parameters."""
+    if not coercions:
+        return params
+
+    coerced = dict(params)
+    for name, convert in coercions.items():
+        if coerced.get(name) is not None:
+            coerced[name] = convert(coerced[name])
+    return coerced
+
+
+async def _connect_stdin_reader(
+    loop: asyncio.AbstractEventLoop, stdin: BinaryIO
+) -> Tuple[Optional[asyncio.StreamReader], Optional[asyncio.BaseTransport]]:
+    """Attach stdin to the event loop as a non-blocking pipe reader.
+
+    Only FIFOs are attached: the transport sets O_NONBLOCK on the open file
+    description, which a terminal or socket shares with stdout and keeps
+    after the process exits.
+
+    Returns:
+        A StreamReader fed by the loop's selector and its transport, or
+        (None, None) if stdin is not a pipe
+    """
+    try:
+        mode = os.fstat(stdin.fileno()).st_mode
+    except (AttributeError, OSError):
+        return None, None
+    if not stat.S_ISFIFO(mode):
+        return None, None
+
+    reader = asyncio.StreamReader()
+    try:
+        transport, _ = await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader), stdin
+        )
+    except (OSError, ValueError, NotImplementedError) as e:
+        logger.debug("Falling back to thread reads for stdin: %s", e)
+        return None, None
+    return reader, transport
+
+
+def _read_in_thread(
+    loop: asyncio.AbstractEventLoop, read: Callable[[int], bytes], size: int
+) -> "asyncio.Future[bytes]":
+    """Run one blocking read on a daemon thread.
+
+    Unlike the default executor, a thread parked on a read that never returns
+    does not hold up event loop or interpreter shutdown, so the caller can
+    abandon the returned future on a stop signal.
+    """
+    future = loop.create_future()
+
+    def deliver(data: Optional[bytes], error: Optional[BaseException]) -> None:
+        if future.done():
+            # Abandoned by the caller
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(data)
+
+    def run() -> None:
+        try:
+            result = (read(size), None)
+        except BaseException as e:
+            result = (None, e)
+        try:
+            loop.call_soon_threadsafe(deliver, *result)
+        except RuntimeError:
+            # The loop closed while the read was blocked
+            pass
+
+    threading.Thread(target=run, name="mcp-stdin-reader", daemon=True).start()
+    return future
+
+
+def _split_lines(buffer: bytes) -> Tuple[List[bytes], bytes]:
+    """Split a read buffer into complete lines and the trailing partial line."""
+    *lines, remainder = buffer.split(b"\n")
+    return lines, remainder
+
+
+def _write_responses(stdout: BinaryIO, responses: List[bytes]) -> None:
+    """Write a batch of newline-terminated responses.
+
+    Uses a single os.writev on the underlying file descriptor when possible,
+    falling back to one buffered write for streams without a real fd.
+    """
+    if not responses:
+        return
+
+    try:
+        fd = stdout.fileno()
+    except (AttributeError, OSError):
+        fd = -1
+
+    if fd < 0 or not hasattr(os, "writev"):
+        stdout.write(b"".join(responses))
+        stdout.flush()
+        return
+
+    # Anything already buffered must go out before our direct fd write
+    stdout.flush()
+    _writev_all(fd, responses)
+
+
+def _writev_all(fd: int, buffers: List[bytes]) -> None:
+    """Write all buffers to fd with os.writev, handling short writes.
+
+    A non-blocking fd that is full is waited on until it becomes writable.
+    """
+    while buffers:
+        try:
+            written = os.writev(fd, buffers[:IOV_MAX])
+        except BlockingIOError:
+            select.select([], [fd], [])
+            continue
+        # Drop fully written buffers and trim a partially written one
+        index = 0
+        while index < len(buffers) and written >= len(buffers[index]):
+            written -= len(buffers[index])
+            index += 1
+        buffers = buffers[index:]
+        if written:
+            buffers[0] = buffers[0][written:]
+
+
+def _collect_deferred_garbage() -> None:
+    """Run the collection automatic GC would have run by now, if any.
+
+    Each young collection counts towards the next generation, as in CPython's
+    own scheduling, so gen1 and gen2 are still collected under steady load.
+    """
+    counts = gc.get_count()
+    if counts[0] <= GC_DEFERRED_ALLOCATIONS:
+        return
+    thresholds = gc.get_threshold()
+    generation = 0
+    while generation < 2 and counts[generation + 1] >= thresholds[generation + 1]:
+        generation += 1
+    gc.collect(generation)
+
+
+def _install_stop_handlers(
+    loop: asyncio.AbstractEventLoop, callback: Callable[[], None]
+) -> List[int]:
+    """Route SIGINT and SIGTERM to a callback on the event loop.
+
+    Returns the signals that were installed, so they can be removed again.
+    Platforms without loop signal support (e.g. Windows) install nothing.
+    """
+    installed = []
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, callback)
+        except (NotImplementedError, RuntimeError):
+            continue
+        installed.append(signum)
+    return installed
+
 
 async def process_mcp_stdin(verbose: bool = False):
     """Process MCP protocol lines from stdin and handle requests."""
@@ -186,44 +477,157 @@ async def process_mcp_stdin(verbose: bool = False):
     client = PyPIClient(config)
 
     # Configure logging
-    log_level = logging.DEBUG if verbose else logging.INFO
+    if verbose:
+        logger.setLevel(logging.DEBUG)
 
     # Create RPC server with our persistent client
     server = RPCServer(client)
 
+    # Work on the binary streams: the JSON decoder accepts bytes directly, so we
+    # skip the TextIOWrapper decode/encode on every message
+    stdin = sys.stdin.buffer
+    stdout = sys.stdout.buffer
+
     logger.info("Starting MCP stdin processing...")
 
-    try:
-        while True:
-            # Read a line from stdin
-            line = await asyncio.get_event_loop().run_in_executor(
-                None, sys.stdin.readline
-            )
+    async def handle_line(line: bytes) -> Optional[bytes]:
+        line = line.strip()
+        if not line:
+            return None
 
-            if not line:
-                # End of input
-                break
+        # Process the input
+        # Lazy %-formatting: nothing is rendered unless DEBUG is enabled
+        logger.debug("Received input: %r...", line[:50])
 
-            line = line.strip()
-            if not line:
-                continue
+        try:
+            # Parse the JSON request
+            async with semaphore:
+                response_data = await server.handle_request(line)
+        except Exception as e:
+            logger.exception("Error processing request: %s", e)
+            response_data = format_error_response(-32603, str(e))
+        return response_data.encode("utf-8") + b"\n"
+
+    async def respond(line: bytes) -> None:
+        response = await handle_line(line)
+        if response is None:
+            return
+        ready.append(response)
+        async with write_lock:
+            # Let every request finishing in this loop iteration queue up, so
+            # responses completed together share a single writev
+            await asyncio.sleep(0)
+            if not ready:
+                # An earlier writer already sent this response
+                return
+            responses = ready[:]
+            ready.clear()
+            try:
+                _write_responses(stdout, responses)
+            except BrokenPipeError:
+                # The client went away; stop reading instead of failing every
+                # write
+                logger.debug("stdout closed by client, stopping")
+                request_stop()
+
+    def schedule_requests(lines: List[bytes]) -> None:
+        nonlocal gc_idle_handle
+        if gc_idle_handle is not None:
+            gc_idle_handle.cancel()
+            gc_idle_handle = None
+        _collect_deferred_garbage()
+        # Keep reading while earlier requests are still waiting on PyPI; each
+        # request answers as soon as it is done rather than waiting for the
+        # slowest one read alongside it
+        for line in lines:
+            task = loop.create_task(respond(line))
+            in_flight.add(task)
+            task.add_done_callback(request_done)
+
+    def request_done(task: "asyncio.Task[None]") -> None:
+        nonlocal gc_idle_handle
+        in_flight.discard(task)
+        if not in_flight:
+            # Idle: run the collection deferred while requests were in flight,
+            # unless the next request arrives first
+            gc_idle_handle = loop.call_later(GC_IDLE_DELAY, gc.collect)
+
+    def request_stop() -> None:
+        # Stop accepting input; requests already read are still answered
+        nonlocal running
+        running = False
+        if reader_transport is not None:
+            # Stop the pipe from feeding the reader after its EOF
+            reader_transport.pause_reading()
+        if reader is not None:
+            reader.feed_eof()
+        if read_future is not None and not read_future.done():
+            # Abandon a blocked thread read; it cannot be interrupted
+            read_future.set_result(b"")
+
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    in_flight: Set["asyncio.Task[None]"] = set()
+    write_lock = asyncio.Lock()
+    ready: List[bytes] = []
+    gc_idle_handle: Optional[asyncio.TimerHandle] = None
+    read_future: Optional["asyncio.Future[bytes]"] = None
+    pending = b""
+    running = True
+
+    # Prefer readiness-driven reads on the event loop's selector for pipes;
+    # fall back to blocking reads on a daemon thread for anything else
+    reader, reader_transport = await _connect_stdin_reader(loop, stdin)
+
+    # Interrupts are handled once by the loop rather than surfacing as
+    # KeyboardInterrupt in the middle of a read
+    signals = _install_stop_handlers(loop, request_stop)
+
+    async def read_chunk() -> bytes:
+        # Read whatever is available (up to STDIN_READ_SIZE) in one call, so a
+        # burst of requests is drained together
+        nonlocal read_future
+        if reader is not None:
+            return await reader.read(STDIN_READ_SIZE)
+        read_future = _read_in_thread(loop, stdin.read1, STDIN_READ_SIZE)
+        try:
+            return await read_future
+        finally:
+            read_future = None
 
-            # Process the input
-            logger.debug(f"Received input: {line[:50]}...")
+    # Keep GC pauses out of the request path; see request_done
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
 
-            try:
-                # Parse the JSON request
-                response_data = await server.handle_request(line)
-                print(response_data, flush=True)
-            except Exception as e:
-                logger.exception(f"Error processing request: {e}")
-                error_response = {
-                    "jsonrpc": "2.0",
-                    "error": {"code": -32603, "message": str(e)},
-                    "id": None,
-                }
-                print(json.dumps(error_response), flush=True)
+    try:
+        while running:
+            chunk = await read_chunk()
+
+            if not chunk:
+                # End of input; handle a final request without a trailing
+                # newline. When stopped by a signal or a closed stdout the
+                # trailing fragment is an incomplete line, so it is dropped.
+                if running:
+                    schedule_requests([pending])
+                break
+
+            lines, pending = _split_lines(pending + chunk)
+            schedule_requests(lines)
+
+        # Drain outstanding requests before shutting down
+        await asyncio.gather(*in_flight)
     finally:
+        for task in in_flight:
+            task.cancel()
+        for signum in signals:
+            loop.remove_signal_handler(signum)
+        if gc_idle_handle is not None:
+            gc_idle_handle.cancel()
+        if gc_was_enabled:
+            gc.enable()
+        if reader_transport is not None:
+            reader_transport.close()
+
         # Only close the client when we're completely done with STDIN processing
         logger.info("MCP processing completed")
         await client.close()
@@ -6,7 +6,6 @@ from typing import Any, Dict, Literal, Optional
 import typer
 
 from mcp_pypi.core.models import PyPIClientConfig
-from mcp_pypi.server import PyPIMCPServer
 from mcp_pypi.utils import configure_logging
 
 
@@ -71,7 +70,9 @@ def serve_command(
 
         config = PyPIClientConfig(**config_kwargs)
 
-        # Create and run the server
+        # Create and run the server (imported here, as it loads the mcp SDK)
+        from mcp_pypi.server import PyPIMCPServer
+
         server = PyPIMCPServer(config=config, host=host, port=port)
 
         # Log startup info
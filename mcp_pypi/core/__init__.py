@@ -3,19 +3,30 @@ Core client for interacting with PyPI.
 """
 
 import asyncio
+import copy
 import datetime
-import json
+import importlib.util
+import io
 import logging
 import os
+import re
 import sys
+import tempfile
+import time
+from collections import OrderedDict
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union, cast
+from typing import (Any, Awaitable, Callable, Dict, Iterator, List, Optional,
+                    Tuple, TypeVar, Union, cast)
 from urllib.parse import quote_plus
 
 import defusedxml.ElementTree as ET
 from packaging.requirements import Requirement
 from packaging.specifiers import SpecifierSet
-from packaging.version import Version
+from packaging.utils import (InvalidSdistFilename, InvalidWheelFilename,
+                             canonicalize_name, parse_sdist_filename,
+                             parse_wheel_filename)
+from packaging.version import InvalidVersion, Version
 
 from mcp_pypi.core.cache import AsyncCacheManager
 from mcp_pypi.core.http import AsyncHTTPClient
@@ -30,6 +41,8 @@ from mcp_pypi.core.models import (DependenciesResult, DependencyTreeResult,
                                   VersionComparisonResult, VersionInfo,
                                   format_error)
 from mcp_pypi.core.stats import PackageStatsService
+from mcp_pypi.utils.common.serialization import (JSONDecodeError,
+                                                 json_dumps_bytes, json_loads)
 from mcp_pypi.utils.helpers import sanitize_package_name, sanitize_version
 
 # For Python < 3.11, use tomli for parsing TOML files
@@ -40,6 +53,308 @@ else:
 
 logger = logging.getLogger("mcp-pypi.client")
 
+# Package name and optional version spec, for requirement lines that
+# packaging cannot parse
+_REQUIREMENT_FALLBACK_RE = re.compile(r"^([a-zA-Z0-9_.-]+)(?:[<>=~!]=?|@)(.+)?")
+
+# Media type of the JSON Simple API (PEP 691). Its project pages list every
+# version (PEP 700) without the per-release metadata of the /json endpoint,
+# so they are a fraction of the size.
+SIMPLE_JSON_ACCEPT = "application/vnd.pypi.simple.v1+json"
+
+# project_urls labels that point at documentation ("Docs", "ReadTheDocs", ...)
+_DOCS_KEY_RE = re.compile(r"doc|rtd", re.IGNORECASE)
+
+# Owner and repository name in a GitHub URL
+_GITHUB_REPO_RE = re.compile(r"github\.com/([^/]+)/([^/]+)")
+
+# Number of memoized lookup results kept per client
+MEMO_MAX_ENTRIES = 1024
+
+# Seconds to remember that a package does not exist; kept short so newly
+# published packages show up quickly
+NEGATIVE_CACHE_TTL = 300
+
+# Dependency trees with more packages than this are returned without a
+# treemap; rendering one takes seconds and produces megabytes of HTML
+MAX_VISUALIZED_PACKAGES = 500
+
+R = TypeVar("R")
+
+
+def _memoized(
+    method: Callable[..., Awaitable[R]],
+) -> Callable[..., Awaitable[R]]:
+    """Memoize a PyPIClient lookup per instance.
+
+    Concurrent calls with the same arguments share one in-flight call, and
+    successful results are reused for ``config.cache_ttl`` seconds. "Not found"
+    answers are reused for at most NEGATIVE_CACHE_TTL seconds; other errors
+    are never memoized. Every caller receives its own copy of the result, so
+    this is only worth it for lookups with small results.
+    """
+
+    @wraps(method)
+    async def wrapper(self: "PyPIClient", *args: Any, **kwargs: Any) -> R:
+        key = (method.__name__, args, frozenset(kwargs.items()))
+
+        entry = self._memo.get(key)
+        if entry is not None:
+            expires, value = entry
+            if time.monotonic() < expires:
+                self._memo.move_to_end(key)
+                return copy.deepcopy(value)
+            del self._memo[key]
+
+        task = self._memo_inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(method(self, *args, **kwargs))
+            self._memo_inflight[key] = task
+            task.add_done_callback(lambda _: self._settle_memo(key, task))
+            # Shielded so cancelling this caller doesn't fail the ones joining
+            return await asyncio.shield(task)
+
+        # Joining another caller's lookup; give this caller its own copy
+        return copy.deepcopy(await asyncio.shield(task))
+
+    return wrapper
+
+
+@lru_cache(maxsize=4096)
+def _parse_requirement(requirement: str) -> Requirement:
+    """Parse a PEP 508 requirement string.
+
+    The same strings (e.g. "requests>=2.0") recur across many packages, so
+    parsed requirements are memoized. Callers must treat them as read-only.
+
+    Raises:
+        InvalidRequirement: If the string is not a valid requirement
+    """
+    return Requirement(requirement)
+
+
+@lru_cache(maxsize=4096)
+def _parse_version(version: str) -> Version:
+    """Parse a PEP 440 version string.
+
+    Version objects are immutable, so parsed versions are memoized; the same
+    strings recur across vulnerability ranges and requirement checks.
+
+    Raises:
+        InvalidVersion: If the string is not a valid version
+    """
+    return Version(version)
+
+
+def _latest_simple_version(project: Dict[str, Any]) -> Optional[str]:
+    """Pick the latest version from a JSON Simple API project page.
+
+    Matches the version PyPI reports in its /json ``info``: releases that are
+    not yanked win over yanked ones, then final releases over pre-releases,
+    then the highest version.
+
+    Args:
+        project: The decoded project page
+
+    Returns:
+        The latest version, or None if the project has no valid versions
+    """
+    # PyPI yanks whole releases, so one yanked file marks its version
+    yanked = set()
+    for file in project.get("files", []):
+        if not file.get("yanked"):
+            continue
+        filename = file.get("filename", "")
+        try:
+            if filename.endswith(".whl"):
+                yanked.add(parse_wheel_filename(filename)[1])
+            else:
+                yanked.add(parse_sdist_filename(filename)[1])
+        except (InvalidWheelFilename, InvalidSdistFilename):
+            continue
+
+    best: Optional[Tuple[Tuple[bool, bool, Version], str]] = None
+    for version in project.get("versions", []):
+        try:
+            parsed = _parse_version(version)
+        except InvalidVersion:
+            continue
+        rank = (parsed not in yanked, not parsed.is_prerelease, parsed)
+        if best is None or rank > best[0]:
+            best = (rank, version)
+
+    return best[1] if best else None
+
+
+def _is_pre_pep700_index_page(data: Any) -> bool:
+    """Check whether a Simple API response is a real project page without versions.
+
+    An HTML page means the index ignored the JSON Accept header, and a JSON
+    page with ``files`` but no ``versions`` predates PEP 700. Anything else
+    (proxy error pages, unexpected content) says nothing about the index.
+    """
+    if not isinstance(data, dict):
+        return False
+    if "raw_data" in data:
+        return "html" in data.get("content_type", "")
+    return "files" in data and "versions" not in data
+
+
+def _write_text_atomic(path: str, text: str) -> None:
+    """Write a text file so readers never see a partial file.
+
+    Args:
+        path: The destination path
+        text: The file contents
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _iter_rss_items(
+    source: Union[io.BytesIO, io.StringIO]
+) -> Iterator[Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]]:
+    """Stream the items of an RSS feed.
+
+    Each <item> is read in a single pass over its children and cleared
+    afterwards, so memory stays flat regardless of feed size.
+
+    Args:
+        source: A file-like object holding the feed XML
+
+    Yields:
+        (title, link, description, pubDate) text for each item
+
+    Raises:
+        ET.ParseError: If the feed is not well-formed XML
+    """
+    for _, elem in ET.iterparse(source):
+        if elem.tag != "item":
+            continue
+        fields: Dict[str, str] = {}
+        for child in elem:
+            # Like findtext: the first match wins and empty elements give ""
+            fields.setdefault(child.tag, child.text or "")
+        yield (
+            fields.get("title"),
+            fields.get("link"),
+            fields.get("description"),
+            fields.get("pubDate"),
+        )
+        elem.clear()
+
+
+def _split_keywords(keywords: Optional[str]) -> List[str]:
+    """Split a Core Metadata ``Keywords`` field into individual keywords.
+
+    The field is comma-separated; older packages separate keywords with
+    whitespace only, so that is used when there is no comma.
+
+    Args:
+        keywords: The raw field value, possibly empty or None
+
+    Returns:
+        The keywords with surrounding whitespace and empty entries removed
+    """
+    if not keywords:
+        return []
+    if "," not in keywords:
+        return keywords.split()
+    return [keyword for keyword in map(str.strip, keywords.split(",")) if keyword]
+
+
+def _rss_source(response: Any) -> Optional[io.BytesIO]:
+    """Wrap the raw body of an RSS feed response for streaming parsing.
+
+    Args:
+        response: The response returned by the HTTP client
+
+    Returns:
+        A file-like object over the feed XML, or None if the response does not
+        carry a raw body
+    """
+    if not isinstance(response, dict) or "raw_data" not in response:
+        return None
+    xml_data = response["raw_data"]
+    if isinstance(xml_data, str):
+        xml_data = xml_data.encode("utf-8")
+    if not isinstance(xml_data, bytes):
+        return None
+    return io.BytesIO(xml_data)
+
+
+def _parse_rss_feed(data: Any, key: str) -> Dict[str, Any]:
+    """Parse an RSS feed response into feed items.
+
+    The feed is parsed incrementally and each <item> is cleared once read, so
+    memory stays flat regardless of feed size.
+
+    Args:
+        data: The response returned by the HTTP client
+        key: The result key for the items, e.g. "packages"
+
+    Returns:
+        A dict with the items under ``key``, or an error dict
+    """
+    # Check for error in result
+    if isinstance(data, dict) and "error" in data:
+        return data
+
+    # Handle the new format where raw data might be returned; the legacy
+    # format returns the str/bytes body directly
+    if isinstance(data, dict) and "raw_data" in data:
+        data = data["raw_data"]
+
+    if isinstance(data, bytes):
+        source: Union[io.BytesIO, io.StringIO] = io.BytesIO(data)
+    elif isinstance(data, str):
+        source = io.StringIO(data)
+    else:
+        return {
+            key: [],
+            "error": {
+                "code": ErrorCode.PARSE_ERROR,
+                "message": f"Unexpected data type: {type(data)}",
+            },
+        }
+
+    items: List[FeedItem] = []
+    try:
+        for title, link, description, published_date in _iter_rss_items(source):
+            if (
+                title is not None
+                and link is not None
+                and description is not None
+                and published_date is not None
+            ):
+                items.append(
+                    {
+                        "title": title,
+                        "link": link,
+                        "description": description,
+                        "published_date": published_date,
+                    }
+                )
+    except ET.ParseError as e:
+        logger.error(f"XML parse error: {e}")
+        return {
+            key: [],
+            "error": {
+                "code": ErrorCode.PARSE_ERROR,
+                "message": f"Invalid XML response: {e}",
+            },
+        }
+
+    return {key: items}
+
 
 class PyPIClient:
     """Client for interacting with PyPI."""
@@ -67,19 +382,57 @@ class PyPIClient:
         self.stats = stats_service or PackageStatsService(self.http)
 
         # Check for optional dependencies
-        self._has_bs4 = self._check_import("bs4", "BeautifulSoup")
-        self._has_plotly = self._check_import("plotly.graph_objects", "go")
-
-    def _check_import(self, module: str, name: str) -> bool:
-        """Check if a module can be imported."""
+        self._has_bs4 = self._check_import("bs4")
+        self._has_lxml = self._check_import("lxml")
+        self._has_selectolax = self._check_import("selectolax")
+        self._has_plotly = self._check_import("plotly")
+
+        # Whether the index serves JSON Simple API (PEP 691/700) version lists
+        self._simple_json_api = True
+
+        # Memoized lookup results and lookups in flight, see _memoized()
+        self._memo: "OrderedDict[Tuple[Any, ...], Tuple[float, Any]]" = OrderedDict()
+        self._memo_inflight: Dict[Tuple[Any, ...], "asyncio.Task[Any]"] = {}
+
+    def _settle_memo(self, key: Tuple[Any, ...], task: "asyncio.Task[Any]") -> None:
+        """Move a finished lookup from the in-flight map into the memo."""
+        if self._memo_inflight.get(key) is task:
+            del self._memo_inflight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+
+        result = task.result()
+        ttl = self.config.cache_ttl
+        if isinstance(result, dict):
+            if "error" in result:
+                if result["error"].get("code") != ErrorCode.NOT_FOUND:
+                    return
+                ttl = min(ttl, NEGATIVE_CACHE_TTL)
+            elif result.get("exists") is False:
+                ttl = min(ttl, NEGATIVE_CACHE_TTL)
+        if ttl <= 0:
+            return
+
+        self._memo[key] = (time.monotonic() + ttl, copy.deepcopy(result))
+        self._memo.move_to_end(key)
+        while len(self._memo) > MEMO_MAX_ENTRIES:
+            self._memo.popitem(last=False)
+
+    def _check_import(self, module: str) -> bool:
+        """Check if a top-level package can be imported.
+
+        The package is only located, not imported; it is imported on first
+        use. Probing a submodule would import its parent package here.
+        """
         try:
-            __import__(module)
-            return True
+            if importlib.util.find_spec(module) is not None:
+                return True
         except ImportError:
-            logger.info(
-                f"Optional dependency {module} not found; some features will be limited"
-            )
-            return False
+            pass
+        logger.info(
+            f"Optional dependency {module} not found; some features will be limited"
+        )
+        return False
 
     def set_user_agent(self, user_agent: str) -> None:
         """Set a custom User-Agent for all subsequent requests.
@@ -94,6 +447,12 @@ class PyPIClient:
         """Close the client and release resources."""
         await self.http.close()
 
+    async def __aenter__(self) -> "PyPIClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
     async def get_package_info(self, package_name: str) -> PackageInfo:
         """Get detailed package information from PyPI."""
         try:
@@ -122,9 +481,9 @@ class PyPIClient:
                 # If we got JSON content, parse it
                 if "application/json" in content_type and isinstance(raw_data, str):
                     try:
-                        parsed_data = json.loads(raw_data)
+                        parsed_data = json_loads(raw_data)
                         return cast(PackageInfo, parsed_data)
-                    except json.JSONDecodeError as e:
+                    except JSONDecodeError as e:
                         logger.error(f"Error decoding JSON from raw_data: {e}")
                         return cast(
                             PackageInfo,
@@ -150,13 +509,57 @@ class PyPIClient:
             logger.exception(f"Unexpected error getting package info: {e}")
             return cast(PackageInfo, format_error(ErrorCode.UNKNOWN_ERROR, str(e)))
 
+    @_memoized
     async def get_latest_version(self, package_name: str) -> VersionInfo:
-        """Get the latest version of a package."""
+        """Get the latest version of a package.
+
+        Uses the JSON Simple API, which is much smaller than the /json
+        document for projects with many releases. Indexes without it (such as
+        some mirrors) are detected and served from /json instead.
+        """
         try:
             sanitized_name = sanitize_package_name(package_name)
-            url = f"https://pypi.org/pypi/{sanitized_name}/json"
 
-            data = await self.http.fetch(url)
+            if self._simple_json_api:
+                url = f"https://pypi.org/simple/{canonicalize_name(sanitized_name)}/"
+                data = await self.http.fetch(
+                    url, headers={"Accept": SIMPLE_JSON_ACCEPT}
+                )
+
+                # Check for error in result
+                if isinstance(data, dict) and "error" in data:
+                    return cast(VersionInfo, data)
+
+                if (
+                    isinstance(data, dict)
+                    and "raw_data" not in data
+                    and "versions" in data
+                ):
+                    version = _latest_simple_version(data)
+                    if version is None:
+                        return cast(
+                            VersionInfo,
+                            format_error(
+                                ErrorCode.NOT_FOUND,
+                                f"No releases found for {sanitized_name}",
+                            ),
+                        )
+                    return {"version": version}
+
+                if _is_pre_pep700_index_page(data):
+                    # The index ignored the Accept header or predates PEP 700
+                    logger.info(
+                        "Index does not serve JSON Simple API version lists; "
+                        "using the /json endpoint for latest versions"
+                    )
+                    self._simple_json_api = False
+                else:
+                    # Unexpected reply; use /json for this lookup only
+                    logger.debug(
+                        "Unexpected JSON Simple API response for %s", sanitized_name
+                    )
+
+            data = await self.http.fetch(f"https://pypi.org/pypi/{sanitized_name}/json")
 
             # Check for error in result
             if isinstance(data, dict) and "error" in data:
@@ -170,10 +573,10 @@ class PyPIClient:
                 # If we got JSON content, parse it
                 if "application/json" in content_type and isinstance(raw_data, str):
                     try:
-                        parsed_data = json.loads(raw_data)
+                        parsed_data = json_loads(raw_data)
                         version = parsed_data.get("info", {}).get("version", "")
                         return {"version": version}
-                    except json.JSONDecodeError as e:
+                    except JSONDecodeError as e:
                         logger.error(f"Error decoding JSON from raw_data: {e}")
                         return cast(
                             VersionInfo,
@@ -220,10 +623,10 @@ class PyPIClient:
                 # If we got JSON content, parse it
                 if "application/json" in content_type and isinstance(raw_data, str):
                     try:
-                        parsed_data = json.loads(raw_data)
+                        parsed_data = json_loads(raw_data)
                         releases = list(parsed_data.get("releases", {}).keys())
                         return {"releases": releases}
-                    except json.JSONDecodeError as e:
+                    except JSONDecodeError as e:
                         logger.error(f"Error decoding JSON from raw_data: {e}")
                         return cast(
                             ReleasesInfo,
@@ -271,9 +674,9 @@ class PyPIClient:
                 # If we got JSON content, parse it
                 if "application/json" in content_type and isinstance(raw_data, str):
                     try:
-                        parsed_data = json.loads(raw_data)
+                        parsed_data = json_loads(raw_data)
                         return {"urls": parsed_data["urls"]}
-                    except (json.JSONDecodeError, KeyError) as e:
+                    except (JSONDecodeError, KeyError) as e:
                         logger.error(f"Error processing JSON from raw_data: {e}")
                         return cast(
                             UrlsInfo,
@@ -330,13 +733,9 @@ class PyPIClient:
             sanitized_version = sanitize_version(version)
 
             # Clean tags according to PEP 491
-            wheel_parts = {
-                "name": sanitized_name,
-                "version": sanitized_version,
-                "python_tag": python_tag.replace(".", "_"),
-                "abi_tag": abi_tag.replace(".", "_"),
-                "platform_tag": platform_tag.replace(".", "_"),
-            }
+            python_tag = python_tag.replace(".", "_")
+            abi_tag = abi_tag.replace(".", "_")
+            platform_tag = platform_tag.replace(".", "_")
 
             # Add build tag if provided
             build_suffix = ""
@@ -344,10 +743,10 @@ class PyPIClient:
                 build_suffix = f"-{build_tag.replace('.', '_')}"
 
             # Format wheel filename
-            filename = f"{wheel_parts['name']}-{wheel_parts['version']}{build_suffix}-{wheel_parts['python_tag']}-{wheel_parts['abi_tag']}-{wheel_parts['platform_tag']}.whl"
+            filename = f"{sanitized_name}-{sanitized_version}{build_suffix}-{python_tag}-{abi_tag}-{platform_tag}.whl"
 
             first_letter = sanitized_name[0]
-            url = f"https://files.pythonhosted.org/packages/{wheel_parts['python_tag']}/{first_letter}/{sanitized_name}/{filename}"
+            url = f"https://files.pythonhosted.org/packages/{python_tag}/{first_letter}/{sanitized_name}/{filename}"
 
             return {"url": url}
         except ValueError as e:
@@ -356,254 +755,45 @@ class PyPIClient:
             logger.exception(f"Unexpected error generating wheel URL: {e}")
             return cast(UrlResult, format_error(ErrorCode.UNKNOWN_ERROR, str(e)))
 
-    async def get_newest_packages(self) -> PackagesFeed:
-        """Get the newest packages feed from PyPI."""
-        url = "https://pypi.org/rss/packages.xml"
-
-        try:
-            data = await self.http.fetch(url)
-
-            # Check for error in result
-            if isinstance(data, dict) and "error" in data:
-                return cast(PackagesFeed, data)
-
-            # Handle the new format where raw data might be returned
-            if isinstance(data, dict) and "raw_data" in data:
-                raw_data = data["raw_data"]
-                # Continue with XML parsing using raw_data
-                if isinstance(raw_data, bytes):
-                    data_str = raw_data.decode("utf-8")
-                elif isinstance(raw_data, str):
-                    data_str = raw_data
-                else:
-                    return {
-                        "packages": [],
-                        "error": {
-                            "code": ErrorCode.PARSE_ERROR,
-                            "message": f"Unexpected data type: {type(raw_data)}",
-                        },
-                    }
-            elif isinstance(data, (str, bytes)):
-                # Legacy format
-                if isinstance(data, bytes):
-                    data_str = data.decode("utf-8")
-                else:
-                    data_str = data
-            else:
-                return {
-                    "packages": [],
-                    "error": {
-                        "code": ErrorCode.PARSE_ERROR,
-                        "message": f"Unexpected data type: {type(data)}",
-                    },
-                }
-
-            # Parse the XML string
-            try:
-                root = ET.fromstring(data_str)
-
-                packages: List[FeedItem] = []
-                for item in root.findall(".//item"):
-                    title_elem = item.find("title")
-                    link_elem = item.find("link")
-                    desc_elem = item.find("description")
-                    date_elem = item.find("pubDate")
-
-                    if all(
-                        elem is not None
-                        for elem in (title_elem, link_elem, desc_elem, date_elem)
-                    ):
-                        packages.append(
-                            {
-                                "title": title_elem.text or "",
-                                "link": link_elem.text or "",
-                                "description": desc_elem.text or "",
-                                "published_date": date_elem.text or "",
-                            }
-                        )
-
-                return {"packages": packages}
-            except ET.ParseError as e:
-                logger.error(f"XML parse error: {e}")
-                return {
-                    "packages": [],
-                    "error": {
-                        "code": ErrorCode.PARSE_ERROR,
-                        "message": f"Invalid XML response: {e}",
-                    },
-                }
-        except Exception as e:
-            logger.exception(f"Error parsing newest packages feed: {e}")
-            return cast(PackagesFeed, format_error(ErrorCode.UNKNOWN_ERROR, str(e)))
-
-    async def get_latest_updates(self) -> UpdatesFeed:
-        """Get the latest updates feed from PyPI."""
-        url = "https://pypi.org/rss/updates.xml"
-
+    async def _fetch_feed(self, url: str, key: str) -> Dict[str, Any]:
+        """Fetch an RSS feed from PyPI and return its items under ``key``."""
         try:
             data = await self.http.fetch(url)
-
-            # Check for error in result
-            if isinstance(data, dict) and "error" in data:
-                return cast(UpdatesFeed, data)
-
-            # Handle the new format where raw data might be returned
-            if isinstance(data, dict) and "raw_data" in data:
-                raw_data = data["raw_data"]
-                # Continue with XML parsing using raw_data
-                if isinstance(raw_data, bytes):
-                    data_str = raw_data.decode("utf-8")
-                elif isinstance(raw_data, str):
-                    data_str = raw_data
-                else:
-                    return {
-                        "updates": [],
-                        "error": {
-                            "code": ErrorCode.PARSE_ERROR,
-                            "message": f"Unexpected data type: {type(raw_data)}",
-                        },
-                    }
-
-            elif isinstance(data, (str, bytes)):
-                # Legacy format
-                if isinstance(data, bytes):
-                    data_str = data.decode("utf-8")
-                else:
-                    data_str = data
-            else:
-                return {
-                    "updates": [],
-                    "error": {
-                        "code": ErrorCode.PARSE_ERROR,
-                        "message": f"Unexpected data type: {type(data)}",
-                    },
-                }
-
-            # Parse the XML string
-            try:
-                root = ET.fromstring(data_str)
-
-                updates: List[FeedItem] = []
-                for item in root.findall(".//item"):
-                    title_elem = item.find("title")
-                    link_elem = item.find("link")
-                    desc_elem = item.find("description")
-                    date_elem = item.find("pubDate")
-
-                    if all(
-                        elem is not None
-                        for elem in (title_elem, link_elem, desc_elem, date_elem)
-                    ):
-                        updates.append(
-                            {
-                                "title": title_elem.text or "",
-                                "link": link_elem.text or "",
-                                "description": desc_elem.text or "",
-                                "published_date": date_elem.text or "",
-                            }
-                        )
-
-                return {"updates": updates}
-            except ET.ParseError as e:
-                logger.error(f"XML parse error: {e}")
-                return {
-                    "updates": [],
-                    "error": {
-                        "code": ErrorCode.PARSE_ERROR,
-                        "message": f"Invalid XML response: {e}",
-                    },
-                }
+            return _parse_rss_feed(data, key)
         except Exception as e:
-            logger.exception(f"Error parsing latest updates feed: {e}")
+            logger.exception(f"Error parsing {key} feed from {url}: {e}")
             return {
-                "updates": [],
+                key: [],
                 "error": {"code": ErrorCode.UNKNOWN_ERROR, "message": str(e)},
             }
 
+    async def get_newest_packages(self) -> PackagesFeed:
+        """Get the newest packages feed from PyPI."""
+        return cast(
+            PackagesFeed,
+            await self._fetch_feed("https://pypi.org/rss/packages.xml", "packages"),
+        )
+
+    async def get_latest_updates(self) -> UpdatesFeed:
+        """Get the latest updates feed from PyPI."""
+        return cast(
+            UpdatesFeed,
+            await self._fetch_feed("https://pypi.org/rss/updates.xml", "updates"),
+        )
+
     async def get_project_releases(self, package_name: str) -> ReleasesFeed:
         """Get the releases feed for a project."""
         try:
             sanitized_name = sanitize_package_name(package_name)
-            url = f"https://pypi.org/rss/project/{sanitized_name}/releases.xml"
-
-            data = await self.http.fetch(url)
-
-            # Check for error in result
-            if isinstance(data, dict) and "error" in data:
-                return cast(ReleasesFeed, data)
-
-            # Handle the new format where raw data might be returned
-            if isinstance(data, dict) and "raw_data" in data:
-                raw_data = data["raw_data"]
-                # Continue with XML parsing using raw_data
-                if isinstance(raw_data, bytes):
-                    data_str = raw_data.decode("utf-8")
-                elif isinstance(raw_data, str):
-                    data_str = raw_data
-                else:
-                    return {
-                        "releases": [],
-                        "error": {
-                            "code": ErrorCode.PARSE_ERROR,
-                            "message": f"Unexpected data type: {type(raw_data)}",
-                        },
-                    }
-            elif isinstance(data, (str, bytes)):
-                # Legacy format
-                if isinstance(data, bytes):
-                    data_str = data.decode("utf-8")
-                else:
-                    data_str = data
-            else:
-                return {
-                    "releases": [],
-                    "error": {
-                        "code": ErrorCode.PARSE_ERROR,
-                        "message": f"Unexpected data type: {type(data)}",
-                    },
-                }
-
-            # Parse the XML string
-            try:
-                root = ET.fromstring(data_str)
-
-                releases: List[FeedItem] = []
-                for item in root.findall(".//item"):
-                    title_elem = item.find("title")
-                    link_elem = item.find("link")
-                    desc_elem = item.find("description")
-                    date_elem = item.find("pubDate")
-
-                    if all(
-                        elem is not None
-                        for elem in (title_elem, link_elem, desc_elem, date_elem)
-                    ):
-                        releases.append(
-                            {
-                                "title": title_elem.text or "",
-                                "link": link_elem.text or "",
-                                "description": desc_elem.text or "",
-                                "published_date": date_elem.text or "",
-                            }
-                        )
-
-                return {"releases": releases}
-            except ET.ParseError as e:
-                logger.error(f"XML parse error: {e}")
-                return {
-                    "releases": [],
-                    "error": {
-                        "code": ErrorCode.PARSE_ERROR,
-                        "message": f"Invalid XML response: {e}",
-                    },
-                }
-        except Exception as e:
-            logger.exception(f"Error parsing project releases feed: {e}")
+        except ValueError as e:
             return {
                 "releases": [],
                 "error": {"code": ErrorCode.UNKNOWN_ERROR, "message": str(e)},
             }
 
+        url = f"https://pypi.org/rss/project/{sanitized_name}/releases.xml"
+        return cast(ReleasesFeed, await self._fetch_feed(url, "releases"))
+
     async def search_packages(self, query: str, page: int = 1) -> SearchResult:
         """Search for packages on PyPI."""
         query_encoded = quote_plus(query)
@@ -659,14 +849,38 @@ class PyPIClient:
                     "results": [],
                 }
 
-            # Check if BeautifulSoup is available for better parsing
-            if self._has_bs4:
+            # Extract packages from search results, preferring selectolax's
+            # C parser over BeautifulSoup when both are installed
+            results = []
+            if self._has_selectolax:
+                from selectolax.lexbor import LexborHTMLParser
+
+                tree = LexborHTMLParser(html_content)
+                for node in tree.css(".package-snippet"):
+                    name_node = node.css_first(".package-snippet__name")
+                    version_node = node.css_first(".package-snippet__version")
+                    desc_node = node.css_first(".package-snippet__description")
+
+                    if name_node and version_node:
+                        name = name_node.text().strip()
+                        results.append(
+                            {
+                                "name": name,
+                                "version": version_node.text().strip(),
+                                "description": (
+                                    desc_node.text().strip() if desc_node else ""
+                                ),
+                                "url": f"https://pypi.org/project/{name}/",
+                            }
+                        )
+            elif self._has_bs4:
                 from bs4 import BeautifulSoup
 
-                soup = BeautifulSoup(html_content, "html.parser")
-                results = []
+                # lxml's C tree builder is much faster than the pure-Python one
+                soup = BeautifulSoup(
+                    html_content, "lxml" if self._has_lxml else "html.parser"
+                )
 
-                # Extract packages from search results
                 for package in soup.select(".package-snippet"):
                     name_elem = package.select_one(".package-snippet__name")
                     version_elem = package.select_one(".package-snippet__version")
@@ -686,11 +900,12 @@ class PyPIClient:
                             }
                         )
 
+            if self._has_selectolax or self._has_bs4:
                 # Check if we found any results
                 if results:
                     return {"search_url": url, "results": results}
                 else:
-                    # We have BeautifulSoup but couldn't find any packages
+                    # We have a parser but couldn't find any packages
                     # This could be a format change or we're not getting the expected HTML
                     return {
                         "search_url": url,
@@ -698,7 +913,7 @@ class PyPIClient:
                         "results": [],
                     }
 
-            # Fallback if BeautifulSoup is not available
+            # Fallback if no HTML parser is available
             return {
                 "search_url": url,
                 "message": "For better search results, install Beautiful Soup: pip install beautifulsoup4",
@@ -721,8 +936,8 @@ class PyPIClient:
             sanitized_v2 = sanitize_version(version2)
 
             # Use packaging.version for reliable comparison
-            v1 = Version(sanitized_v1)
-            v2 = Version(sanitized_v2)
+            v1 = _parse_version(sanitized_v1)
+            v2 = _parse_version(sanitized_v2)
 
             return {
                 "version1": sanitized_v1,
@@ -741,6 +956,7 @@ class PyPIClient:
                 VersionComparisonResult, format_error(ErrorCode.UNKNOWN_ERROR, str(e))
             )
 
+    @_memoized
     async def get_dependencies(
         self, package_name: str, version: Optional[str] = None
     ) -> DependenciesResult:
@@ -768,9 +984,9 @@ class PyPIClient:
                 # If we got JSON content, parse it
                 if "application/json" in content_type and isinstance(raw_data, str):
                     try:
-                        parsed_data = json.loads(raw_data)
+                        parsed_data = json_loads(raw_data)
                         parsed_result = parsed_data
-                    except json.JSONDecodeError as e:
+                    except JSONDecodeError as e:
                         logger.error(f"Error decoding JSON from raw_data: {e}")
                         return cast(
                             DependenciesResult,
@@ -797,7 +1013,7 @@ class PyPIClient:
             # Parse using packaging.requirements for better accuracy
             for req_str in requires_dist:
                 try:
-                    req = Requirement(req_str)
+                    req = _parse_requirement(req_str)
                     dep = {
                         "name": req.name,
                         "version_spec": str(req.specifier) if req.specifier else "",
@@ -835,13 +1051,40 @@ class PyPIClient:
                 DependenciesResult, format_error(ErrorCode.UNKNOWN_ERROR, str(e))
             )
 
+    async def get_dependencies_many(
+        self, package_names: List[str]
+    ) -> Dict[str, DependenciesResult]:
+        """Get the dependencies for several packages concurrently.
+
+        At most ``config.max_concurrency`` lookups are in flight at a time, all
+        sharing the pooled HTTP session.
+
+        Args:
+            package_names: The packages to look up
+
+        Returns:
+            A mapping of package name to its get_dependencies() result
+        """
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+        names = list(dict.fromkeys(package_names))
+
+        async def lookup(name: str) -> DependenciesResult:
+            async with semaphore:
+                return await self.get_dependencies(name)
+
+        results = await asyncio.gather(*(lookup(name) for name in names))
+        return dict(zip(names, results))
+
+    @_memoized
     async def check_package_exists(self, package_name: str) -> ExistsResult:
         """Check if a package exists on PyPI."""
         try:
             sanitized_name = sanitize_package_name(package_name)
-            url = f"https://pypi.org/pypi/{sanitized_name}/json"
+            url = f"https://pypi.org/simple/{canonicalize_name(sanitized_name)}/"
 
-            result = await self.http.fetch(url)
+            result = await self.http.fetch(
+                url, headers={"Accept": SIMPLE_JSON_ACCEPT}
+            )
 
             # Check for error in result
             if isinstance(result, dict) and "error" in result:
@@ -888,9 +1131,9 @@ class PyPIClient:
                 # If we got JSON content, parse it
                 if "application/json" in content_type and isinstance(raw_data, str):
                     try:
-                        parsed_data = json.loads(raw_data)
+                        parsed_data = json_loads(raw_data)
                         info = parsed_data.get("info", {})
-                    except json.JSONDecodeError as e:
+                    except JSONDecodeError as e:
                         logger.error(f"Error decoding JSON from raw_data: {e}")
                         return cast(
                             MetadataResult,
@@ -911,6 +1154,7 @@ class PyPIClient:
                 # Already parsed JSON data
                 info = result.get("info", {})
 
+            keywords = info.get("keywords")
             metadata: PackageMetadata = {
                 "name": info.get("name", ""),
                 "version": info.get("version", ""),
@@ -923,9 +1167,7 @@ class PyPIClient:
                 "homepage": info.get("home_page", ""),
                 "requires_python": info.get("requires_python", ""),
                 "classifiers": info.get("classifiers", []),
-                "keywords": (
-                    info.get("keywords", "").split(",") if info.get("keywords") else []
-                ),
+                "keywords": _split_keywords(keywords),
             }
 
             return {"metadata": metadata}
@@ -943,8 +1185,12 @@ class PyPIClient:
             sanitized_name = sanitize_package_name(package_name)
             sanitized_version = sanitize_version(version) if version else None
 
-            # Check if package exists first
-            exists_result = await self.check_package_exists(sanitized_name)
+            # Check the package exists while the stats service fetches the real
+            # download stats, rather than paying for the two round-trips in turn
+            exists_result, stats_result = await asyncio.gather(
+                self.check_package_exists(sanitized_name),
+                self.stats.get_package_stats(sanitized_name, sanitized_version),
+            )
             if isinstance(exists_result, dict) and "error" in exists_result:
                 return cast(StatsResult, exists_result)
 
@@ -956,8 +1202,7 @@ class PyPIClient:
                     ),
                 )
 
-            # Use the stats service to get real download stats
-            return await self.stats.get_package_stats(sanitized_name, sanitized_version)
+            return stats_result
 
         except ValueError as e:
             return cast(StatsResult, format_error(ErrorCode.INVALID_INPUT, str(e)))
@@ -985,10 +1230,78 @@ class PyPIClient:
             visited: Dict[str, Optional[str]] = {}
             flat_list: List[str] = []
 
-            # Build dependency tree iteratively
+            # Every lookup starts as soon as the lookup it depends on finishes
+            # (a package's dependencies once its version is known, and a
+            # dependency's version once its parent's dependencies are known),
+            # so independent branches never wait on each other. Each lookup
+            # runs once, bounded by a semaphore.
+            semaphore = asyncio.Semaphore(self.config.max_concurrency)
+            deps_tasks: Dict[str, "asyncio.Task[DependenciesResult]"] = {}
+            version_tasks: Dict[str, "asyncio.Task[Optional[str]]"] = {}
+            expanded_at: Dict[str, int] = {}
+
+            async def fetch_dependencies(
+                pkg_name: str, pkg_version: Optional[str]
+            ) -> DependenciesResult:
+                async with semaphore:
+                    return await self.get_dependencies(pkg_name, pkg_version)
+
+            async def fetch_latest_version(dep_name: str) -> Optional[str]:
+                async with semaphore:
+                    dep_version_info = await self.get_latest_version(dep_name)
+                return (
+                    dep_version_info.get("version")
+                    if "error" not in dep_version_info
+                    else None
+                )
+
+            def dependencies_of(
+                pkg_name: str, pkg_version: Optional[str]
+            ) -> "asyncio.Task[DependenciesResult]":
+                pkg_key = f"{pkg_name}:{pkg_version}"
+                if pkg_key not in deps_tasks:
+                    deps_tasks[pkg_key] = asyncio.ensure_future(
+                        fetch_dependencies(pkg_name, pkg_version)
+                    )
+                return deps_tasks[pkg_key]
+
+            def latest_version_of(dep_name: str) -> "asyncio.Task[Optional[str]]":
+                if dep_name not in version_tasks:
+                    version_tasks[dep_name] = asyncio.ensure_future(
+                        fetch_latest_version(dep_name)
+                    )
+                return version_tasks[dep_name]
+
+            async def expand(
+                pkg_name: str, pkg_version: Optional[str], level: int
+            ) -> None:
+                # The tree below expands a package found at its shallowest
+                # level, so only look deeper when this path is shallower
+                pkg_key = f"{pkg_name}:{pkg_version}"
+                if level >= depth or expanded_at.get(pkg_key, depth) <= level:
+                    return
+                expanded_at[pkg_key] = level
+
+                deps_result = await dependencies_of(pkg_name, pkg_version)
+                if "error" in deps_result:
+                    return
+                await asyncio.gather(
+                    *(
+                        expand_dependency(dep["name"], level + 1)
+                        for dep in deps_result.get("dependencies", [])
+                    )
+                )
+
+            async def expand_dependency(dep_name: str, level: int) -> None:
+                await expand(dep_name, await latest_version_of(dep_name), level)
+
+            # Build dependency tree iteratively, level by level (breadth-first),
+            # from the prefetched lookups
             async def build_tree() -> TreeNode:
-                queue: List[Tuple[str, Optional[str], int, Optional[str]]] = [
-                    (sanitized_name, sanitized_version, 0, None)
+                await expand(sanitized_name, sanitized_version, 0)
+
+                current_level: List[Tuple[str, Optional[str], Optional[str]]] = [
+                    (sanitized_name, sanitized_version, None)
                 ]
                 nodes: Dict[str, TreeNode] = {}
 
@@ -1000,104 +1313,126 @@ class PyPIClient:
                 }
                 nodes[f"{sanitized_name}:{sanitized_version}"] = root
 
-                while queue:
-                    pkg_name, pkg_version, level, parent_key = queue.pop(0)
-
-                    # Skip if too deep
-                    if level > depth:
-                        continue
-
-                    # Generate a unique key for this package+version
-                    pkg_key = f"{pkg_name}:{pkg_version}"
-
-                    # Check for cycles
-                    if pkg_key in visited:
-                        if parent_key:
-                            parent = nodes.get(parent_key)
-                            if parent:
-                                node: TreeNode = {
-                                    "name": pkg_name,
-                                    "version": pkg_version,
-                                    "dependencies": [],
-                                    "cycle": True,
-                                }
-                                parent["dependencies"].append(node)
-                        continue
+                level = 0
+                while current_level and level <= depth:
+                    next_level: List[Tuple[str, Optional[str], Optional[str]]] = []
+                    for pkg_name, pkg_version, parent_key in current_level:
+                        # Generate a unique key for this package+version
+                        pkg_key = f"{pkg_name}:{pkg_version}"
+
+                        # Check for cycles
+                        if pkg_key in visited:
+                            if parent_key:
+                                parent = nodes.get(parent_key)
+                                if parent:
+                                    node: TreeNode = {
+                                        "name": pkg_name,
+                                        "version": pkg_version,
+                                        "dependencies": [],
+                                        "cycle": True,
+                                    }
+                                    parent["dependencies"].append(node)
+                            continue
 
-                    # Mark as visited
-                    visited[pkg_key] = pkg_version
+                        # Mark as visited
+                        visited[pkg_key] = pkg_version
 
-                    # Add to flat list
-                    display_version = f" ({pkg_version})" if pkg_version else ""
-                    flat_list.append(f"{pkg_name}{display_version}")
+                        # Add to flat list
+                        display_version = f" ({pkg_version})" if pkg_version else ""
+                        flat_list.append(f"{pkg_name}{display_version}")
 
-                    # Create node if not exists
-                    if pkg_key not in nodes:
-                        nodes[pkg_key] = {
-                            "name": pkg_name,
-                            "version": pkg_version,
-                            "dependencies": [],
-                        }
+                        # Create node if not exists
+                        if pkg_key not in nodes:
+                            nodes[pkg_key] = {
+                                "name": pkg_name,
+                                "version": pkg_version,
+                                "dependencies": [],
+                            }
 
-                    # Connect to parent
-                    if parent_key and parent_key in nodes:
-                        parent = nodes[parent_key]
-                        if nodes[pkg_key] not in parent["dependencies"]:
-                            parent["dependencies"].append(nodes[pkg_key])
+                        # Connect to parent; a package is only reached here on
+                        # its first visit, so it cannot already be linked
+                        if parent_key and parent_key in nodes:
+                            nodes[parent_key]["dependencies"].append(nodes[pkg_key])
 
-                    # Get dependencies if not at max depth
-                    if level < depth:
-                        deps_result = await self.get_dependencies(pkg_name, pkg_version)
+                        # Queue dependencies if not at max depth
+                        if level < depth:
+                            deps_result = await dependencies_of(pkg_name, pkg_version)
 
-                        if isinstance(deps_result, dict) and "error" in deps_result:
-                            # Skip this dependency if there was an error
-                            continue
+                            if isinstance(deps_result, dict) and "error" in deps_result:
+                                # Skip this dependency if there was an error
+                                continue
 
-                        if "dependencies" in deps_result:
-                            for dep in deps_result["dependencies"]:
-                                # Extract the package name without version specifiers
+                            for dep in deps_result.get("dependencies", []):
                                 dep_name = dep["name"]
-
-                                # Get the version for this dependency
-                                dep_version_info = await self.get_latest_version(
-                                    dep_name
-                                )
-                                dep_version = (
-                                    dep_version_info.get("version")
-                                    if "error" not in dep_version_info
-                                    else None
+                                next_level.append(
+                                    (
+                                        dep_name,
+                                        await latest_version_of(dep_name),
+                                        pkg_key,
+                                    )
                                 )
 
-                                # Add to queue
-                                queue.append(
-                                    (dep_name, dep_version, level + 1, pkg_key)
-                                )
+                    current_level = next_level
+                    level += 1
 
                 return root
 
             # Build the tree
             tree = await build_tree()
 
-            # Generate visualization if Plotly is available
+            # Generate visualization if Plotly is available and the tree is
+            # small enough to be readable
             visualization_url = None
-            if self._has_plotly:
+            if self._has_plotly and len(flat_list) > MAX_VISUALIZED_PACKAGES:
+                logger.info(
+                    f"Skipping visualization for {sanitized_name}: "
+                    f"{len(flat_list)} packages exceeds {MAX_VISUALIZED_PACKAGES}"
+                )
+            elif self._has_plotly:
                 try:
-                    import plotly.graph_objects as go
                     import plotly.io as pio
 
-                    # Create a simple tree visualization
-                    labels = [f"{node.split(' ')[0]}" for node in flat_list]
-                    parents = [""] + ["Root"] * (len(flat_list) - 1)
-
-                    fig = go.Figure(
-                        go.Treemap(
-                            labels=labels, parents=parents, root_color="lightgrey"
+                    # Treemap of the real parent/child edges; cycle markers
+                    # repeat a node already in the tree, so they are left out
+                    ids: List[str] = []
+                    labels: List[str] = []
+                    parents: List[str] = []
+                    stack: List[Tuple[TreeNode, str]] = [(tree, "")]
+                    while stack:
+                        node, parent_id = stack.pop()
+                        if node.get("cycle"):
+                            continue
+                        node_id = f"{node['name']}:{node['version']}"
+                        ids.append(node_id)
+                        labels.append(node["name"])
+                        parents.append(parent_id)
+                        stack.extend(
+                            (child, node_id)
+                            for child in reversed(node["dependencies"])
                         )
-                    )
 
-                    fig.update_layout(
-                        title=f"Dependency Tree for {sanitized_name} {sanitized_version}",
-                        margin=dict(t=50, l=25, r=25, b=25),
+                    # A plain figure dict skips building graph_objects
+                    fig = {
+                        "data": [
+                            {
+                                "type": "treemap",
+                                "ids": ids,
+                                "labels": labels,
+                                "parents": parents,
+                                "root": {"color": "lightgrey"},
+                            }
+                        ],
+                        "layout": {
+                            "title": {
+                                "text": f"Dependency Tree for {sanitized_name} {sanitized_version}"
+                            },
+                            "margin": {"t": 50, "l": 25, "r": 25, "b": 25},
+                        },
+                    }
+
+                    # Load plotly.js from the CDN rather than embedding ~3MB
+                    html = pio.to_html(
+                        fig, include_plotlyjs="cdn", full_html=True, validate=False
                     )
 
                     # Save to temp file
@@ -1105,7 +1440,7 @@ class PyPIClient:
                         self.config.cache_dir,
                         f"deptree_{sanitized_name}_{sanitized_version}.html",
                     )
-                    pio.write_html(fig, viz_file)
+                    await asyncio.to_thread(_write_text_atomic, viz_file, html)
                     visualization_url = f"file://{viz_file}"
                 except Exception as e:
                     logger.warning(f"Failed to generate visualization: {e}")
@@ -1152,10 +1487,7 @@ class PyPIClient:
                 if not key or not url:
                     continue
 
-                if any(
-                    term in key.lower()
-                    for term in ["doc", "documentation", "docs", "readthedocs", "rtd"]
-                ):
+                if _DOCS_KEY_RE.search(key):
                     docs_url = url
                     break
 
@@ -1225,10 +1557,9 @@ class PyPIClient:
     async def _check_requirements_txt(self, path: Path) -> PackageRequirementsResult:
         """Check a requirements.txt file for outdated packages."""
         try:
-            # Read file
+            # Read file (in a worker thread, to keep the event loop free)
             try:
-                with path.open("r") as f:
-                    requirements = f.readlines()
+                requirements = (await asyncio.to_thread(path.read_text)).splitlines()
             except PermissionError:
                 return cast(
                     PackageRequirementsResult,
@@ -1243,9 +1574,9 @@ class PyPIClient:
                     format_error(ErrorCode.FILE_ERROR, f"Error reading file: {str(e)}"),
                 )
 
-            outdated: List[PackageRequirement] = []
-            up_to_date: List[PackageRequirement] = []
-
+            # Lines are independent, so they are checked concurrently (bounded)
+            # and the results are collected in file order
+            req_lines: List[str] = []
             for req_line in requirements:
                 req_line = req_line.strip()
                 if not req_line or req_line.startswith("#"):
@@ -1254,157 +1585,30 @@ class PyPIClient:
                 # Remove inline comments before parsing
                 if "#" in req_line:
                     req_line = req_line.split("#", 1)[0].strip()
+                req_lines.append(req_line)
 
-                # Parse requirement
-                try:
-                    # Use packaging.requirements for accurate parsing
-                    req = Requirement(req_line)
-                    pkg_name = req.name
-
-                    # Get latest version
-                    latest_version_info = await self.get_latest_version(pkg_name)
-
-                    if "error" in latest_version_info:
-                        # Skip packages we can't find
-                        continue
-
-                    latest_version = latest_version_info["version"]
-
-                    # Compare versions
-                    latest_ver = Version(latest_version)
-
-                    # Check if up to date
-                    is_outdated = False
-                    current_version = None
-                    security_recommendation = None
-
-                    if req.specifier:
-                        # Extract the version from the specifier
-                        for spec in req.specifier:  # type: ignore[assignment]
-                            if spec.operator in ("==", "==="):
-                                current_version = str(spec.version)
-                                req_ver = Version(current_version)
-                                is_outdated = latest_ver > req_ver
-                            elif spec.operator == ">=":
-                                # For >= constraints, check if minimum version has vulnerabilities
-                                min_version = str(spec.version)
-                                current_version = f"{spec.operator}{spec.version}"
-
-                                # Check vulnerabilities for minimum allowed version
-                                vuln_check = await self.check_vulnerabilities(
-                                    pkg_name, min_version
-                                )
-
-                                if vuln_check.get("vulnerable", False):
-                                    # Find the earliest safe version
-                                    safe_version = (
-                                        await self._find_earliest_safe_version(
-                                            pkg_name, min_version, latest_version
-                                        )
-                                    )
+            semaphore = asyncio.Semaphore(self.config.max_concurrency)
 
-                                    if safe_version and safe_version != min_version:
-                                        is_outdated = True
-                                        security_recommendation = (
-                                            f"Security: Update constraint to >={safe_version} "
-                                            f"(current allows vulnerable {min_version})"
-                                        )
-                            else:
-                                # For other operators (>, <=, <, ~=), still capture the constraint
-                                # but don't mark as outdated
-                                if (
-                                    not current_version
-                                ):  # Only take the first constraint if multiple
-                                    current_version = f"{spec.operator}{spec.version}"
-
-                    # If no version info could be determined, set to latest
-                    if not current_version:
-                        current_version = "unspecified (latest)"
-
-                    pkg_info = {
-                        "package": pkg_name,
-                        "current_version": current_version,
-                        "latest_version": latest_version,
-                        "constraint": str(req.specifier),
-                    }
-
-                    if security_recommendation:
-                        pkg_info["recommendation"] = security_recommendation
-
-                    if is_outdated:
-                        outdated.append(pkg_info)
-                    else:
-                        up_to_date.append(pkg_info)
-                except Exception as e:
-                    logger.warning(f"Error parsing requirement '{req_line}': {e}")
-                    # Try a simple extraction for unparseable requirements
-                    try:
-                        # Extract package name using regex
-                        import re
-
-                        match = re.match(
-                            r"^([a-zA-Z0-9_.-]+)(?:[<>=~!]=?|@)(.+)?", req_line
-                        )
-
-                        if match:
-                            pkg_name = match.group(1)
-                            version_spec = (
-                                match.group(2).strip() if match.group(2) else None
-                            )
-
-                            # Get latest version
-                            latest_version_info = await self.get_latest_version(
-                                pkg_name
-                            )
-
-                            if "error" not in latest_version_info:
-                                latest_version = latest_version_info["version"]
-
-                                if version_spec:
-                                    # Add as potentially outdated
-                                    outdated.append(
-                                        {
-                                            "package": pkg_name,
-                                            "current_version": version_spec,
-                                            "latest_version": latest_version,
-                                            "constraint": version_spec,
-                                        }
-                                    )
-                                else:
-                                    # No specific version required
-                                    up_to_date.append(
-                                        {
-                                            "package": pkg_name,
-                                            "current_version": "unspecified (latest)",
-                                            "latest_version": latest_version,
-                                            "constraint": "",
-                                        }
-                                    )
-                        else:
-                            # Raw package name without version specifier
-                            pkg_name = req_line
+            async def check_line(
+                req_line: str,
+            ) -> Optional[Tuple[bool, PackageRequirement]]:
+                async with semaphore:
+                    return await self._check_requirement_line(req_line)
 
-                            # Get latest version
-                            latest_version_info = await self.get_latest_version(
-                                pkg_name
-                            )
+            checked = await asyncio.gather(*(check_line(line) for line in req_lines))
 
-                            if "error" not in latest_version_info:
-                                latest_version = latest_version_info["version"]
-                                up_to_date.append(
-                                    {
-                                        "package": pkg_name,
-                                        "current_version": "unspecified (latest)",
-                                        "latest_version": latest_version,
-                                        "constraint": "",
-                                    }
-                                )
-                    except Exception:
-                        # Skip lines we can't parse at all
-                        continue
+            outdated: List[PackageRequirement] = []
+            up_to_date: List[PackageRequirement] = []
+            for entry in checked:
+                if entry is None:
+                    continue
+                is_outdated, pkg_info = entry
+                if is_outdated:
+                    outdated.append(pkg_info)
+                else:
+                    up_to_date.append(pkg_info)
 
             # Check if other dependency files exist in the same directory
-            from pathlib import Path
             req_path = Path(str(path))
             project_dir = req_path.parent
             
@@ -1452,6 +1656,133 @@ class PyPIClient:
                 ),
             )
 
+    async def _check_requirement_line(
+        self, req_line: str
+    ) -> Optional[Tuple[bool, PackageRequirement]]:
+        """Check a single requirements.txt line against PyPI.
+
+        Args:
+            req_line: The requirement, stripped of comments and whitespace
+
+        Returns:
+            An (is_outdated, package info) pair, or None if the line is skipped
+        """
+        # Parse requirement
+        try:
+            # Use packaging.requirements for accurate parsing
+            req = _parse_requirement(req_line)
+            pkg_name = req.name
+
+            # Get latest version
+            latest_version_info = await self.get_latest_version(pkg_name)
+
+            if "error" in latest_version_info:
+                # Skip packages we can't find
+                return None
+
+            latest_version = latest_version_info["version"]
+
+            # Compare versions
+            latest_ver = _parse_version(latest_version)
+
+            # Check if up to date
+            is_outdated = False
+            current_version = None
+            security_recommendation = None
+
+            if req.specifier:
+                # Extract the version from the specifier
+                for spec in req.specifier:  # type: ignore[assignment]
+                    if spec.operator in ("==", "==="):
+                        current_version = str(spec.version)
+                        req_ver = _parse_version(current_version)
+                        is_outdated = latest_ver > req_ver
+                    elif spec.operator == ">=":
+                        # For >= constraints, check if minimum version has vulnerabilities
+                        min_version = str(spec.version)
+                        current_version = f"{spec.operator}{spec.version}"
+
+                        # Check vulnerabilities for minimum allowed version
+                        vuln_check = await self.check_vulnerabilities(
+                            pkg_name, min_version
+                        )
+
+                        if vuln_check.get("vulnerable", False):
+                            # Find the earliest safe version
+                            safe_version = await self._find_earliest_safe_version(
+                                pkg_name, min_version, latest_version
+                            )
+
+                            if safe_version and safe_version != min_version:
+                                is_outdated = True
+                                security_recommendation = (
+                                    f"Security: Update constraint to >={safe_version} "
+                                    f"(current allows vulnerable {min_version})"
+                                )
+                    else:
+                        # For other operators (>, <=, <, ~=), still capture the constraint
+                        # but don't mark as outdated
+                        if (
+                            not current_version
+                        ):  # Only take the first constraint if multiple
+                            current_version = f"{spec.operator}{spec.version}"
+
+            # If no version info could be determined, set to latest
+            if not current_version:
+                current_version = "unspecified (latest)"
+
+            pkg_info = {
+                "package": pkg_name,
+                "current_version": current_version,
+                "latest_version": latest_version,
+                "constraint": str(req.specifier),
+            }
+
+            if security_recommendation:
+                pkg_info["recommendation"] = security_recommendation
+
+            return is_outdated, cast(PackageRequirement, pkg_info)
+        except Exception as e:
+            logger.warning(f"Error parsing requirement '{req_line}': {e}")
+
+        # Try a simple extraction for unparseable requirements
+        try:
+            match = _REQUIREMENT_FALLBACK_RE.match(req_line)
+
+            if match:
+                pkg_name = match.group(1)
+                version_spec = match.group(2).strip() if match.group(2) else None
+            else:
+                # Raw package name without version specifier
+                pkg_name = req_line
+                version_spec = None
+
+            # Get latest version
+            latest_version_info = await self.get_latest_version(pkg_name)
+            if "error" in latest_version_info:
+                return None
+
+            latest_version = latest_version_info["version"]
+            if version_spec:
+                # Add as potentially outdated
+                return True, {
+                    "package": pkg_name,
+                    "current_version": version_spec,
+                    "latest_version": latest_version,
+                    "constraint": version_spec,
+                }
+
+            # No specific version required
+            return False, {
+                "package": pkg_name,
+                "current_version": "unspecified (latest)",
+                "latest_version": latest_version,
+                "constraint": "",
+            }
+        except Exception:
+            # Skip lines we can't parse at all
+            return None
+
     def _extract_dependencies_from_pyproject(
         self, pyproject_data: Dict[str, Any]
     ) -> List[str]:
@@ -1503,41 +1834,13 @@ class PyPIClient:
 
         return dependencies
 
-    def _load_toml_module(self):
-        """Load the appropriate TOML parsing module.
-
-        Returns:
-            The tomllib or tomli module, or None if not available
-        """
-        try:
-            import tomllib
-
-            return tomllib
-        except ImportError:
-            try:
-                import tomli as tomllib  # type: ignore[import-not-found]
-
-                return tomllib
-            except ImportError:
-                return None
-
     async def _check_pyproject_toml(self, path: Path) -> PackageRequirementsResult:
         """Check a pyproject.toml file for outdated packages."""
-        # Load TOML module
-        tomllib = self._load_toml_module()
-        if not tomllib:
-            return cast(
-                PackageRequirementsResult,
-                format_error(
-                    ErrorCode.MISSING_DEPENDENCY,
-                    "Parsing pyproject.toml requires tomli package. Please install with: pip install tomli",
-                ),
-            )
-
-        # Read and parse the TOML file
+        # Read and parse the TOML file (reading in a worker thread, to keep the
+        # event loop free)
         try:
-            with path.open("rb") as f:
-                pyproject_data = tomllib.load(f)
+            content = await asyncio.to_thread(path.read_bytes)
+            pyproject_data = tomllib.loads(content.decode("utf-8"))
         except PermissionError:
             return cast(
                 PackageRequirementsResult,
@@ -1557,17 +1860,41 @@ class PyPIClient:
         # Extract dependencies using helper method
         dependencies = self._extract_dependencies_from_pyproject(pyproject_data)
 
+        # Look up the latest version of every dependency concurrently
+        package_names: List[str] = []
+        for req_str in dependencies:
+            try:
+                req = _parse_requirement(req_str)
+                package_names.append(sanitize_package_name(req.name))
+            except Exception:
+                # Reported when the dependency is processed below
+                continue
+        package_names = list(dict.fromkeys(package_names))
+
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+        async def lookup(name: str) -> VersionInfo:
+            async with semaphore:
+                return await self.get_latest_version(name)
+
+        latest_versions = dict(
+            zip(
+                package_names,
+                await asyncio.gather(*(lookup(name) for name in package_names)),
+            )
+        )
+
         # Process dependencies
         outdated = []
         up_to_date = []
 
         for req_str in dependencies:
             try:
-                req = Requirement(req_str)
+                req = _parse_requirement(req_str)
                 package_name = sanitize_package_name(req.name)
 
                 # Get package info from PyPI
-                info_result = await self.get_latest_version(package_name)
+                info_result = latest_versions[package_name]
 
                 # Check if we got a valid result
                 if "error" in info_result:
@@ -1594,8 +1921,8 @@ class PyPIClient:
 
                             # Check if outdated
                             try:
-                                current_ver = Version(current_version)
-                                latest_ver = Version(latest_version)
+                                current_ver = _parse_version(current_version)
+                                latest_ver = _parse_version(latest_version)
                                 is_outdated = latest_ver > current_ver
                             except Exception as e:
                                 logger.warning(
@@ -1632,7 +1959,6 @@ class PyPIClient:
                 continue
 
         # Check if other dependency files exist in the same directory
-        from pathlib import Path
         toml_path = Path(str(path))
         project_dir = toml_path.parent
         
@@ -1753,7 +2079,7 @@ class PyPIClient:
                 osv_url,
                 method="POST",
                 headers={"Content-Type": "application/json"},
-                data=json.dumps(payload).encode(),
+                data=json_dumps_bytes(payload),
             )
 
             # Check for errors in response
@@ -1828,7 +2154,7 @@ class PyPIClient:
                 # If a specific version was requested, only include if it's affected
                 if version:
                     # Check if this version is affected
-                    version_obj = Version(version)
+                    version_obj = _parse_version(version)
                     is_affected = False
 
                     for affected in vuln.get("affected", []):
@@ -1845,7 +2171,7 @@ class PyPIClient:
                                     for event in events:
                                         if "introduced" in event:
                                             try:
-                                                introduced = Version(
+                                                introduced = _parse_version(
                                                     event["introduced"]
                                                 )
                                             except:
@@ -1853,7 +2179,7 @@ class PyPIClient:
                                                 continue
                                         if "fixed" in event:
                                             try:
-                                                fixed = Version(event["fixed"])
+                                                fixed = _parse_version(event["fixed"])
                                             except:
                                                 # Skip non-version strings (like git hashes)
                                                 continue
@@ -2002,8 +2328,8 @@ class PyPIClient:
                 # So we'll recommend a reasonable minimum based on the vulnerable version
 
                 try:
-                    min_ver = Version(min_version)
-                    max_ver = Version(max_version)
+                    min_ver = _parse_version(min_version)
+                    max_ver = _parse_version(max_version)
 
                     # If major version changed, recommend at least the new major version
                     if max_ver.major > min_ver.major:
@@ -2038,85 +2364,40 @@ class PyPIClient:
             if isinstance(response, dict) and "error" in response:
                 return {"updates": [], "error": response["error"]}
 
-            # If we have defusedxml, use it for secure parsing
-            try:
-                import defusedxml.ElementTree as ET
-
-                # Extract raw XML data from response
-                if isinstance(response, dict) and "raw_data" in response:
-                    xml_data = response["raw_data"]
-
-                    # Parse the XML
-                    if isinstance(xml_data, bytes):
-                        root = ET.fromstring(xml_data)
-                    elif isinstance(xml_data, str):
-                        root = ET.fromstring(xml_data.encode("utf-8"))
-                    else:
-                        return {
-                            "updates": [],
-                            "error": {
-                                "message": "Unexpected response format from RSS feed",
-                                "code": "parse_error",
-                            },
-                        }
-
-                    # Parse RSS items
-                    updates = []
-
-                    # RSS 2.0 format
-                    for item in root.findall(".//item"):
-                        title_elem = item.find("title")
-                        link_elem = item.find("link")
-                        desc_elem = item.find("description")
-                        pub_date_elem = item.find("pubDate")
-
-                        if title_elem is not None and title_elem.text:
-                            # Extract package name and version from title
-                            # Format is usually "package-name 1.2.3"
-                            title = title_elem.text.strip()
-                            parts = title.rsplit(" ", 1)
-
-                            package_name = parts[0] if parts else title
-                            version = parts[1] if len(parts) > 1 else ""
-
-                            updates.append(
-                                {
-                                    "package_name": package_name,
-                                    "version": version,
-                                    "title": title,
-                                    "link": (
-                                        link_elem.text if link_elem is not None else ""
-                                    ),
-                                    "description": (
-                                        desc_elem.text if desc_elem is not None else ""
-                                    ),
-                                    "published_date": (
-                                        pub_date_elem.text
-                                        if pub_date_elem is not None
-                                        else ""
-                                    ),
-                                }
-                            )
-
-                    return {"updates": updates}
-                else:
-                    return {
-                        "updates": [],
-                        "error": {
-                            "message": "Invalid response format from RSS feed",
-                            "code": "parse_error",
-                        },
-                    }
-
-            except ImportError:
+            source = _rss_source(response)
+            if source is None:
                 return {
                     "updates": [],
                     "error": {
-                        "message": "RSS parsing requires defusedxml for security (install with: pip install defusedxml)",
-                        "code": "missing_dependency",
+                        "message": "Invalid response format from RSS feed",
+                        "code": "parse_error",
                     },
                 }
 
+            updates = []
+            for title, link, description, published_date in _iter_rss_items(source):
+                if title:
+                    # Extract package name and version from title
+                    # Format is usually "package-name 1.2.3"
+                    title = title.strip()
+                    parts = title.rsplit(" ", 1)
+
+                    package_name = parts[0] if parts else title
+                    version = parts[1] if len(parts) > 1 else ""
+
+                    updates.append(
+                        {
+                            "package_name": package_name,
+                            "version": version,
+                            "title": title,
+                            "link": link or "",
+                            "description": description or "",
+                            "published_date": published_date or "",
+                        }
+                    )
+
+            return {"updates": updates}
+
         except Exception as e:
             logger.exception(f"Error getting updates feed: {e}")
             return {"updates": [], "error": {"message": str(e), "code": "feed_error"}}
@@ -2138,75 +2419,30 @@ class PyPIClient:
             if isinstance(response, dict) and "error" in response:
                 return {"packages": [], "error": response["error"]}
 
-            # Parse RSS/XML
-            try:
-                import defusedxml.ElementTree as ET
-
-                # Extract raw XML data from response
-                if isinstance(response, dict) and "raw_data" in response:
-                    xml_data = response["raw_data"]
-
-                    # Parse the XML
-                    if isinstance(xml_data, bytes):
-                        root = ET.fromstring(xml_data)
-                    elif isinstance(xml_data, str):
-                        root = ET.fromstring(xml_data.encode("utf-8"))
-                    else:
-                        return {
-                            "packages": [],
-                            "error": {
-                                "message": "Unexpected response format from RSS feed",
-                                "code": "parse_error",
-                            },
-                        }
-
-                    # Parse RSS items
-                    packages = []
-
-                    # RSS 2.0 format
-                    for item in root.findall(".//item"):
-                        title_elem = item.find("title")
-                        link_elem = item.find("link")
-                        desc_elem = item.find("description")
-                        pub_date_elem = item.find("pubDate")
-
-                        if title_elem is not None and title_elem.text:
-                            packages.append(
-                                {
-                                    "name": title_elem.text.strip(),
-                                    "link": (
-                                        link_elem.text if link_elem is not None else ""
-                                    ),
-                                    "description": (
-                                        desc_elem.text if desc_elem is not None else ""
-                                    ),
-                                    "published_date": (
-                                        pub_date_elem.text
-                                        if pub_date_elem is not None
-                                        else ""
-                                    ),
-                                }
-                            )
-
-                    return {"packages": packages}
-                else:
-                    return {
-                        "packages": [],
-                        "error": {
-                            "message": "Invalid response format from RSS feed",
-                            "code": "parse_error",
-                        },
-                    }
-
-            except ImportError:
+            source = _rss_source(response)
+            if source is None:
                 return {
                     "packages": [],
                     "error": {
-                        "message": "RSS parsing requires defusedxml for security (install with: pip install defusedxml)",
-                        "code": "missing_dependency",
+                        "message": "Invalid response format from RSS feed",
+                        "code": "parse_error",
                     },
                 }
 
+            packages = []
+            for title, link, description, published_date in _iter_rss_items(source):
+                if title:
+                    packages.append(
+                        {
+                            "name": title.strip(),
+                            "link": link or "",
+                            "description": description or "",
+                            "published_date": published_date or "",
+                        }
+                    )
+
+            return {"packages": packages}
+
         except Exception as e:
             logger.exception(f"Error getting newest packages feed: {e}")
             return {"packages": [], "error": {"message": str(e), "code": "feed_error"}}
@@ -2231,81 +2467,36 @@ class PyPIClient:
             if isinstance(response, dict) and "error" in response:
                 return {"releases": [], "error": response["error"]}
 
-            # Parse RSS/XML
-            try:
-                import defusedxml.ElementTree as ET
-
-                # Extract raw XML data from response
-                if isinstance(response, dict) and "raw_data" in response:
-                    xml_data = response["raw_data"]
-
-                    # Parse the XML
-                    if isinstance(xml_data, bytes):
-                        root = ET.fromstring(xml_data)
-                    elif isinstance(xml_data, str):
-                        root = ET.fromstring(xml_data.encode("utf-8"))
-                    else:
-                        return {
-                            "releases": [],
-                            "error": {
-                                "message": "Unexpected response format from RSS feed",
-                                "code": "parse_error",
-                            },
-                        }
-
-                    # Parse RSS items
-                    releases = []
-
-                    # RSS 2.0 format
-                    for item in root.findall(".//item"):
-                        title_elem = item.find("title")
-                        link_elem = item.find("link")
-                        desc_elem = item.find("description")
-                        pub_date_elem = item.find("pubDate")
-
-                        if title_elem is not None and title_elem.text:
-                            # Extract version from title (format: "package_name version")
-                            title = title_elem.text.strip()
-                            parts = title.rsplit(" ", 1)
-                            version = parts[1] if len(parts) > 1 else ""
-
-                            releases.append(
-                                {
-                                    "version": version,
-                                    "title": title,
-                                    "link": (
-                                        link_elem.text if link_elem is not None else ""
-                                    ),
-                                    "description": (
-                                        desc_elem.text if desc_elem is not None else ""
-                                    ),
-                                    "published_date": (
-                                        pub_date_elem.text
-                                        if pub_date_elem is not None
-                                        else ""
-                                    ),
-                                }
-                            )
-
-                    return {"package_name": package_name, "releases": releases}
-                else:
-                    return {
-                        "releases": [],
-                        "error": {
-                            "message": "Invalid response format from RSS feed",
-                            "code": "parse_error",
-                        },
-                    }
-
-            except ImportError:
+            source = _rss_source(response)
+            if source is None:
                 return {
                     "releases": [],
                     "error": {
-                        "message": "RSS parsing requires defusedxml for security (install with: pip install defusedxml)",
-                        "code": "missing_dependency",
+                        "message": "Invalid response format from RSS feed",
+                        "code": "parse_error",
                     },
                 }
 
+            releases = []
+            for title, link, description, published_date in _iter_rss_items(source):
+                if title:
+                    # Extract version from title (format: "package_name version")
+                    title = title.strip()
+                    parts = title.rsplit(" ", 1)
+                    version = parts[1] if len(parts) > 1 else ""
+
+                    releases.append(
+                        {
+                            "version": version,
+                            "title": title,
+                            "link": link or "",
+                            "description": description or "",
+                            "published_date": published_date or "",
+                        }
+                    )
+
+            return {"package_name": package_name, "releases": releases}
+
         except Exception as e:
             logger.exception(f"Error getting project releases feed: {e}")
             return {"releases": [], "error": {"message": str(e), "code": "feed_error"}}
@@ -2371,9 +2562,7 @@ class PyPIClient:
                 # Handle GitHub releases specially
                 if "github.com" in changelog_url and "/releases" in changelog_url:
                     # Extract owner and repo from GitHub URL
-                    import re
-
-                    match = re.search(r"github\.com/([^/]+)/([^/]+)", changelog_url)
+                    match = _GITHUB_REPO_RE.search(changelog_url)
                     if match:
                         owner, repo = match.groups()
                         # Use GitHub API to get releases
@@ -2457,9 +2646,7 @@ class PyPIClient:
 
             if github_url:
                 # Extract owner and repo
-                import re
-
-                match = re.search(r"github\.com/([^/]+)/([^/]+)", github_url)
+                match = _GITHUB_REPO_RE.search(github_url)
                 if match:
                     owner, repo = match.groups()
                     repo = repo.rstrip("/")  # Remove trailing slash if present
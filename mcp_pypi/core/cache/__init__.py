@@ -4,17 +4,127 @@ Cache management for the MCP-PyPI client.
 
 import asyncio
 import hashlib
-import json
+import heapq
 import logging
 import os
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from mcp_pypi.core.models import ErrorCode, PyPIClientConfig, format_error
+from mcp_pypi.utils.common.serialization import (
+    JSONDecodeError,
+    json_dumps_bytes,
+    json_loads,
+)
+
+try:
+    import zstandard  # type: ignore[import-not-found]
+
+    HAS_ZSTD = True
+except ImportError:
+    zstandard = None
+    HAS_ZSTD = False
 
 logger = logging.getLogger("mcp-pypi.cache")
 
+# zstd level for on-disk entries when zstandard is installed
+ZSTD_LEVEL = 3
+# Magic number starting every zstd frame; entries without it are plain JSON
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Upper bound for the in-process tier holding serialized entries
+MEMORY_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# Number of key -> file path mappings remembered to skip re-hashing
+CACHE_PATH_MEMO_SIZE = 1024
+
+
+def _decode_cache_file(raw: bytes) -> bytes:
+    """Return the JSON bytes of a cache file, decompressing zstd entries."""
+    if raw[:4] != _ZSTD_MAGIC:
+        return raw
+    if not HAS_ZSTD:
+        raise ValueError("Cache entry is zstd-compressed but zstandard is missing")
+    return zstandard.decompress(raw)
+
+
+def _read_cache_file(path: Path) -> Optional[bytes]:
+    """Read a cache file and bump its access time.
+
+    Runs in a worker thread so disk latency never blocks the event loop.
+
+    Returns:
+        The (decompressed) JSON contents, or None if the file does not exist
+    """
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+    # Update access time for LRU pruning of the disk tier
+    try:
+        os.utime(path, None)
+    except FileNotFoundError:
+        pass
+    return _decode_cache_file(raw)
+
+
+def _write_cache_file(path: Path, serialized: bytes) -> int:
+    """Write a cache file, zstd-compressed when zstandard is installed.
+
+    Runs in a worker thread so disk latency never blocks the event loop.
+
+    Returns:
+        The change in the directory's size: the bytes written, less the size
+        of the file they replace
+    """
+    if HAS_ZSTD:
+        serialized = zstandard.compress(serialized, ZSTD_LEVEL)
+    try:
+        previous_size = path.stat().st_size
+    except OSError:
+        previous_size = 0
+    path.write_bytes(serialized)
+    return len(serialized) - previous_size
+
+
+def _prune_directory(directory: Path, target_size: int) -> Tuple[int, int]:
+    """Remove least recently accessed files until the directory fits a budget.
+
+    A single scandir pass collects (atime, size, path) for every file; the
+    oldest are then popped off a heap, so only evicted files are ordered.
+
+    Args:
+        directory: The cache directory
+        target_size: The target size in bytes
+
+    Returns:
+        A tuple of (size before pruning, size after pruning)
+    """
+    entries: List[Tuple[float, int, str]] = []
+    current_size = 0
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_file():
+                st = entry.stat()
+                entries.append((st.st_atime, st.st_size, entry.path))
+                current_size += st.st_size
+
+    heapq.heapify(entries)
+    remaining_size = current_size
+    while entries and remaining_size > target_size:
+        _, file_size, file_path = heapq.heappop(entries)
+        try:
+            os.unlink(file_path)
+            remaining_size -= file_size
+            logger.debug(f"Pruned cache file: {file_path} ({file_size} bytes)")
+        except OSError as e:
+            logger.warning(f"Failed to remove cache file {file_path}: {e}")
+
+    return current_size, remaining_size
+
 
 class AsyncCacheManager:
     """Async cache manager for API responses."""
@@ -27,14 +137,70 @@ class AsyncCacheManager:
         """
         self.config = config
         self._cache_lock = asyncio.Lock()
+        # Resolved once so key lookups do no extra Path construction
+        self._cache_dir = Path(self.config.cache_dir)
+
+        # Hot entries are kept serialized in memory (LRU order), so hits skip
+        # the hash + open + read round trip while callers still get a fresh copy
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_size = 0
+
+        # Recently resolved cache file paths (LRU order)
+        self._paths: OrderedDict[str, Path] = OrderedDict()
+
+        # Running estimate of the on-disk size; measured lazily on first use
+        self._disk_size: Optional[int] = None
 
         # Ensure cache directory exists
         os.makedirs(self.config.cache_dir, exist_ok=True)
 
     async def _get_cache_path(self, key: str) -> Path:
         """Get the cache file path for a key."""
+        path = self._paths.get(key)
+        if path is not None:
+            self._paths.move_to_end(key)
+            return path
+
         hashed_key = hashlib.sha256(key.encode()).hexdigest()
-        return Path(self.config.cache_dir) / hashed_key
+        path = self._paths[key] = self._cache_dir / hashed_key
+        if len(self._paths) > CACHE_PATH_MEMO_SIZE:
+            self._paths.popitem(last=False)
+        return path
+
+    def _remember(self, key: str, raw: bytes) -> None:
+        """Store a serialized entry in the memory tier, evicting LRU entries."""
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_size -= len(previous)
+
+        self._memory[key] = raw
+        self._memory_size += len(raw)
+
+        while self._memory_size > MEMORY_CACHE_MAX_BYTES:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_size -= len(evicted)
+
+    async def _read_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read a stored entry from memory, falling back to disk.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The stored entry (timestamp, content, etag, ttl) or None if absent
+        """
+        raw = self._memory.get(key)
+        if raw is not None:
+            self._memory.move_to_end(key)
+        else:
+            cache_path = await self._get_cache_path(key)
+            async with self._cache_lock:
+                raw = await asyncio.to_thread(_read_cache_file, cache_path)
+            if raw is None:
+                return None
+            self._remember(key, raw)
+
+        return json_loads(raw)
 
     async def get(self, key: str) -> Optional[Dict[str, Any]]:
         """Get cached data if it exists and is not expired.
@@ -45,14 +211,9 @@ class AsyncCacheManager:
         Returns:
             The cached data or None if not found or expired
         """
-        cache_path = await self._get_cache_path(key)
-
-        if cache_path.exists():
-            try:
-                async with self._cache_lock:
-                    with cache_path.open("r") as f:
-                        data = json.load(f)
-
+        try:
+            data = await self._read_entry(key)
+            if data is not None:
                 # Check if cache is expired
                 # Use custom TTL if stored, otherwise use default
                 ttl = (
@@ -61,17 +222,18 @@ class AsyncCacheManager:
                     else self.config.cache_ttl
                 )
                 if time.time() - data.get("timestamp", 0) < ttl:
-                    # Update access time
-                    os.utime(cache_path, None)
                     return data.get("content")
                 else:
+                    # Keep the stale entry in memory: a miss is followed by a
+                    # conditional request that needs its ETag, and a 304
+                    # answer renews it via refresh()
                     logger.debug(f"Cache expired for {key} (TTL: {ttl}s)")
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.warning(f"Cache error for {key}: {e}")
-            except PermissionError as e:
-                logger.warning(f"Permission error accessing cache for {key}: {e}")
-            except Exception as e:
-                logger.warning(f"Unexpected error reading cache for {key}: {e}")
+        except (JSONDecodeError, KeyError) as e:
+            logger.warning(f"Cache error for {key}: {e}")
+        except PermissionError as e:
+            logger.warning(f"Permission error accessing cache for {key}: {e}")
+        except Exception as e:
+            logger.warning(f"Unexpected error reading cache for {key}: {e}")
 
         return None
 
@@ -98,8 +260,9 @@ class AsyncCacheManager:
                 "etag": etag,
                 "ttl": ttl,  # Store custom TTL if provided
             }
-            serialized = json.dumps(cache_data)
-            estimated_size = len(serialized.encode("utf-8"))
+            # Serialize once; the same bytes are sized and written to disk
+            serialized = json_dumps_bytes(cache_data)
+            estimated_size = len(serialized)
 
             # If estimated size is larger than 80% of max cache size, don't cache it
             if estimated_size > self.config.cache_max_size * 0.8:
@@ -114,8 +277,12 @@ class AsyncCacheManager:
             cache_path = await self._get_cache_path(key)
 
             async with self._cache_lock:
-                with cache_path.open("w") as f:
-                    json.dump(cache_data, f)
+                size_delta = await asyncio.to_thread(
+                    _write_cache_file, cache_path, serialized
+                )
+            self._remember(key, serialized)
+            if self._disk_size is not None:
+                self._disk_size += size_delta
 
             logger.debug(f"Cached data for {key}")
         except (PermissionError, OSError) as e:
@@ -123,6 +290,31 @@ class AsyncCacheManager:
         except Exception as e:
             logger.warning(f"Unexpected error caching data for {key}: {e}")
 
+    async def refresh(self, key: str) -> Optional[Dict[str, Any]]:
+        """Renew the timestamp of a cached entry after revalidation.
+
+        Used when the server confirms (304 Not Modified or an unchanged ETag)
+        that an entry is still current; expired entries are revived too.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The cached data or None if there is no entry for the key
+        """
+        try:
+            data = await self._read_entry(key)
+        except Exception as e:
+            logger.warning(f"Unexpected error reading cache for {key}: {e}")
+            return None
+
+        if data is None:
+            return None
+
+        content = data.get("content")
+        await self.set(key, content, data.get("etag"), data.get("ttl"))
+        return content
+
     async def get_etag(self, key: str) -> Optional[str]:
         """Get the ETag for a cached response.
 
@@ -132,16 +324,12 @@ class AsyncCacheManager:
         Returns:
             The ETag or None if not found
         """
-        cache_path = await self._get_cache_path(key)
-
-        if cache_path.exists():
-            try:
-                async with self._cache_lock:
-                    with cache_path.open("r") as f:
-                        data = json.load(f)
+        try:
+            data = await self._read_entry(key)
+            if data is not None:
                 return data.get("etag")
-            except (json.JSONDecodeError, KeyError, PermissionError):
-                pass
+        except (JSONDecodeError, KeyError, PermissionError):
+            pass
 
         return None
 
@@ -149,9 +337,12 @@ class AsyncCacheManager:
         """Clear all cached data."""
         try:
             async with self._cache_lock:
-                for file_path in Path(self.config.cache_dir).glob("*"):
+                for file_path in self._cache_dir.glob("*"):
                     if file_path.is_file():
                         file_path.unlink()
+            self._memory.clear()
+            self._memory_size = 0
+            self._disk_size = 0
             logger.info("Cache cleared")
         except Exception as e:
             logger.warning(f"Failed to clear cache: {e}")
@@ -161,7 +352,7 @@ class AsyncCacheManager:
         try:
             total_size = 0
             async with self._cache_lock:
-                for file_path in Path(self.config.cache_dir).glob("*"):
+                for file_path in self._cache_dir.glob("*"):
                     if file_path.is_file():
                         total_size += file_path.stat().st_size
             return total_size
@@ -178,7 +369,7 @@ class AsyncCacheManager:
             newest_timestamp = 0
 
             async with self._cache_lock:
-                for file_path in Path(self.config.cache_dir).glob("*"):
+                for file_path in self._cache_dir.glob("*"):
                     if file_path.is_file():
                         file_count += 1
                         file_size = file_path.stat().st_size
@@ -186,11 +377,12 @@ class AsyncCacheManager:
 
                         # Try to get file timestamp
                         try:
-                            with file_path.open("r") as f:
-                                data = json.load(f)
-                                timestamp = data.get("timestamp", 0)
-                                oldest_timestamp = min(oldest_timestamp, timestamp)
-                                newest_timestamp = max(newest_timestamp, timestamp)
+                            data = json_loads(
+                                _decode_cache_file(file_path.read_bytes())
+                            )
+                            timestamp = data.get("timestamp", 0)
+                            oldest_timestamp = min(oldest_timestamp, timestamp)
+                            newest_timestamp = max(newest_timestamp, timestamp)
                         except:
                             # If we can't read the file, use the file mtime
                             mtime = file_path.stat().st_mtime
@@ -224,63 +416,43 @@ class AsyncCacheManager:
     async def _prune_cache_if_needed(self) -> None:
         """Prune cache if it exceeds the maximum size."""
         try:
-            cache_size = await self.get_cache_size()
+            # Only scan the directory once; later writes update the estimate
+            if self._disk_size is None:
+                self._disk_size = await self.get_cache_size()
+            cache_size = self._disk_size
 
             if cache_size > self.config.cache_max_size:
                 logger.info(
                     f"Cache size ({cache_size} bytes) exceeds max ({self.config.cache_max_size} bytes), pruning..."
                 )
-                await self._prune_cache(
+                self._disk_size = await self._prune_cache(
                     target_size=int(self.config.cache_max_size * 0.8)
                 )
         except Exception as e:
             logger.warning(f"Failed to check/prune cache: {e}")
 
-    async def _prune_cache(self, target_size: int) -> None:
+    async def _prune_cache(self, target_size: int) -> Optional[int]:
         """Prune the cache to the target size by removing oldest files by access time.
 
         Args:
             target_size: The target size in bytes
+
+        Returns:
+            The cache size after pruning, or None if pruning failed
         """
         try:
-            # Get all cache files with their access times
-            cache_files: List[Tuple[Path, float]] = []
-
             async with self._cache_lock:
-                for file_path in Path(self.config.cache_dir).glob("*"):
-                    if file_path.is_file():
-                        # Use atime to determine which files were accessed least recently
-                        atime = file_path.stat().st_atime
-                        cache_files.append((file_path, atime))
-
-            # Sort by access time (oldest first)
-            cache_files.sort(key=lambda x: x[1])
-
-            # Get current cache size
-            current_size = await self.get_cache_size()
-            remaining_size = current_size
-
-            # Remove files until we're under the target size
-            async with self._cache_lock:
-                for file_path, _ in cache_files:
-                    if remaining_size <= target_size:
-                        break
-
-                    try:
-                        file_size = file_path.stat().st_size
-                        file_path.unlink()
-                        remaining_size -= file_size
-                        logger.debug(
-                            f"Pruned cache file: {file_path.name} ({file_size} bytes)"
-                        )
-                    except Exception as e:
-                        logger.warning(f"Failed to remove cache file {file_path}: {e}")
+                current_size, remaining_size = await asyncio.to_thread(
+                    _prune_directory, self._cache_dir, target_size
+                )
 
             logger.info(
                 f"Pruned cache from {current_size} bytes to {remaining_size} bytes"
             )
+            return remaining_size
         except Exception as e:
             logger.warning(f"Failed to prune cache: {e}")
+            return None
 
     async def get_stats(self) -> Dict[str, Any]:
         """Get statistics about the cache (compatibility wrapper).
@@ -3,19 +3,38 @@ HTTP client for the MCP-PyPI client.
 """
 
 import asyncio
-import json
+import copy
 import logging
 import random
-from typing import Any, Dict, Optional, cast
+import ssl
+import time
+from typing import Any, Dict, Optional, Tuple, cast
 
 import aiohttp
-from aiohttp import ClientSession, ClientTimeout
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 
 from mcp_pypi.core.cache import AsyncCacheManager
 from mcp_pypi.core.models import ErrorCode, PyPIClientConfig, format_error
+from mcp_pypi.utils.common.serialization import JSONDecodeError, json_loads
 
 logger = logging.getLogger("mcp-pypi.http")
 
+# Keep-alive connection pool shared by all requests on a session
+MAX_CONNECTIONS = 32
+MAX_CONNECTIONS_PER_HOST = 8
+DNS_CACHE_TTL = 300  # seconds
+KEEPALIVE_TIMEOUT = 75  # seconds an idle connection stays open for reuse
+
+# Pacing between requests; doubled on each 429 and halved on each success
+RATE_LIMIT_BASE_DELAY = 0.1  # seconds
+RATE_LIMIT_MAX_DELAY = 60.0  # seconds
+
+
+def _is_json(content_type: str) -> bool:
+    """Whether a Content-Type is JSON, including vendor types such as
+    application/vnd.pypi.simple.v1+json (PEP 691)."""
+    return "application/json" in content_type or "+json" in content_type
+
 
 class AsyncHTTPClient:
     """Async HTTP client for making requests to PyPI."""
@@ -23,15 +42,31 @@ class AsyncHTTPClient:
     def __init__(self, config: PyPIClientConfig, cache_manager: AsyncCacheManager):
         self.config = config
         self.cache = cache_manager  # Changed from self.cache_manager to self.cache
-        self.rate_limit_delay = 0.1  # Initial delay between requests
+        self.rate_limit_delay = RATE_LIMIT_BASE_DELAY  # Delay between requests
         self.last_request_time = 0.0
+        # After a 429, no request is sent before this time, so concurrent
+        # requests back off together instead of each hitting the limit
+        self._paused_until = 0.0
         self._session: Optional[ClientSession] = None
+        # One TLS context for every session, so TLS sessions can be resumed
+        self._ssl_context = ssl.create_default_context()
+        # GETs without a body currently on the wire, keyed by URL and headers
+        self._inflight: Dict[
+            Tuple[str, Tuple[Tuple[str, str], ...]], "asyncio.Task[Dict[str, Any]]"
+        ] = {}
 
     async def _get_session(self) -> ClientSession:
         """Get or create an aiohttp ClientSession."""
         if self._session is None or self._session.closed:
             timeout = ClientTimeout(total=self.config.timeout)  # type: ignore[call-arg]
-            self._session = ClientSession(timeout=timeout)
+            connector = TCPConnector(
+                limit=MAX_CONNECTIONS,
+                limit_per_host=MAX_CONNECTIONS_PER_HOST,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                ssl=self._ssl_context,
+            )
+            self._session = ClientSession(timeout=timeout, connector=connector)
         return self._session
 
     async def close(self) -> None:
@@ -42,13 +77,11 @@ class AsyncHTTPClient:
 
     async def _apply_rate_limit(self) -> None:
         """Apply rate limiting to avoid overwhelming the server."""
-        import time
-
         current_time = time.time()
         elapsed = current_time - self.last_request_time
 
-        if elapsed < self.rate_limit_delay:
-            delay = self.rate_limit_delay - elapsed
+        delay = max(self.rate_limit_delay - elapsed, self._paused_until - current_time)
+        if delay > 0:
             logger.debug(f"Rate limiting: sleeping for {delay:.2f}s")
             await asyncio.sleep(delay)
 
@@ -63,6 +96,8 @@ class AsyncHTTPClient:
     ) -> Dict[str, Any]:
         """Fetch data from URL with caching, rate limiting, and retries.
 
+        Concurrent GETs for the same URL and headers share a single request.
+
         Args:
             url: The URL to fetch
             method: The HTTP method to use (default: GET)
@@ -72,6 +107,40 @@ class AsyncHTTPClient:
         Returns:
             The parsed response as a dictionary
         """
+        if method != "GET" or data is not None:
+            return await self._fetch(url, method, headers, data)
+
+        key = (url, tuple(sorted(headers.items())) if headers else ())
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(url, method, headers, data))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._forget_inflight(key, task))
+            # Shielded so cancelling this caller doesn't fail the ones joining
+            return await asyncio.shield(task)
+
+        # Joining another caller's request; give this caller its own copy
+        logger.debug(f"Joining in-flight request for {url}")
+        return copy.deepcopy(await asyncio.shield(task))
+
+    def _forget_inflight(
+        self, key: Tuple[str, Tuple[Tuple[str, str], ...]], task: "asyncio.Task[Any]"
+    ) -> None:
+        """Drop a finished request from the in-flight map."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Every waiter may have been cancelled; mark a failure as retrieved
+        if not task.cancelled():
+            task.exception()
+
+    async def _fetch(
+        self,
+        url: str,
+        method: str,
+        headers: Optional[Dict[str, str]],
+        data: Optional[bytes],
+    ) -> Dict[str, Any]:
+        """Perform a fetch without request coalescing; see fetch()."""
         # Check cache first (only for GET requests)
         if method == "GET" and data is None:
             cached_data = await self.cache.get(url)
@@ -110,10 +179,13 @@ class AsyncHTTPClient:
                     )
 
                     # Handle HTTP status codes
-                    if response.status == 304 and cached_data:  # Not Modified
-                        logger.debug(f"Not modified (304) for {url}, using cache")
-                        return cached_data
-                    elif response.status == 304:
+                    if response.status == 304 and etag:  # Not Modified
+                        # The stale entry is still current; renew it in place
+                        refreshed = await self.cache.refresh(url)
+                        if refreshed is not None:
+                            logger.debug(f"Not modified (304) for {url}, using cache")
+                            return refreshed
+                    if response.status == 304:
                         logger.warning(
                             f"Received 304 Not Modified but no cached data available for {url}"
                         )
@@ -143,13 +215,15 @@ class AsyncHTTPClient:
                             )
                             new_etag = retry_response.headers.get("ETag")
 
-                            if "application/json" in content_type:
+                            if _is_json(content_type):
                                 try:
-                                    result = await retry_response.json()
+                                    result = await retry_response.json(
+                                        loads=json_loads, content_type=None
+                                    )
                                     if isinstance(result, dict) and method == "GET":
                                         await self.cache.set(url, result, new_etag)
                                     return result
-                                except json.JSONDecodeError as e:
+                                except JSONDecodeError as e:
                                     return cast(
                                         Dict[str, Any],
                                         format_error(
@@ -182,19 +256,24 @@ class AsyncHTTPClient:
                                     }
 
                     if response.status == 429:  # Too Many Requests
+                        # Exponential backoff with jitter
+                        self.rate_limit_delay = min(
+                            RATE_LIMIT_MAX_DELAY, self.rate_limit_delay * 2
+                        )
                         retry_after = response.headers.get("Retry-After")
                         if retry_after and retry_after.isdigit():
-                            self.rate_limit_delay = float(retry_after)
+                            backoff = float(retry_after)
                         else:
-                            # Exponential backoff with jitter
-                            self.rate_limit_delay = min(
-                                60, self.rate_limit_delay * 2
-                            ) + random.uniform(0, 1)
+                            backoff = self.rate_limit_delay + random.uniform(0, 1)
+                        self._paused_until = max(
+                            self._paused_until, time.time() + backoff
+                        )
 
+                        last_error = "HTTP error 429: rate limited"
+                        retries_left -= 1
                         logger.warning(
-                            f"Rate limited, retrying after {self.rate_limit_delay:.2f}s"
+                            f"Rate limited, retrying after {backoff:.2f}s ({retries_left} retries left)"
                         )
-                        await asyncio.sleep(self.rate_limit_delay)
                         continue
 
                     if response.status == 404:
@@ -233,17 +312,32 @@ class AsyncHTTPClient:
                                 format_error(ErrorCode.NETWORK_ERROR, error_message),
                             )
 
+                    # The server accepted the request; ease off any 429 backoff
+                    self.rate_limit_delay = max(
+                        RATE_LIMIT_BASE_DELAY, self.rate_limit_delay / 2
+                    )
+
                     # Extract content type and response data
                     content_type = response.headers.get("Content-Type", "")
                     new_etag = response.headers.get("ETag")
 
+                    if new_etag and new_etag == etag:
+                        # Same representation as the stale entry (some CDNs
+                        # answer 200 instead of 304); skip decoding the body
+                        refreshed = await self.cache.refresh(url)
+                        if refreshed is not None:
+                            logger.debug(f"Unchanged ETag for {url}, using cache")
+                            return refreshed
+
                     logger.debug(
                         f"Processing response with content type: {content_type}"
                     )
 
-                    if "application/json" in content_type:
+                    if _is_json(content_type):
                         try:
-                            result = await response.json()
+                            result = await response.json(
+                                loads=json_loads, content_type=None
+                            )
                             logger.debug(
                                 f"Successfully parsed JSON response with keys: {list(result.keys()) if isinstance(result, dict) else 'Not a dict'}"
                             )
@@ -254,7 +348,7 @@ class AsyncHTTPClient:
                                 await self.cache.set(url, result, new_etag)
 
                             return result
-                        except json.JSONDecodeError as e:
+                        except JSONDecodeError as e:
                             logger.error(f"JSON decode error for {url}: {e}")
                             return cast(
                                 Dict[str, Any],
@@ -312,7 +406,7 @@ class AsyncHTTPClient:
             except asyncio.TimeoutError:
                 last_error = "Request timed out"
                 logger.warning(f"Timeout for {url}")
-            except json.JSONDecodeError as e:
+            except JSONDecodeError as e:
                 return cast(
                     Dict[str, Any],
                     format_error(
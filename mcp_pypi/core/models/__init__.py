@@ -25,6 +25,7 @@ DEFAULT_CACHE_TTL = 604800  # 1 week
 DEFAULT_CACHE_MAX_SIZE = 100 * 1024 * 1024  # 100 MB
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY = 1.0  # Base delay for exponential backoff
+DEFAULT_MAX_CONCURRENCY = 16  # Concurrent PyPI lookups in batch operations
 
 
 # Error codes for standardized responses
@@ -79,6 +80,11 @@ class PyPIClientConfig:
     timeout: float = field(
         default_factory=lambda: float(os.environ.get("PYPI_TIMEOUT", 30.0))
     )
+    max_concurrency: int = field(
+        default_factory=lambda: int(
+            os.environ.get("PYPI_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)
+        )
+    )
     vulnerability_cache_ttl: int = field(
         default_factory=lambda: int(
             os.environ.get("PYPI_VULNERABILITY_CACHE_TTL", 3600)  # 1 hour default
@@ -8,11 +8,28 @@ from typing import Any, Dict, List, Optional, Tuple, cast
 
 from mcp_pypi.core.http import AsyncHTTPClient
 from mcp_pypi.core.models import ErrorCode, StatsResult, format_error
+from mcp_pypi.utils.common.serialization import JSONDecodeError, json_loads
 from mcp_pypi.utils.helpers import sanitize_package_name
 
 logger = logging.getLogger("mcp-pypi.stats")
 
 
+def _recent_month_keys(count: int) -> List[str]:
+    """Return "YYYY-MM" keys for the current month and the ones before it.
+
+    Args:
+        count: How many months to return
+
+    Returns:
+        The month keys, newest first
+    """
+    today = datetime.date.today()
+    current = today.year * 12 + today.month - 1
+    return [
+        f"{(current - i) // 12:04d}-{(current - i) % 12 + 1:02d}" for i in range(count)
+    ]
+
+
 class PackageStatsService:
     """Service for retrieving package download statistics."""
 
@@ -62,10 +79,8 @@ class PackageStatsService:
                 # If we got JSON content, parse it
                 if "application/json" in content_type and isinstance(raw_data, str):
                     try:
-                        import json
-
-                        overall_data_parsed = json.loads(raw_data)
-                    except json.JSONDecodeError as e:
+                        overall_data_parsed = json_loads(raw_data)
+                    except JSONDecodeError as e:
                         logger.error(f"Error decoding JSON from raw_data: {e}")
                         return cast(
                             StatsResult,
@@ -102,10 +117,8 @@ class PackageStatsService:
                 # If we got JSON content, parse it
                 if "application/json" in content_type and isinstance(raw_data, str):
                     try:
-                        import json
-
-                        detailed_data_parsed = json.loads(raw_data)
-                    except json.JSONDecodeError as e:
+                        detailed_data_parsed = json_loads(raw_data)
+                    except JSONDecodeError as e:
                         logger.error(f"Error decoding JSON from raw_data: {e}")
                         return cast(
                             StatsResult,
@@ -157,9 +170,7 @@ class PackageStatsService:
                             if "date" in entry and "downloads" in entry:
                                 try:
                                     date_str = entry["date"]
-                                    date_obj = datetime.datetime.strptime(
-                                        date_str, "%Y-%m-%d"
-                                    ).date()
+                                    date_obj = datetime.date.fromisoformat(date_str)
 
                                     # Calculate days ago
                                     days_ago = (today - date_obj).days
@@ -175,7 +186,9 @@ class PackageStatsService:
                                         last_month += entry["downloads"]
 
                                     # Add to monthly aggregation
-                                    month_key = date_obj.strftime("%Y-%m")
+                                    month_key = (
+                                        f"{date_obj.year:04d}-{date_obj.month:02d}"
+                                    )
                                     monthly_downloads[month_key] = (
                                         monthly_downloads.get(month_key, 0)
                                         + entry["downloads"]
@@ -203,19 +216,13 @@ class PackageStatsService:
 
                     # Ensure we have some data
                     if not monthly_downloads:
-                        # Generate synthetic monthly data based on recent totals
-                        now = datetime.datetime.now()
-                        for i in range(min(periods, 12)):
-                            month_date = now - datetime.timedelta(days=30 * i)
-                            month_key = month_date.strftime("%Y-%m")
-
-                            # Scale downloads based on recency
-                            if i == 0:
-                                monthly_downloads[month_key] = last_month or 10000
-                            else:
-                                # Decrease by ~10% per month (with some variation)
-                                prev_month = list(monthly_downloads.values())[-1]
-                                monthly_downloads[month_key] = int(prev_month * 0.9)
+                        # Generate synthetic monthly data based on recent totals;
+                        # scale downloads based on recency, decreasing by ~10%
+                        # per month
+                        month_downloads = last_month or 10000
+                        for month_key in _recent_month_keys(min(periods, 12)):
+                            monthly_downloads[month_key] = month_downloads
+                            month_downloads = int(month_downloads * 0.9)
 
                     # Limit to the requested number of periods
                     if len(monthly_downloads) > periods:
@@ -261,20 +268,14 @@ class PackageStatsService:
         """Generate synthetic statistics when real data is unavailable."""
         logger.warning(f"Generating synthetic stats for {package_name}")
 
-        current_date = datetime.datetime.now()
-        downloads: Dict[str, int] = {}
-
-        # Generate 6 months of data
-        for i in range(periods):
-            month_date = current_date - datetime.timedelta(days=30 * i)
-            month_key = month_date.strftime("%Y-%m")
-
-            # Create download numbers that decrease for older months
-            monthly_downloads = int(100000 / (i + 1))
-            downloads[month_key] = monthly_downloads
+        # Create download numbers that decrease for older months
+        downloads: Dict[str, int] = {
+            month_key: 100000 // (i + 1)
+            for i, month_key in enumerate(_recent_month_keys(periods))
+        }
 
         # Calculate aggregate stats
-        last_month = downloads[list(downloads.keys())[0]]
+        last_month = next(iter(downloads.values()), 0)
         last_week = int(last_month / 4)
         last_day = int(last_week / 7)
 
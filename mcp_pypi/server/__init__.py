@@ -7,14 +7,15 @@ tracking, and other PyPI-related operations.
 """
 
 import asyncio
-import json
+import itertools
 import logging
 import os
 import re
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Set, Union, cast
+from typing import (Any, Dict, List, Literal, Optional, Set, Tuple, Union,
+                    cast)
 
 from mcp.server import FastMCP
 from mcp.types import GetPromptResult, PromptMessage, TextContent
@@ -27,12 +28,52 @@ from mcp_pypi.core.models import (DependenciesResult, DependencyTreeResult,
                                   PyPIClientConfig, ReleasesFeed, ReleasesInfo,
                                   SearchResult, StatsResult, UpdatesFeed,
                                   VersionComparisonResult, VersionInfo)
+from mcp_pypi.utils.common.serialization import json_loads
 
 # Protocol version for MCP
 PROTOCOL_VERSION = "2025-06-18"
 
 logger = logging.getLogger("mcp-pypi.server")
 
+# Patterns for the lightweight dependency-file scanners
+_INSTALL_REQUIRES_RE = re.compile(r"install_requires\s*=\s*\[(.*?)\]", re.DOTALL)
+_QUOTED_STRING_RE = re.compile(r'["\']([^"\']+)["\']')
+_VERSION_OPERATOR_RE = re.compile(r"[<>=!~]")
+
+
+def _install_uvloop() -> bool:
+    """Use uvloop as the asyncio event loop if it is installed.
+
+    Returns:
+        True if the uvloop event loop policy was installed, False otherwise
+    """
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Using uvloop event loop")
+    return True
+
+
+async def _run_command(args: List[str]) -> Tuple[int, bytes]:
+    """Run a command without blocking the event loop.
+
+    Args:
+        args: The command and its arguments
+
+    Returns:
+        A tuple of (return code, raw stdout bytes); stderr is discarded
+    """
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    stdout, _ = await process.communicate()
+    return cast(int, process.returncode), stdout
+
 
 class PyPIMCPServer:
     """A fully compliant MCP server for PyPI functionality."""
@@ -837,11 +878,6 @@ Key capabilities:
             Tip: Regular scans catch vulnerabilities discovered after installation.
             """
             try:
-                import json
-                import os
-                import subprocess
-                from pathlib import Path
-
                 # Auto-detect environment if not specified
                 if not environment_path:
                     # Check common virtual environment locations
@@ -875,23 +911,28 @@ Key capabilities:
                     pip_cmd = "pip"
                     env_type = "system"
 
-                # Get list of installed packages
-                try:
-                    result = subprocess.run(
-                        [pip_cmd, "list", "--format=json"],
-                        capture_output=True,
-                        text=True,
-                        check=True,
+                # Get list of installed packages; pip --version runs alongside
+                # it without blocking the event loop
+                list_cmd = [pip_cmd, "list", "--format=json"]
+                (list_returncode, list_output), (_, version_output) = (
+                    await asyncio.gather(
+                        _run_command(list_cmd), _run_command([pip_cmd, "--version"])
                     )
-                    installed_packages = json.loads(result.stdout)
-                except subprocess.CalledProcessError as e:
-                    logger.error(f"Failed to get package list: {e}")
+                )
+                if list_returncode != 0:
+                    message = (
+                        f"Command '{' '.join(list_cmd)}' returned non-zero "
+                        f"exit status {list_returncode}."
+                    )
+                    logger.error(f"Failed to get package list: {message}")
                     return {
                         "error": {
-                            "message": f"Failed to get package list: {str(e)}",
+                            "message": f"Failed to get package list: {message}",
                             "code": "pip_list_error",
                         }
                     }
+                # Only stdout is captured; parse the raw bytes directly
+                installed_packages = json_loads(list_output)
 
                 # Scan each package for vulnerabilities
                 vulnerable_packages = []
@@ -1007,9 +1048,9 @@ Key capabilities:
                 return {
                     "environment_type": env_type,
                     "environment_path": environment_path or "system",
-                    "python_version": subprocess.run(
-                        [pip_cmd, "--version"], capture_output=True, text=True
-                    ).stdout.strip(),
+                    "python_version": version_output.decode(
+                        "utf-8", errors="replace"
+                    ).strip(),
                     "total_packages": total_packages,
                     "vulnerable_packages": (
                         vulnerable_packages
@@ -1249,8 +1290,6 @@ Key capabilities:
             • Not checking if pyproject.toml exists (it's the modern standard)
             """
             try:
-                from pathlib import Path
-
                 # Auto-detect project path
                 if not project_path:
                     project_path = os.getcwd()
@@ -1574,7 +1613,9 @@ Key capabilities:
                 if check_transitive and results["all_vulnerable_packages"]:
                     results["checks_performed"].append("transitive dependencies")
                     # Pick top 3 packages to deep scan
-                    top_packages = list(results["all_vulnerable_packages"].keys())[:3]
+                    top_packages = list(
+                        itertools.islice(results["all_vulnerable_packages"], 3)
+                    )
                     transitive_vulns = {}
 
                     for pkg in top_packages:
@@ -1889,19 +1930,15 @@ Key capabilities:
         try:
             content = setup_file.read_text()
             # Extract install_requires using regex
-            import re
-
-            install_requires_match = re.search(
-                r"install_requires\s*=\s*\[(.*?)\]", content, re.DOTALL
-            )
+            install_requires_match = _INSTALL_REQUIRES_RE.search(content)
             if install_requires_match:
                 requires_text = install_requires_match.group(1)
                 # Parse individual requirements
-                requirements = re.findall(r'["\']([^"\']+)["\']', requires_text)
+                requirements = _QUOTED_STRING_RE.findall(requires_text)
 
                 for req in requirements:
                     # Parse package name and version
-                    parts = re.split(r"[<>=!~]", req)
+                    parts = _VERSION_OPERATOR_RE.split(req)
                     pkg_name = parts[0].strip()
 
                     if pkg_name:
@@ -1961,9 +1998,7 @@ Key capabilities:
                     req = req.strip()
                     if req:
                         # Parse package name
-                        import re
-
-                        parts = re.split(r"[<>=!~]", req)
+                        parts = _VERSION_OPERATOR_RE.split(req)
                         pkg_name = parts[0].strip()
 
                         if pkg_name:
@@ -2071,9 +2106,7 @@ Key capabilities:
         """Parse Pipfile.lock for exact versions."""
         vulns = []
         try:
-            import json
-
-            data = json.loads(pipfile_lock.read_text())
+            data = json_loads(pipfile_lock.read_bytes())
 
             # Check both default and develop sections
             for section in ["default", "develop"]:
@@ -2229,9 +2262,7 @@ Key capabilities:
                     elif isinstance(dep, dict) and "pip" in dep:
                         # Handle pip dependencies in conda files
                         for pip_dep in dep["pip"]:
-                            import re
-
-                            parts = re.split(r"[<>=!~]", pip_dep)
+                            parts = _VERSION_OPERATOR_RE.split(pip_dep)
                             pkg_name = parts[0].strip()
 
                             if pkg_name:
@@ -2517,6 +2548,9 @@ Key capabilities:
                 - "stdio": Direct process communication
                 - "http": HTTP server with both SSE (/sse) and streamable-http (/mcp) endpoints
         """
+        # FastMCP starts its own loop via anyio, which picks up the policy
+        _install_uvloop()
+
         if transport == "stdio":
             self.mcp_server.run(transport="stdio")
         elif transport == "http":
@@ -7,7 +7,6 @@ supporting multiple backends and strategies for efficient data retrieval.
 
 import asyncio
 import io
-import json
 import logging
 import os
 import pickle
@@ -20,6 +19,9 @@ from pathlib import Path
 from typing import (Any, Callable, Dict, List, Optional, Protocol, Tuple,
                     TypeVar, Union, cast)
 
+from mcp_pypi.utils.common.serialization import (JSONDecodeError,
+                                                 json_dumps_bytes, json_loads)
+
 T = TypeVar("T")
 
 logger = logging.getLogger("mcp_pypi.cache")
@@ -495,9 +497,12 @@ class FileCache(BaseCache):
             Serialized bytes
         """
         if self.serializer == "json":
-            return json.dumps({"data": value, "timestamp": time.time()}).encode("utf-8")
+            return json_dumps_bytes({"data": value, "timestamp": time.time()})
         else:  # Default to pickle
-            return pickle.dumps({"data": value, "timestamp": time.time()})
+            return pickle.dumps(
+                {"data": value, "timestamp": time.time()},
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
 
     def _deserialize(self, data: bytes) -> Tuple[Any, float]:
         """Deserialize bytes to a value and timestamp.
@@ -510,12 +515,12 @@ class FileCache(BaseCache):
         """
         try:
             if self.serializer == "json":
-                parsed = json.loads(data.decode("utf-8"))
+                parsed = json_loads(data)
             else:  # Default to pickle
                 parsed = restricted_loads(data)
 
             return parsed["data"], parsed["timestamp"]
-        except (json.JSONDecodeError, pickle.UnpicklingError, KeyError) as e:
+        except (JSONDecodeError, pickle.UnpicklingError, KeyError) as e:
             logger.warning(f"Failed to deserialize cache data: {e}")
             return None, 0
 
@@ -753,9 +758,9 @@ try:
                 Serialized bytes
             """
             if self.serializer == "json":
-                return json.dumps(value).encode("utf-8")
+                return json_dumps_bytes(value)
             else:  # Default to pickle
-                return pickle.dumps(value)
+                return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
 
         def _deserialize(self, data: bytes) -> Any:
             """Deserialize bytes to a value.
@@ -768,10 +773,10 @@ try:
             """
             try:
                 if self.serializer == "json":
-                    return json.loads(data.decode("utf-8"))
+                    return json_loads(data)
                 else:  # Default to pickle
                     return restricted_loads(data)
-            except (json.JSONDecodeError, pickle.UnpicklingError) as e:
+            except (JSONDecodeError, pickle.UnpicklingError) as e:
                 logger.warning(f"Failed to deserialize Redis data: {e}")
                 return None
 
@@ -11,6 +11,8 @@ from mcp_pypi.utils.common.constants import (DEFAULT_CACHE_DIR,
                                              ErrorCode)
 from mcp_pypi.utils.common.error_handling import (format_error,
                                                   handle_client_error)
+from mcp_pypi.utils.common.serialization import (HAS_ORJSON, json_dumps,
+                                                 json_dumps_bytes, json_loads)
 # Import public components for easier access
 from mcp_pypi.utils.common.validation import (sanitize_package_name,
                                               sanitize_version)
@@ -25,4 +27,8 @@ __all__ = [
     "DEFAULT_CACHE_DIR",
     "DEFAULT_CACHE_TTL",
     "DEFAULT_CACHE_MAX_SIZE",
+    "HAS_ORJSON",
+    "json_loads",
+    "json_dumps",
+    "json_dumps_bytes",
 ]
@@ -6,22 +6,26 @@ to reduce API calls and improve performance.
 """
 
 import hashlib
-import json
+import heapq
+import itertools
 import logging
 import os
 import re
-import shutil
 import threading
 import time
 from collections import OrderedDict
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
 from enum import Enum
-from functools import wraps
-from typing import (Any, Callable, Dict, List, Optional, Pattern, TypeVar,
-                    Union, cast)
+from functools import lru_cache, wraps
+from typing import (Any, Callable, Dict, Iterator, List, Optional, Pattern,
+                    Tuple, TypeVar, Union, cast)
 
 from mcp_pypi.utils.common.constants import (DEFAULT_CACHE_DIR,
                                              DEFAULT_CACHE_MAX_SIZE,
                                              DEFAULT_CACHE_TTL)
+from mcp_pypi.utils.common.serialization import (JSONDecodeError,
+                                                 json_dumps_bytes, json_loads)
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -30,11 +34,36 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 R = TypeVar("R")
 
+# Number of per-key lock stripes guarding HybridCache disk I/O (a power of two)
+DISK_LOCK_STRIPES = 16
+
 # Global cache instances
 _cache = None
 _hybrid_cache = None
 
 
+@lru_cache(maxsize=4096)
+def _hash_key(key: str) -> str:
+    """Hash a cache key into a filesystem-safe file name.
+
+    md5 keeps existing cache files addressable; it is only used as a file
+    name, not for security. Keys recur on every get/set/invalidate, so the
+    digests are memoized.
+    """
+    return hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
+
+
+@lru_cache(maxsize=128)
+def _compile_pattern(pattern: str) -> Pattern:
+    """Compile an invalidation pattern, memoizing the compiled regex.
+
+    Callers tend to invalidate the same few prefixes repeatedly, and a
+    dedicated cache keeps those from being pushed out of the re module's
+    shared one.
+    """
+    return re.compile(pattern)
+
+
 class EvictionStrategy(Enum):
     """Enumeration of cache eviction strategies."""
 
@@ -43,6 +72,18 @@ class EvictionStrategy(Enum):
     TTL = "ttl"  # Time To Live
 
 
+@dataclass(slots=True)
+class _MemoryEntry:
+    """An entry in the HybridCache memory tier."""
+
+    value: Any
+    expires_at: float
+    created_at: float
+    last_access: float
+    access_count: int = 1  # For LFU strategy
+    seq: int = 0  # Distinguishes rewrites of the same key in the eviction heaps
+
+
 class Cache:
     """A disk-based cache implementation for storing API responses and function results."""
 
@@ -63,6 +104,10 @@ class Cache:
         self.ttl = ttl
         self.max_size = max_size
 
+        # Running total of the cache files' size, so writes don't rescan the
+        # directory; measured lazily on first use
+        self._disk_size: Optional[int] = None
+
         # Create cache directory if it doesn't exist
         os.makedirs(self.cache_dir, exist_ok=True)
         logger.debug("Cache initialized at %s", self.cache_dir)
@@ -80,8 +125,29 @@ class Cache:
             The file path for the cache entry
         """
         # Use a hash to ensure the filename is valid
-        filename = hashlib.md5(key.encode()).hexdigest()
-        return os.path.join(self.cache_dir, filename)
+        return os.path.join(self.cache_dir, _hash_key(key))
+
+    def _remove_file(self, path: str) -> None:
+        """Remove a cache file and account for its size.
+
+        Args:
+            path: Path of the cache file
+
+        Raises:
+            OSError: If the file cannot be removed
+        """
+        size = os.path.getsize(path)
+        os.remove(path)
+        self._adjust_disk_size(-size)
+
+    def _adjust_disk_size(self, delta: int) -> None:
+        """Apply a change to the running disk size, if it has been measured.
+
+        Args:
+            delta: Change in bytes
+        """
+        if self._disk_size is not None:
+            self._disk_size += delta
 
     def get(self, key: str) -> Optional[Any]:
         """Retrieve a value from the cache.
@@ -94,26 +160,27 @@ class Cache:
         """
         path = self._get_cache_path(key)
 
-        if not os.path.exists(path):
-            logger.debug("Cache miss for key %s", key)
-            return None
-
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                cache_data = json.load(f)
+            # Open directly rather than checking os.path.exists first, which
+            # would cost every hit an extra stat
+            with open(path, "rb") as f:
+                cache_data = json_loads(f.read())
 
             # Check if cache entry has expired
             if cache_data.get("expires_at", 0) < time.time():
                 logger.debug("Cache expired for key %s", key)
                 try:
-                    os.remove(path)
+                    self._remove_file(path)
                 except OSError as e:
                     logger.exception("Error removing cache file: %s", e)
                 return None
 
             logger.debug("Cache hit for key %s", key)
             return cache_data.get("value")
-        except (json.JSONDecodeError, OSError) as e:
+        except FileNotFoundError:
+            logger.debug("Cache miss for key %s", key)
+            return None
+        except (JSONDecodeError, OSError) as e:
             logger.warning("Error reading cache file %s: %s", path, e)
             return None
 
@@ -132,7 +199,8 @@ class Cache:
             ttl = self.ttl
 
         path = self._get_cache_path(key)
-        temp_path = f"{path}.tmp"
+        # Unique per writer, so concurrent sets of one key never share a file
+        temp_path = f"{path}.tmp.{os.getpid()}.{threading.get_ident()}"
 
         try:
             # Write to temporary file first for atomic operations
@@ -142,18 +210,25 @@ class Cache:
                 "created_at": time.time(),
             }
 
-            with open(temp_path, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f)
+            payload = json_dumps_bytes(cache_data)
+            with open(temp_path, "wb") as f:
+                f.write(payload)
+
+            try:
+                previous_size = os.path.getsize(path)
+            except OSError:
+                previous_size = 0
 
-            # Move the temporary file to the final path (atomic operation)
-            shutil.move(temp_path, path)
+            # Rename over the final path; atomic, and needs no fsync for a cache
+            os.replace(temp_path, path)
+            self._adjust_disk_size(len(payload) - previous_size)
 
             logger.debug("Cached value for key %s", key)
 
             # Trigger cleanup if needed
             self._cleanup_cache_if_needed()
             return True
-        except (OSError, json.JSONDecodeError) as e:
+        except (OSError, JSONDecodeError) as e:
             logger.warning("Failed to cache value for key %s: %s", key, e)
             # Clean up the temporary file if it exists
             if os.path.exists(temp_path):
@@ -188,9 +263,9 @@ class Cache:
             if os.path.isfile(file_path):
                 try:
                     stat = os.stat(file_path)
-                    with open(file_path, "r", encoding="utf-8") as f:
+                    with open(file_path, "rb") as f:
                         try:
-                            entry_data = json.load(f)
+                            entry_data = json_loads(f.read())
                             entries.append(
                                 {
                                     "path": file_path,
@@ -201,7 +276,7 @@ class Cache:
                                     "expires_at": entry_data.get("expires_at", 0),
                                 }
                             )
-                        except json.JSONDecodeError:
+                        except JSONDecodeError:
                             # Handle corrupted cache files
                             entries.append(
                                 {
@@ -218,7 +293,9 @@ class Cache:
 
     def _cleanup_cache_if_needed(self) -> None:
         """Check if cache cleanup is needed and perform it if necessary."""
-        cache_size = self._get_cache_size()
+        if self._disk_size is None:
+            self._disk_size = self._get_cache_size()
+        cache_size = self._disk_size
         if cache_size > self.max_size:
             logger.info(
                 "Cache size (%s bytes) exceeds limit (%s bytes). Cleaning up...",
@@ -228,7 +305,10 @@ class Cache:
             self._cleanup_cache()
 
     def _cleanup_cache(self) -> None:
-        """Remove oldest cache entries until the cache is under the size limit."""
+        """Remove oldest cache entries until the cache is under the size limit.
+
+        The directory is rescanned here, which also resyncs the running size.
+        """
         entries = self._get_cache_entries()
 
         # First, remove expired entries
@@ -243,12 +323,12 @@ class Cache:
                     logger.exception("Error removing cache file: %s", e)
 
         # If still over size limit, remove oldest entries
-        if sum(entry["size"] for entry in entries) > self.max_size:
+        current_size = sum(entry["size"] for entry in entries)
+        if current_size > self.max_size:
             # Sort by creation time (oldest first)
             entries.sort(key=lambda e: e["created_at"])
 
             # Remove entries until we're under the limit
-            current_size = sum(entry["size"] for entry in entries)
             for entry in entries:
                 if current_size <= self.max_size:
                     break
@@ -260,6 +340,8 @@ class Cache:
                 except OSError as e:
                     logger.exception("Error removing cache file: %s", e)
 
+        self._disk_size = current_size
+
     def clear(self) -> None:
         """Clear all entries from the cache."""
         for filename in os.listdir(self.cache_dir):
@@ -270,6 +352,8 @@ class Cache:
                 except OSError as e:
                     logger.exception("Error removing cache file: %s", e)
 
+        # Remeasure on next use in case some files could not be removed
+        self._disk_size = None
         logger.info("Cache cleared")
 
     def invalidate(self, key: str) -> bool:
@@ -284,7 +368,7 @@ class Cache:
         path = self._get_cache_path(key)
         if os.path.exists(path):
             try:
-                os.remove(path)
+                self._remove_file(path)
                 logger.debug("Invalidated cache entry for key %s", key)
                 return True
             except OSError as e:
@@ -343,12 +427,21 @@ class HybridCache(Cache):
             memory_max_size: Maximum number of items in the memory cache
             eviction_strategy: Strategy to use for cache eviction
         """
+        # Created first: the base initializer already runs a disk cleanup
+        self._lock = threading.RLock()  # Use recursive lock for thread safety
         super().__init__(cache_dir, ttl, max_size)
         self._memory_cache = OrderedDict()  # LRU cache by default
-        self._access_count = {}  # For LFU strategy
+        # Min-heaps of (access_count, seq, key) for LFU eviction and
+        # (expires_at, seq, key) for TTL eviction. LFU counts are snapshots
+        # taken at insertion and refreshed lazily on eviction.
+        self._lfu_heap: List[Tuple[int, int, str]] = []
+        self._ttl_heap: List[Tuple[float, int, str]] = []
+        self._entry_seq = itertools.count()
         self.memory_max_size = memory_max_size
         self.eviction_strategy = eviction_strategy  # Set inside __init__
-        self._lock = threading.RLock()  # Use recursive lock for thread safety
+        # Disk I/O for a key only holds that key's stripe, so reads and writes
+        # of different keys overlap instead of queueing on self._lock
+        self._disk_locks = tuple(threading.Lock() for _ in range(DISK_LOCK_STRIPES))
 
         # Metrics
         self._metrics = {
@@ -364,6 +457,12 @@ class HybridCache(Cache):
         """Retrieve a value from the cache.
 
         First checks the in-memory cache, then falls back to the disk cache.
+        Memory hits don't take the lock. The lookup and the LRU reordering
+        are single dict operations, which the GIL makes atomic, and an entry
+        evicted concurrently simply turns into a miss on the locked path.
+        The hit counter and the entry's LFU access count are bumped with
+        unlocked read-modify-writes, so under concurrent hits they may lose
+        increments: hit metrics and LFU ordering are approximate.
 
         Args:
             key: Cache key
@@ -371,38 +470,44 @@ class HybridCache(Cache):
         Returns:
             The cached value, or None if not found or expired
         """
-        with self._lock:
-            # Try to get from memory cache first
-            if key in self._memory_cache:
-                cache_data = self._memory_cache[key]
-
-                # Check if the memory cache entry has expired
-                if cache_data.get("expires_at", 0) < time.time():
-                    # Remove from memory cache
-                    self._memory_cache.pop(key, None)
-                    self._access_count.pop(key, None)
-                    self._metrics["memory_misses"] += 1
-                else:
+        now = time.monotonic()
+        cache_data = self._memory_cache.get(key)
+        if cache_data is not None and cache_data.expires_at >= now:
+            self._update_access_metrics(key, cache_data, now)
+            self._metrics["memory_hits"] += 1
+            return cache_data.value
+
+        with self._disk_lock_for(key):
+            with self._lock:
+                # Try to get from memory cache first
+                cache_data = self._memory_cache.get(key)
+                if cache_data is not None and cache_data.expires_at >= now:
                     # Update access metrics for the entry
-                    self._update_access_metrics(key)
+                    self._update_access_metrics(key, cache_data, now)
 
                     self._metrics["memory_hits"] += 1
-                    return cache_data.get("value")
-
-            # Memory cache miss, try disk cache
-            self._metrics["memory_misses"] += 1
+                    return cache_data.value
+
+                # Memory cache miss (counted once, even for an expired entry)
+                self._metrics["memory_misses"] += 1
+                if cache_data is not None:
+                    # Expired: remove from memory cache. The disk copy is
+                    # still read, since another process or instance sharing
+                    # the directory may have written a fresh entry since
+                    self._memory_cache.pop(key, None)
 
             # Get from disk cache
             result = super().get(key)
 
-            if result is not None:
-                # Found in disk cache, add to memory cache
-                self._metrics["disk_hits"] += 1
-                self._add_to_memory_cache(key, result, None)
-                return result
+            with self._lock:
+                if result is not None:
+                    # Found in disk cache, add to memory cache
+                    self._metrics["disk_hits"] += 1
+                    self._add_to_memory_cache(key, result, None)
+                    return result
 
-            self._metrics["disk_misses"] += 1
-            return None
+                self._metrics["disk_misses"] += 1
+                return None
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """Store a value in both memory and disk cache.
@@ -415,11 +520,12 @@ class HybridCache(Cache):
         Returns:
             True if the value was cached successfully, False otherwise
         """
-        with self._lock:
-            self._metrics["sets"] += 1
+        with self._disk_lock_for(key):
+            with self._lock:
+                self._metrics["sets"] += 1
 
-            # Add to memory cache
-            self._add_to_memory_cache(key, value, ttl)
+                # Add to memory cache
+                self._add_to_memory_cache(key, value, ttl)
 
             # Add to disk cache
             return super().set(key, value, ttl)
@@ -433,14 +539,14 @@ class HybridCache(Cache):
         Returns:
             True if the entry was invalidated successfully, False otherwise
         """
-        with self._lock:
-            self._metrics["invalidations"] += 1
+        with self._disk_lock_for(key):
+            with self._lock:
+                self._metrics["invalidations"] += 1
 
-            # Remove from memory cache
-            memory_removed = key in self._memory_cache
-            if memory_removed:
-                self._memory_cache.pop(key, None)
-                self._access_count.pop(key, None)
+                # Remove from memory cache
+                memory_removed = key in self._memory_cache
+                if memory_removed:
+                    self._memory_cache.pop(key, None)
 
             # Remove from disk cache
             disk_removed = super().invalidate(key)
@@ -456,63 +562,20 @@ class HybridCache(Cache):
         Returns:
             Number of invalidated entries
         """
-        with self._lock:
+        with self._all_disk_locks(), self._lock:
             if isinstance(pattern, str):
-                pattern = re.compile(pattern)
+                pattern = _compile_pattern(pattern)
 
-            # Find matching keys in memory cache
-            memory_keys = [k for k in self._memory_cache.keys() if pattern.search(k)]
+            # Find matching keys in memory cache. Lock-free reads may reorder
+            # the OrderedDict, so iterate over a snapshot of its keys
+            memory_keys = [k for k in list(self._memory_cache) if pattern.search(k)]
 
             # Remove matching keys from memory cache
             for key in memory_keys:
                 self._memory_cache.pop(key, None)
-                self._access_count.pop(key, None)
-
-            # Store the actual file paths to remove
-            disk_paths_to_remove = []
-            disk_keys = []
-
-            # First, get all cache entries
-            entries = self._get_cache_entries()
 
-            # For each entry, load it to check if the key matches the pattern
-            for entry in entries:
-                file_path = entry["path"]
-                try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        try:
-                            entry_data = json.load(f)
-                            # The disk cache doesn't store the key, so we need to get it
-                            # from the filename. We reverse-engineer the key by checking
-                            # if the hash matches
-                            if (
-                                entry_data
-                                and entry_data.get("expires_at", 0) > time.time()
-                            ):
-                                for key in memory_keys:
-                                    if file_path.endswith(
-                                        hashlib.md5(key.encode()).hexdigest()
-                                    ):
-                                        disk_paths_to_remove.append(file_path)
-                                        disk_keys.append(key)
-                                        break
-                        except json.JSONDecodeError:
-                            # Skip invalid JSON files
-                            pass
-                except OSError:
-                    # Skip files that can't be accessed
-                    pass
-
-            # Remove matching files from disk
-            for file_path in disk_paths_to_remove:
-                try:
-                    os.remove(file_path)
-                except OSError:
-                    # Skip files that can't be removed
-                    pass
-
-            # For additional invalidation, use individual invalidate calls
-            # which is more reliable for key-based invalidation
+            # The disk cache doesn't store the key, so the only disk entries
+            # that can be matched are the ones for the keys found in memory
             for key in memory_keys:
                 super().invalidate(key)
 
@@ -521,10 +584,11 @@ class HybridCache(Cache):
 
     def clear(self) -> None:
         """Clear all entries from both memory and disk cache."""
-        with self._lock:
+        with self._all_disk_locks(), self._lock:
             # Clear memory cache
             self._memory_cache.clear()
-            self._access_count.clear()
+            self._lfu_heap.clear()
+            self._ttl_heap.clear()
 
             # Clear disk cache
             super().clear()
@@ -535,56 +599,69 @@ class HybridCache(Cache):
         Returns:
             Dictionary with detailed cache statistics
         """
+        # Snapshot the counters under the lock, but scan the disk outside it
+        # so stats polling doesn't stall writers
         with self._lock:
-            # Get basic stats
-            stats = super().get_stats()
+            metrics = dict(self._metrics)
+            memory_entries = len(self._memory_cache)
+
+        stats = super().get_stats()
+
+        memory_hits = metrics["memory_hits"]
+        disk_hits = metrics["disk_hits"]
+        total_requests = memory_hits + metrics["memory_misses"]
+        total_disk_requests = disk_hits + metrics["disk_misses"]
+
+        stats.update(
+            {
+                "memory_entries": memory_entries,
+                "memory_max_size": self.memory_max_size,
+                "eviction_strategy": self.eviction_strategy.value,
+                # Hit/miss and operation counts
+                **metrics,
+                "memory_hit_ratio": memory_hits / max(total_requests, 1),
+                "disk_hit_ratio": disk_hits / max(total_disk_requests, 1),
+                "overall_hit_ratio": (memory_hits + disk_hits) / max(total_requests, 1),
+            }
+        )
 
-            # Add memory cache stats
-            total_requests = (
-                self._metrics["memory_hits"] + self._metrics["memory_misses"]
-            )
-            memory_hit_ratio = (
-                self._metrics["memory_hits"] / total_requests
-                if total_requests > 0
-                else 0
-            )
+        return stats
 
-            total_disk_requests = (
-                self._metrics["disk_hits"] + self._metrics["disk_misses"]
-            )
-            disk_hit_ratio = (
-                self._metrics["disk_hits"] / total_disk_requests
-                if total_disk_requests > 0
-                else 0
-            )
+    def _disk_lock_for(self, key: str) -> threading.Lock:
+        """Get the lock stripe guarding the disk entry for a key.
 
-            overall_hit_ratio = (
-                (self._metrics["memory_hits"] + self._metrics["disk_hits"])
-                / (total_requests)
-                if total_requests > 0
-                else 0
-            )
+        Args:
+            key: Cache key
 
-            stats.update(
-                {
-                    "memory_entries": len(self._memory_cache),
-                    "memory_max_size": self.memory_max_size,
-                    "eviction_strategy": self.eviction_strategy.value,
-                    # Hit/miss statistics
-                    "memory_hits": self._metrics["memory_hits"],
-                    "memory_misses": self._metrics["memory_misses"],
-                    "disk_hits": self._metrics["disk_hits"],
-                    "disk_misses": self._metrics["disk_misses"],
-                    "memory_hit_ratio": memory_hit_ratio,
-                    "disk_hit_ratio": disk_hit_ratio,
-                    "overall_hit_ratio": overall_hit_ratio,
-                    # Operation counts
-                    "sets": self._metrics["sets"],
-                    "invalidations": self._metrics["invalidations"],
-                }
-            )
+        Returns:
+            The stripe's lock
+        """
+        return self._disk_locks[hash(key) & (DISK_LOCK_STRIPES - 1)]
+
+    @contextmanager
+    def _all_disk_locks(self) -> Iterator[None]:
+        """Hold every disk lock stripe, for operations spanning many keys."""
+        with ExitStack() as stack:
+            for lock in self._disk_locks:
+                stack.enter_context(lock)
+            yield
+
+    def _adjust_disk_size(self, delta: int) -> None:
+        """Apply a change to the running disk size under the lock.
+
+        Disk writes to different stripes run concurrently, so the shared
+        total needs the lock even though the writes themselves don't.
+
+        Args:
+            delta: Change in bytes
+        """
+        with self._lock:
+            super()._adjust_disk_size(delta)
 
-            return stats
+    def _cleanup_cache_if_needed(self) -> None:
+        """Check if cache cleanup is needed, letting one writer clean at a time."""
+        with self._lock:
+            super()._cleanup_cache_if_needed()
 
     def _add_to_memory_cache(self, key: str, value: Any, ttl: Optional[int]) -> None:
         """Add an entry to the in-memory cache.
@@ -599,14 +676,18 @@ class HybridCache(Cache):
         if ttl is None:
             ttl = self.ttl
 
+        # Memory entries never outlive the process, so they are stamped with
+        # the monotonic clock; the disk cache keeps wall-clock times
+        now = time.monotonic()
+
         # Create cache entry
-        cache_data = {
-            "key": key,
-            "value": value,
-            "expires_at": time.time() + ttl,
-            "created_at": time.time(),
-            "last_access": time.time(),
-        }
+        cache_data = _MemoryEntry(
+            value=value,
+            expires_at=now + ttl,
+            created_at=now,
+            last_access=now,
+            seq=next(self._entry_seq),
+        )
 
         # If key already exists, remove it to update its position in the OrderedDict
         if key in self._memory_cache:
@@ -614,31 +695,43 @@ class HybridCache(Cache):
 
         # Add to memory cache
         self._memory_cache[key] = cache_data
-
-        # Initialize or reset access count for LFU
-        self._access_count[key] = 1
+        heapq.heappush(self._lfu_heap, (1, cache_data.seq, key))
+        heapq.heappush(self._ttl_heap, (cache_data.expires_at, cache_data.seq, key))
+        if len(self._lfu_heap) > 2 * max(self.memory_max_size, 1):
+            self._compact_heaps()
 
         # Perform eviction if needed
         if len(self._memory_cache) > self.memory_max_size:
             self._evict_from_memory_cache()
 
-    def _update_access_metrics(self, key: str) -> None:
+    def _update_access_metrics(
+        self, key: str, cache_data: _MemoryEntry, now: float
+    ) -> None:
         """Update access metrics for a cache entry.
 
+        Called without the lock from the get() fast path, so the metrics
+        live on the entry itself rather than in a side table that a
+        concurrent eviction could leave stale. The access count is not
+        incremented atomically and may undercount concurrent hits.
+
         Args:
             key: Cache key
+            cache_data: The memory cache entry for the key
+            now: Current time.monotonic() reading
         """
-        if key in self._memory_cache:
-            # Update last access time for LRU
-            self._memory_cache[key]["last_access"] = time.time()
+        # Update last access time for LRU
+        cache_data.last_access = now
 
-            # Update access count for LFU
-            self._access_count[key] = self._access_count.get(key, 0) + 1
+        # Update access count for LFU
+        cache_data.access_count += 1
 
-            # If using LRU, move the key to the end of the OrderedDict
-            if self.eviction_strategy == EvictionStrategy.LRU:
-                value = self._memory_cache.pop(key)
-                self._memory_cache[key] = value
+        # If using LRU, move the key to the end of the OrderedDict
+        if self.eviction_strategy == EvictionStrategy.LRU:
+            try:
+                self._memory_cache.move_to_end(key)
+            except KeyError:
+                # Evicted by another thread since the lookup
+                pass
 
     def _evict_from_memory_cache(self) -> None:
         """Evict entries from memory cache based on the chosen strategy."""
@@ -655,19 +748,66 @@ class HybridCache(Cache):
                 self._memory_cache.popitem(last=False)  # Remove oldest item (first in)
             elif self.eviction_strategy == EvictionStrategy.LFU:
                 # LFU strategy: remove least frequently accessed item
-                least_used_key = min(self._access_count.items(), key=lambda x: x[1])[0]
-                del self._memory_cache[least_used_key]
-                del self._access_count[least_used_key]
+                self._evict_least_frequently_used()
             elif self.eviction_strategy == EvictionStrategy.TTL:
                 # TTL strategy: remove item closest to expiry
-                current_time = time.time()
-                closest_to_expiry = min(
-                    self._memory_cache.items(),
-                    key=lambda x: x[1].get("expires_at", current_time) - current_time,
-                )
-                del self._memory_cache[closest_to_expiry[0]]
-                if closest_to_expiry[0] in self._access_count:
-                    del self._access_count[closest_to_expiry[0]]
+                self._evict_soonest_expiring()
+
+    def _evict_least_frequently_used(self) -> None:
+        """Evict the memory cache entry with the lowest access count.
+
+        Heap counts only ever lag behind the live counts, so a popped item
+        whose count is still current is the true minimum. Stale items are
+        pushed back with their live count; items for entries that have since
+        been replaced or removed are dropped.
+        """
+        while self._lfu_heap:
+            count, seq, key = heapq.heappop(self._lfu_heap)
+            cache_data = self._memory_cache.get(key)
+            if cache_data is None or cache_data.seq != seq:
+                continue
+            if cache_data.access_count != count:
+                heapq.heappush(self._lfu_heap, (cache_data.access_count, seq, key))
+                continue
+            del self._memory_cache[key]
+            return
+
+        # Only reachable if the heap lost track of live entries; fall back
+        # to the oldest entry so eviction always makes progress
+        if self._memory_cache:
+            self._memory_cache.popitem(last=False)
+            self._compact_heaps()
+
+    def _evict_soonest_expiring(self) -> None:
+        """Evict the memory cache entry closest to expiry.
+
+        An entry's expiry never changes, so the first heap item that still
+        refers to a live entry is the one to evict.
+        """
+        while self._ttl_heap:
+            _, seq, key = heapq.heappop(self._ttl_heap)
+            cache_data = self._memory_cache.get(key)
+            if cache_data is not None and cache_data.seq == seq:
+                del self._memory_cache[key]
+                return
+
+        # Only reachable if the heap lost track of live entries
+        if self._memory_cache:
+            self._memory_cache.popitem(last=False)
+            self._compact_heaps()
+
+    def _compact_heaps(self) -> None:
+        """Rebuild the eviction heaps from the live memory cache entries."""
+        entries = list(self._memory_cache.items())
+        self._lfu_heap = [
+            (cache_data.access_count, cache_data.seq, key)
+            for key, cache_data in entries
+        ]
+        self._ttl_heap = [
+            (cache_data.expires_at, cache_data.seq, key) for key, cache_data in entries
+        ]
+        heapq.heapify(self._lfu_heap)
+        heapq.heapify(self._ttl_heap)
 
     def _handle_error(self, e: Exception, message: str) -> None:
         """Helper method to handle exceptions."""
@@ -717,13 +857,15 @@ def cached(
     """
 
     def decorator(func: Callable[..., R]) -> Callable[..., R]:
+        # The qualified name is part of every key, so build it once here
+        func_name = func.__module__ + "." + func.__qualname__
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> R:
             # Get the cache to use
             cache = cache_instance or get_cache()
 
             # Generate a cache key based on the function name, arguments, and prefix
-            func_name = func.__module__ + "." + func.__qualname__
             key_parts = [key_prefix, func_name]
 
             # Add positional arguments to the key
@@ -781,6 +923,9 @@ def hybrid_cached(
     """
 
     def decorator(func: Callable[..., R]) -> Callable[..., R]:
+        # The qualified name is part of every key, so build it once here
+        func_name = func.__module__ + "." + func.__qualname__
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> R:
             # Get the cache to use
@@ -797,7 +942,6 @@ def hybrid_cached(
                 cache.eviction_strategy = eviction_strategy
 
             # Generate a cache key based on the function name, arguments, and prefix
-            func_name = func.__module__ + "." + func.__qualname__
             key_parts = [key_prefix, func_name]
 
             # Add positional arguments to the key
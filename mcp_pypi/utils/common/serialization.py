@@ -0,0 +1,92 @@
+"""
+JSON serialization utilities for MCP-PyPI.
+
+This module wraps JSON encoding and decoding so hot paths can use orjson
+when it is installed, falling back to the standard library json module.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson  # type: ignore[import-not-found]
+
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+# catching the standard library exception regardless of the backend in use.
+JSONDecodeError = json.JSONDecodeError
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if HAS_ORJSON else 0
+
+
+def json_loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """
+    Decode a JSON document.
+
+    Args:
+        data: The JSON document as text or raw bytes
+
+    Returns:
+        The decoded Python object
+
+    Raises:
+        JSONDecodeError: If the document is not valid JSON
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def json_dumps_bytes(obj: Any) -> bytes:
+    """
+    Encode an object as compact UTF-8 JSON bytes.
+
+    Args:
+        obj: The object to encode
+
+    Returns:
+        The encoded JSON document
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def json_dumps(obj: Any) -> str:
+    """
+    Encode an object as a compact JSON string.
+
+    Args:
+        obj: The object to encode
+
+    Returns:
+        The encoded JSON document
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def json_dumps_pretty(obj: Any) -> str:
+    """
+    Encode an object as human-readable JSON with a two-space indent.
+
+    Non-ASCII characters are written as-is with either backend.
+
+    Args:
+        obj: The object to encode
+
+    Returns:
+        The encoded JSON document
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2).decode(
+            "utf-8"
+        )
+    return json.dumps(obj, indent=2, ensure_ascii=False)
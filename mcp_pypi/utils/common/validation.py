@@ -8,6 +8,10 @@ to ensure they are safe for use in PyPI requests.
 import re
 from typing import Optional, Tuple
 
+# Compiled once at import; these run on every public API call
+_PACKAGE_NAME_RE = re.compile(r"^[a-zA-Z0-9._-]+$")
+_VERSION_RE = re.compile(r"^[a-zA-Z0-9._+\-]+$")
+
 
 def sanitize_package_name(package_name: str) -> str:
     """
@@ -23,7 +27,7 @@ def sanitize_package_name(package_name: str) -> str:
         ValueError: If the package name contains invalid characters
     """
     # Only allow valid package name characters
-    if not re.match(r"^[a-zA-Z0-9._-]+$", package_name):
+    if not _PACKAGE_NAME_RE.match(package_name):
         raise ValueError(f"Invalid package name: {package_name}")
     return package_name
 
@@ -42,7 +46,7 @@ def sanitize_version(version: str) -> str:
         ValueError: If the version contains invalid characters
     """
     # Only allow valid version characters
-    if not re.match(r"^[a-zA-Z0-9._+\-]+$", version):
+    if not _VERSION_RE.match(version):
         raise ValueError(f"Invalid version: {version}")
     return version
 
@@ -1,7 +1,12 @@
 """Tests for the RPC server implementation."""
 
 import asyncio
+import gc
+import io
 import json
+import os
+import signal
+import socket
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -72,6 +77,18 @@ async def test_ping_method(rpc_server):
     assert response_obj["id"] == 1
 
 
+@pytest.mark.asyncio
+async def test_ping_fast_path(rpc_server):
+    """Test that byte-encoded ping requests bypass parsing and dispatch."""
+    with patch.object(rpc_server, "_dispatch_method") as mock_dispatch:
+        response = await rpc_server.handle_request(
+            b'{"jsonrpc": "2.0", "method": "ping", "id": "abc"}'
+        )
+
+    mock_dispatch.assert_not_called()
+    assert json.loads(response) == {"jsonrpc": "2.0", "result": "pong", "id": "abc"}
+
+
 @pytest.mark.asyncio
 async def test_describe_method(rpc_server):
     """Test the describe method."""
@@ -179,6 +196,98 @@ async def test_list_params_handling(rpc_server, mock_client):
     mock_client.get_latest_version.assert_called_once_with("test-package")
 
 
+@pytest.mark.asyncio
+async def test_typed_params_are_coerced(rpc_server, mock_client):
+    """Test that loosely typed params are coerced via the dispatch table."""
+    mock_client.get_dependency_tree = AsyncMock(return_value={"tree": {}})
+
+    request = {
+        "jsonrpc": "2.0",
+        "method": "get_dependency_tree",
+        "params": {"package_name": "test-package", "depth": "2"},
+        "id": 1,
+    }
+
+    server = RPCServer(client=mock_client)
+    response = await server.handle_request(json.dumps(request))
+    response_obj = json.loads(response)
+
+    assert response_obj["result"] == {"tree": {}}
+    mock_client.get_dependency_tree.assert_called_once_with(
+        package_name="test-package", depth=2
+    )
+
+
+@pytest.mark.asyncio
+async def test_read_only_results_are_cached(rpc_server, mock_client):
+    """Test that repeated read-only calls reuse the cached result."""
+    mock_client.get_latest_version.return_value = {"version": "1.0.0"}
+    mock_client.get_package_info.return_value = {
+        "error": {"code": "not_found", "message": "Package not found"}
+    }
+
+    server = RPCServer(client=mock_client)
+    for _ in range(2):
+        await server.handle_request(
+            json.dumps(
+                {
+                    "jsonrpc": "2.0",
+                    "method": "get_latest_version",
+                    "params": {"package_name": "test-package"},
+                    "id": 1,
+                }
+            )
+        )
+        await server.handle_request(
+            json.dumps(
+                {
+                    "jsonrpc": "2.0",
+                    "method": "get_package_info",
+                    "params": {"package_name": "missing"},
+                    "id": 2,
+                }
+            )
+        )
+
+    mock_client.get_latest_version.assert_called_once_with(package_name="test-package")
+    # Error results are not cached
+    assert mock_client.get_package_info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_result_cache_keys_on_coerced_params(rpc_server, mock_client):
+    """Test that params differing only before coercion share a cache entry."""
+    mock_client.search_packages.return_value = {"results": []}
+    mock_client.get_dependency_tree.return_value = {"tree": {}}
+
+    server = RPCServer(client=mock_client)
+    for page in ("2", 2):
+        await server.handle_request(
+            json.dumps(
+                {
+                    "jsonrpc": "2.0",
+                    "method": "search_packages",
+                    "params": {"query": "flask", "page": page},
+                    "id": 1,
+                }
+            )
+        )
+        await server.handle_request(
+            json.dumps(
+                {
+                    "jsonrpc": "2.0",
+                    "method": "get_dependency_tree",
+                    "params": {"package_name": "flask"},
+                    "id": 2,
+                }
+            )
+        )
+
+    mock_client.search_packages.assert_called_once_with(query="flask", page=2)
+    # Each tree call writes its own visualization, so it is never cached
+    assert mock_client.get_dependency_tree.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_no_params_handling(rpc_server, mock_client):
     """Test handling of no parameters."""
@@ -233,32 +342,414 @@ async def test_process_mcp_stdin():
         '{"jsonrpc": "2.0", "result": "success", "id": 1}'
     )
 
+    stdin = MagicMock()
+    stdin.buffer = io.BytesIO(b'{"jsonrpc": "2.0", "method": "ping", "id": 1}\n')
+    stdout = MagicMock()
+    stdout.buffer = io.BytesIO()
+
     with (
         patch("mcp_pypi.cli.server.RPCServer", return_value=mock_server),
         patch("mcp_pypi.cli.server.PyPIClient", return_value=mock_client),
-        patch("sys.stdin.readline") as mock_readline,
-        patch("builtins.print") as mock_print,
+        patch("sys.stdin", stdin),
+        patch("sys.stdout", stdout),
     ):
-
-        # Set up the mock to return a request and then EOF
-        mock_readline.side_effect = [
-            '{"jsonrpc": "2.0", "method": "ping", "id": 1}',
-            "",  # Empty string indicates EOF
-        ]
-
         # Call the function to test
         from mcp_pypi.cli.server import process_mcp_stdin
 
         await process_mcp_stdin(verbose=True)
 
         # Verify expectations
-        mock_server.handle_request.assert_called_once()
-        mock_print.assert_called_once_with(
-            '{"jsonrpc": "2.0", "result": "success", "id": 1}', flush=True
+        mock_server.handle_request.assert_called_once_with(
+            b'{"jsonrpc": "2.0", "method": "ping", "id": 1}'
+        )
+        assert (
+            stdout.buffer.getvalue()
+            == b'{"jsonrpc": "2.0", "result": "success", "id": 1}\n'
         )
         mock_client.close.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_process_mcp_stdin_batched_lines():
+    """Test that several requests in one read, and a partial last line, are handled."""
+    mock_client = AsyncMock(spec=PyPIClient)
+    mock_server = MagicMock(spec=RPCServer)
+    mock_server.handle_request = AsyncMock(side_effect=['{"id": 1}', '{"id": 2}'])
+
+    stdin = MagicMock()
+    stdin.buffer = io.BytesIO(b'{"id": 1}\n\n{"id": 2}')
+    stdout = MagicMock()
+    stdout.buffer = io.BytesIO()
+
+    with (
+        patch("mcp_pypi.cli.server.RPCServer", return_value=mock_server),
+        patch("mcp_pypi.cli.server.PyPIClient", return_value=mock_client),
+        patch("sys.stdin", stdin),
+        patch("sys.stdout", stdout),
+    ):
+        from mcp_pypi.cli.server import process_mcp_stdin
+
+        await process_mcp_stdin()
+
+    assert [c.args[0] for c in mock_server.handle_request.call_args_list] == [
+        b'{"id": 1}',
+        b'{"id": 2}',
+    ]
+    assert stdout.buffer.getvalue() == b'{"id": 1}\n{"id": 2}\n'
+
+
+@pytest.mark.asyncio
+async def test_process_mcp_stdin_runs_batch_concurrently():
+    """Test that requests from one read overlap instead of running serially."""
+    mock_client = AsyncMock(spec=PyPIClient)
+    started = 0
+    both_started = asyncio.Event()
+
+    async def slow_request(line):
+        nonlocal started
+        started += 1
+        if started == 2:
+            both_started.set()
+        # Deadlocks (and times out) if the requests are handled one at a time
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        return line.decode()
+
+    mock_server = MagicMock(spec=RPCServer)
+    mock_server.handle_request = AsyncMock(side_effect=slow_request)
+
+    stdin = MagicMock()
+    stdin.buffer = io.BytesIO(b'{"id": 1}\n{"id": 2}\n')
+    stdout = MagicMock()
+    stdout.buffer = io.BytesIO()
+
+    with (
+        patch("mcp_pypi.cli.server.RPCServer", return_value=mock_server),
+        patch("mcp_pypi.cli.server.PyPIClient", return_value=mock_client),
+        patch("sys.stdin", stdin),
+        patch("sys.stdout", stdout),
+    ):
+        from mcp_pypi.cli.server import process_mcp_stdin
+
+        await process_mcp_stdin()
+
+    assert stdout.buffer.getvalue() == b'{"id": 1}\n{"id": 2}\n'
+
+
+@pytest.mark.asyncio
+async def test_process_mcp_stdin_answers_without_waiting_for_slow_requests():
+    """Test that a fast request is answered while a slower one is in flight."""
+    mock_client = AsyncMock(spec=PyPIClient)
+    stdout = MagicMock()
+    stdout.buffer = io.BytesIO()
+    written_before_slow = None
+
+    async def handle_request(line):
+        nonlocal written_before_slow
+        if line == b'{"id": 1}':
+            await asyncio.sleep(0.1)
+            written_before_slow = stdout.buffer.getvalue()
+        return line.decode()
+
+    mock_server = MagicMock(spec=RPCServer)
+    mock_server.handle_request = AsyncMock(side_effect=handle_request)
+
+    stdin = MagicMock()
+    stdin.buffer = io.BytesIO(b'{"id": 1}\n{"id": 2}\n')
+
+    with (
+        patch("mcp_pypi.cli.server.RPCServer", return_value=mock_server),
+        patch("mcp_pypi.cli.server.PyPIClient", return_value=mock_client),
+        patch("sys.stdin", stdin),
+        patch("sys.stdout", stdout),
+    ):
+        from mcp_pypi.cli.server import process_mcp_stdin
+
+        await process_mcp_stdin()
+
+    assert written_before_slow == b'{"id": 2}\n'
+    assert stdout.buffer.getvalue() == b'{"id": 2}\n{"id": 1}\n'
+
+
+@pytest.mark.asyncio
+async def test_process_mcp_stdin_reads_pipe_via_event_loop():
+    """Test that a pipe on stdin is drained through the event loop reader."""
+    mock_client = AsyncMock(spec=PyPIClient)
+    mock_server = MagicMock(spec=RPCServer)
+    mock_server.handle_request = AsyncMock(side_effect=lambda line: line.decode())
+
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b'{"id": 1}\n{"id": 2}\n')
+    os.close(write_fd)
+
+    stdin = MagicMock()
+    stdin.buffer = os.fdopen(read_fd, "rb")
+    stdout = MagicMock()
+    stdout.buffer = io.BytesIO()
+
+    with (
+        patch("mcp_pypi.cli.server.RPCServer", return_value=mock_server),
+        patch("mcp_pypi.cli.server.PyPIClient", return_value=mock_client),
+        patch("sys.stdin", stdin),
+        patch("sys.stdout", stdout),
+        patch("mcp_pypi.cli.server._read_in_thread") as mock_thread_read,
+    ):
+        from mcp_pypi.cli.server import process_mcp_stdin
+
+        await process_mcp_stdin()
+
+    mock_thread_read.assert_not_called()
+    assert stdout.buffer.getvalue() == b'{"id": 1}\n{"id": 2}\n'
+
+
+@pytest.mark.asyncio
+async def test_process_mcp_stdin_stops_on_sigint():
+    """Test that SIGINT stops reading but still answers requests already read."""
+    mock_client = AsyncMock(spec=PyPIClient)
+    mock_server = MagicMock(spec=RPCServer)
+    mock_server.handle_request = AsyncMock(side_effect=lambda line: line.decode())
+
+    # Leave the write end open so only the signal can end the read loop
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b'{"id": 1}\n')
+
+    stdin = MagicMock()
+    stdin.buffer = os.fdopen(read_fd, "rb")
+    stdout = MagicMock()
+    stdout.buffer = io.BytesIO()
+
+    loop = asyncio.get_running_loop()
+    loop.call_later(0.1, os.kill, os.getpid(), signal.SIGINT)
+
+    try:
+        with (
+            patch("mcp_pypi.cli.server.RPCServer", return_value=mock_server),
+            patch("mcp_pypi.cli.server.PyPIClient", return_value=mock_client),
+            patch("sys.stdin", stdin),
+            patch("sys.stdout", stdout),
+        ):
+            from mcp_pypi.cli.server import process_mcp_stdin
+
+            await asyncio.wait_for(process_mcp_stdin(), timeout=5)
+    finally:
+        os.close(write_fd)
+
+    assert stdout.buffer.getvalue() == b'{"id": 1}\n'
+    mock_client.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_process_mcp_stdin_stops_on_sigint_while_reading_in_thread():
+    """Test that SIGINT ends the server while a thread read is still blocked."""
+    mock_client = AsyncMock(spec=PyPIClient)
+    mock_server = MagicMock(spec=RPCServer)
+    mock_server.handle_request = AsyncMock(side_effect=lambda line: line.decode())
+
+    # A socket is read on a thread; the open peer keeps that read blocked
+    left, right = socket.socketpair()
+    right.sendall(b'{"id": 1}\n')
+
+    stdin = MagicMock()
+    stdin.buffer = os.fdopen(os.dup(left.fileno()), "rb")
+    stdout = MagicMock()
+    stdout.buffer = io.BytesIO()
+
+    loop = asyncio.get_running_loop()
+    loop.call_later(0.1, os.kill, os.getpid(), signal.SIGINT)
+
+    try:
+        with (
+            patch("mcp_pypi.cli.server.RPCServer", return_value=mock_server),
+            patch("mcp_pypi.cli.server.PyPIClient", return_value=mock_client),
+            patch("sys.stdin", stdin),
+            patch("sys.stdout", stdout),
+        ):
+            from mcp_pypi.cli.server import process_mcp_stdin
+
+            await asyncio.wait_for(process_mcp_stdin(), timeout=5)
+    finally:
+        # Unblocks the abandoned reader thread
+        right.close()
+        left.close()
+
+    assert stdout.buffer.getvalue() == b'{"id": 1}\n'
+    mock_client.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_process_mcp_stdin_sigint_drops_partial_line():
+    """Test that a stop signal drops an incomplete request and later input."""
+    mock_client = AsyncMock(spec=PyPIClient)
+    mock_server = MagicMock(spec=RPCServer)
+
+    async def handle_request(line):
+        # Keep the server draining while the client writes after the signal
+        await asyncio.sleep(0.3)
+        return line.decode()
+
+    mock_server.handle_request = AsyncMock(side_effect=handle_request)
+
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b'{"id": 1}\n{"id": 2')
+
+    stdin = MagicMock()
+    stdin.buffer = os.fdopen(read_fd, "rb")
+    stdout = MagicMock()
+    stdout.buffer = io.BytesIO()
+
+    loop = asyncio.get_running_loop()
+    loop_errors = []
+    loop.set_exception_handler(lambda _, context: loop_errors.append(context))
+    loop.call_later(0.1, os.kill, os.getpid(), signal.SIGINT)
+    loop.call_later(0.2, os.write, write_fd, b'}\n{"id": 3}\n')
+
+    try:
+        with (
+            patch("mcp_pypi.cli.server.RPCServer", return_value=mock_server),
+            patch("mcp_pypi.cli.server.PyPIClient", return_value=mock_client),
+            patch("sys.stdin", stdin),
+            patch("sys.stdout", stdout),
+        ):
+            from mcp_pypi.cli.server import process_mcp_stdin
+
+            await asyncio.wait_for(process_mcp_stdin(), timeout=5)
+    finally:
+        loop.set_exception_handler(None)
+        os.close(write_fd)
+
+    assert stdout.buffer.getvalue() == b'{"id": 1}\n'
+    assert loop_errors == []
+
+
+@pytest.mark.asyncio
+async def test_process_mcp_stdin_defers_gc_until_idle():
+    """Test that automatic GC is paused while serving and restored afterwards."""
+    mock_client = AsyncMock(spec=PyPIClient)
+    mock_server = MagicMock(spec=RPCServer)
+    gc_states = []
+
+    async def handle_request(line):
+        gc_states.append(gc.isenabled())
+        return line.decode()
+
+    mock_server.handle_request = AsyncMock(side_effect=handle_request)
+
+    # Two requests separated by an idle gap longer than the GC delay
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b'{"id": 1}\n')
+
+    def finish_input():
+        os.write(write_fd, b'{"id": 2}\n')
+        os.close(write_fd)
+
+    loop = asyncio.get_running_loop()
+    loop.call_later(0.2, finish_input)
+
+    stdin = MagicMock()
+    stdin.buffer = os.fdopen(read_fd, "rb")
+    stdout = MagicMock()
+    stdout.buffer = io.BytesIO()
+
+    with (
+        patch("mcp_pypi.cli.server.RPCServer", return_value=mock_server),
+        patch("mcp_pypi.cli.server.PyPIClient", return_value=mock_client),
+        patch("mcp_pypi.cli.server.GC_IDLE_DELAY", 0.05),
+        patch("sys.stdin", stdin),
+        patch("sys.stdout", stdout),
+        patch("gc.collect") as mock_collect,
+    ):
+        from mcp_pypi.cli.server import process_mcp_stdin
+
+        await asyncio.wait_for(process_mcp_stdin(), timeout=5)
+
+    assert gc_states == [False, False]
+    # Only the idle gap ran a full collection, not the end of each request
+    mock_collect.assert_called_once_with()
+    assert gc.isenabled()
+
+
+@pytest.mark.parametrize(
+    "counts, expected",
+    [
+        ((100, 9, 9), None),
+        ((60_000, 3, 9), 0),
+        ((60_000, 10, 9), 1),
+        ((60_000, 10, 10), 2),
+    ],
+)
+def test_collect_deferred_garbage_promotes_generations(counts, expected):
+    """Test that deferred collections reach older generations on threshold."""
+    from mcp_pypi.cli.server import _collect_deferred_garbage
+
+    with (
+        patch("gc.get_count", return_value=counts),
+        patch("gc.get_threshold", return_value=(700, 10, 10)),
+        patch("gc.collect") as mock_collect,
+    ):
+        _collect_deferred_garbage()
+
+    if expected is None:
+        mock_collect.assert_not_called()
+    else:
+        mock_collect.assert_called_once_with(expected)
+
+
+def test_write_responses_uses_writev(tmp_path):
+    """Test that a response batch is coalesced into one writev on a real fd."""
+    from mcp_pypi.cli.server import _write_responses
+
+    out_path = tmp_path / "out"
+    with (
+        open(out_path, "wb") as stdout,
+        patch("os.writev", wraps=os.writev) as mock_writev,
+    ):
+        _write_responses(stdout, [b'{"id": 1}\n', b'{"id": 2}\n'])
+
+    mock_writev.assert_called_once()
+    assert out_path.read_bytes() == b'{"id": 1}\n{"id": 2}\n'
+
+
+@pytest.mark.asyncio
+async def test_connect_stdin_reader_skips_sockets():
+    """Test that a socket stdin is left blocking for the thread fallback."""
+    from mcp_pypi.cli.server import _connect_stdin_reader
+
+    left, right = socket.socketpair()
+    try:
+        with os.fdopen(os.dup(left.fileno()), "rb") as stdin:
+            reader, transport = await _connect_stdin_reader(
+                asyncio.get_running_loop(), stdin
+            )
+            assert (reader, transport) == (None, None)
+            assert os.get_blocking(stdin.fileno())
+    finally:
+        left.close()
+        right.close()
+
+
+def test_write_responses_retries_when_fd_would_block(tmp_path):
+    """Test that EAGAIN from a non-blocking stdout waits and retries the write."""
+    from mcp_pypi.cli.server import _write_responses
+
+    out_path = tmp_path / "out"
+    real_writev = os.writev
+    attempts = []
+
+    def writev(fd, buffers):
+        attempts.append(fd)
+        if len(attempts) == 1:
+            raise BlockingIOError()
+        return real_writev(fd, buffers)
+
+    with (
+        open(out_path, "wb") as stdout,
+        patch("os.writev", side_effect=writev) as mock_writev,
+    ):
+        _write_responses(stdout, [b'{"id": 1}\n'])
+
+    assert mock_writev.call_count == 2
+    assert out_path.read_bytes() == b'{"id": 1}\n'
+
+
 @pytest.mark.asyncio
 async def test_start_server():
     """Test the HTTP server startup."""
@@ -111,6 +111,39 @@ async def test_cache_etag(cache_manager):
     assert non_existent is None
 
 
+@pytest.mark.asyncio
+async def test_cache_refresh(cache_manager, config):
+    """Test that refreshing revives an expired entry."""
+    key = f"test-key-{uuid.uuid4()}"
+    data = {"test": "data", "number": 123}
+
+    await cache_manager.set(key, data, "test-etag", ttl=1)
+    await asyncio.sleep(1.1)
+    assert await cache_manager.get(key) is None
+
+    assert await cache_manager.refresh(key) == data
+    assert await cache_manager.get(key) == data
+    assert await cache_manager.get_etag(key) == "test-etag"
+
+    assert await cache_manager.refresh(f"non-existent-{uuid.uuid4()}") is None
+
+
+@pytest.mark.asyncio
+async def test_cache_expired_entry_revalidates_from_memory(cache_manager):
+    """Test that an expired hot entry keeps its ETag in the memory tier."""
+    key = f"test-key-{uuid.uuid4()}"
+    data = {"test": "data"}
+
+    await cache_manager.set(key, data, "test-etag", ttl=1)
+    await asyncio.sleep(1.1)
+    assert await cache_manager.get(key) is None
+
+    # The conditional request path must not need to go back to disk
+    (await cache_manager._get_cache_path(key)).unlink()
+    assert await cache_manager.get_etag(key) == "test-etag"
+    assert await cache_manager.refresh(key) == data
+
+
 @pytest.mark.asyncio
 async def test_cache_clear(cache_manager):
     """Test clearing the cache."""
@@ -179,3 +212,77 @@ async def test_cache_stats(cache_manager):
     assert stats["file_count"] == 5
     assert stats["total_size_bytes"] > 0
     assert stats["total_size_mb"] > 0
+
+
+@pytest.mark.asyncio
+async def test_cache_memory_tier(cache_manager):
+    """Test that hot entries are served from memory as independent copies."""
+    key = f"test-key-{uuid.uuid4()}"
+    data = {"test": "data", "nested": {"number": 123}}
+
+    await cache_manager.set(key, data)
+
+    # Remove the file behind the cache's back; the memory tier still answers
+    (await cache_manager._get_cache_path(key)).unlink()
+    cached_data = await cache_manager.get(key)
+    assert cached_data == data
+
+    # Mutating a returned value must not leak into later hits
+    cached_data["nested"]["number"] = 456
+    assert await cache_manager.get(key) == data
+
+
+@pytest.mark.asyncio
+async def test_cache_pruning_evicts_oldest(cache_manager, config):
+    """Test that pruning evicts least recently accessed entries first."""
+    config.cache_max_size = 1000
+    keys = [f"test-key-{i}-{uuid.uuid4()}" for i in range(8)]
+
+    for i, key in enumerate(keys):
+        # Random payloads stay large even if entries are compressed on disk
+        await cache_manager.set(key, {"payload": os.urandom(200).hex()})
+        # Spread access times so eviction order is deterministic
+        path = await cache_manager._get_cache_path(key)
+        os.utime(path, (time.time() - 100 + i, time.time() - 100 + i))
+
+    # Pruning runs before each write, so at most one entry overshoots the cap
+    size = await cache_manager.get_cache_size()
+    assert size <= config.cache_max_size + path.stat().st_size
+    assert cache_manager._disk_size == size
+
+    # The oldest entry is gone from disk; the newest survived
+    assert not (await cache_manager._get_cache_path(keys[0])).exists()
+    assert (await cache_manager._get_cache_path(keys[-1])).exists()
+
+
+@pytest.mark.asyncio
+async def test_cache_overwrite_tracks_size_delta(cache_manager):
+    """Test that rewriting an entry doesn't double-count its size."""
+    key = f"test-key-{uuid.uuid4()}"
+    await cache_manager.set(key, {"value": 1})
+    cache_manager._disk_size = await cache_manager.get_cache_size()
+
+    for _ in range(3):
+        await cache_manager.set(key, {"value": 1})
+
+    assert cache_manager._disk_size == await cache_manager.get_cache_size()
+
+
+@pytest.mark.asyncio
+async def test_cache_entries_compressed_with_zstd(cache_manager):
+    """Test that disk entries are zstd-compressed when zstandard is installed."""
+    pytest.importorskip("zstandard")
+
+    key = f"test-key-{uuid.uuid4()}"
+    data = {"description": "compressible " * 100}
+
+    await cache_manager.set(key, data)
+    raw = (await cache_manager._get_cache_path(key)).read_bytes()
+    assert raw.startswith(b"\x28\xb5\x2f\xfd")
+    assert len(raw) < len(json.dumps(data))
+
+    # Read back from disk rather than the memory tier
+    cache_manager._memory.clear()
+    assert await cache_manager.get(key) == data
+    stats = await cache_manager.get_cache_stats()
+    assert stats["newest_timestamp"] > 0
@@ -132,6 +132,46 @@ async def test_fetch_not_modified(http_client, mock_cache):
         http_client.fetch = original_fetch
 
 
+@pytest.mark.asyncio
+async def test_fetch_revalidates_stale_entry(http_client, mock_cache):
+    """Test that a 304 for a stale entry renews it without a second request."""
+    url = "https://test.example.com/api/revalidate"
+    cached_data = {"cached": "data"}
+
+    mock_cache.get_etag.return_value = 'W/"test-etag"'
+    mock_cache.refresh.return_value = cached_data
+    mock_response = create_mock_response(304)
+
+    with patch.object(
+        ClientSession, "request", return_value=mock_response
+    ) as mock_request:
+        result = await http_client.fetch(url)
+
+    assert result == cached_data
+    mock_request.assert_called_once()
+    assert mock_request.call_args.kwargs["headers"]["If-None-Match"] == 'W/"test-etag"'
+    mock_cache.refresh.assert_called_once_with(url)
+
+
+@pytest.mark.asyncio
+async def test_fetch_unchanged_etag_skips_decoding(http_client, mock_cache):
+    """Test that a 200 carrying the cached ETag reuses the cached entry."""
+    url = "https://test.example.com/api/same-etag"
+    cached_data = {"cached": "data"}
+
+    mock_cache.get_etag.return_value = '"same"'
+    mock_cache.refresh.return_value = cached_data
+    mock_response = create_mock_response(200, {"fresh": "data"})
+    mock_response.headers = {"Content-Type": "application/json", "ETag": '"same"'}
+
+    with patch.object(ClientSession, "request", return_value=mock_response):
+        result = await http_client.fetch(url)
+
+    assert result == cached_data
+    mock_response.json.assert_not_called()
+    mock_cache.set.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_fetch_404_not_found(http_client):
     """Test fetch with 404 Not Found response."""
@@ -190,6 +230,42 @@ async def test_fetch_rate_limit(http_client):
         assert result == {"test": "data"}
 
 
+@pytest.mark.asyncio
+async def test_fetch_rate_limit_backoff_recovers(http_client):
+    """Test a 429 pauses all requests briefly and the pacing recovers after."""
+    from mcp_pypi.core.http import RATE_LIMIT_BASE_DELAY
+
+    rate_limit_response = create_mock_response(429, {})
+    rate_limit_response.headers = {"Retry-After": "0"}
+    success_response = create_mock_response(200, {"test": "data"})
+    success_response.headers = {"Content-Type": "application/json"}
+
+    with patch.object(
+        ClientSession, "request", side_effect=[rate_limit_response, success_response]
+    ):
+        result = await http_client.fetch("https://test.example.com/api/limited")
+
+    assert result == {"test": "data"}
+    assert http_client._paused_until > 0
+    assert http_client.rate_limit_delay == RATE_LIMIT_BASE_DELAY
+
+
+@pytest.mark.asyncio
+async def test_fetch_rate_limit_gives_up_after_retries(http_client):
+    """Test persistent 429s use up the retries instead of looping forever."""
+    rate_limit_response = create_mock_response(429, {})
+    rate_limit_response.headers = {"Retry-After": "0"}
+
+    with patch.object(
+        ClientSession, "request", return_value=rate_limit_response
+    ) as mock_request:
+        result = await http_client.fetch("https://test.example.com/api/limited")
+
+    assert result["error"]["code"] == "network_error"
+    assert "429" in result["error"]["message"]
+    assert mock_request.call_count == http_client.config.max_retries
+
+
 @pytest.mark.asyncio
 async def test_fetch_connection_error(http_client):
     """Test fetch handling connection errors."""
@@ -253,6 +329,108 @@ async def test_fetch_json_decode_error(http_client):
         assert result["error"]["code"] == "parse_error"
 
 
+@pytest.mark.asyncio
+async def test_fetch_coalesces_concurrent_requests(http_client):
+    """Test that concurrent GETs for one URL share a single request."""
+    url = "https://test.example.com/api/shared"
+    mock_data = {"test": "data", "nested": {"value": 123}}
+
+    mock_response = create_mock_response(200, mock_data)
+    mock_response.headers = {"Content-Type": "application/json"}
+
+    with patch.object(
+        ClientSession, "request", return_value=mock_response
+    ) as mock_request:
+        first, second = await asyncio.gather(
+            http_client.fetch(url), http_client.fetch(url)
+        )
+
+    mock_request.assert_called_once()
+    assert first == second == mock_data
+    assert first is not second
+    assert http_client._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_fetch_coalesced_request_survives_initiator_cancel(http_client):
+    """Test cancelling the first caller doesn't fail callers that joined it."""
+    url = "https://test.example.com/api/shared"
+    release = asyncio.Event()
+
+    async def fetch(*args, **kwargs):
+        await release.wait()
+        return {"test": "data"}
+
+    with patch.object(http_client, "_fetch", side_effect=fetch) as mock_fetch:
+        first = asyncio.ensure_future(http_client.fetch(url))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(http_client.fetch(url))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        release.set()
+
+        assert await second == {"test": "data"}
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    mock_fetch.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_fetch_decodes_vendor_json_with_headers(http_client, mock_cache):
+    """Test that +json media types are decoded and cached like plain JSON."""
+    url = "https://test.example.com/simple/pkg/"
+    headers = {"Accept": "application/vnd.pypi.simple.v1+json"}
+    mock_data = {"name": "pkg", "versions": ["1.0.0"], "files": []}
+
+    mock_response = create_mock_response(200, mock_data)
+    mock_response.headers = {
+        "Content-Type": "application/vnd.pypi.simple.v1+json",
+        "ETag": '"abc"',
+    }
+
+    with patch.object(
+        ClientSession, "request", return_value=mock_response
+    ) as mock_request:
+        first, second = await asyncio.gather(
+            http_client.fetch(url, headers=headers),
+            http_client.fetch(url, headers=headers),
+        )
+
+    # Requests with the same headers are coalesced too
+    mock_request.assert_called_once()
+    assert mock_request.call_args.kwargs["headers"]["Accept"] == headers["Accept"]
+    assert first == second == mock_data
+    mock_cache.set.assert_called_once_with(url, mock_data, '"abc"')
+
+
+@pytest.mark.asyncio
+async def test_session_uses_pooled_connector(http_client):
+    """Test that the session reuses one bounded keep-alive connection pool."""
+    from mcp_pypi.core.http import (
+        KEEPALIVE_TIMEOUT,
+        MAX_CONNECTIONS,
+        MAX_CONNECTIONS_PER_HOST,
+    )
+
+    session = await http_client._get_session()
+
+    assert await http_client._get_session() is session
+    assert isinstance(session.connector, aiohttp.TCPConnector)
+    assert session.connector.limit == MAX_CONNECTIONS
+    assert session.connector.limit_per_host == MAX_CONNECTIONS_PER_HOST
+
+    # A recreated session keeps the same TLS context
+    await http_client.close()
+    with patch(
+        "mcp_pypi.core.http.TCPConnector", wraps=aiohttp.TCPConnector
+    ) as mock_connector:
+        await http_client._get_session()
+    assert mock_connector.call_args.kwargs["ssl"] is http_client._ssl_context
+    assert mock_connector.call_args.kwargs["keepalive_timeout"] == KEEPALIVE_TIMEOUT
+
+
 @pytest.mark.asyncio
 async def test_close(http_client):
     """Test closing the HTTP client."""
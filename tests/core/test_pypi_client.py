@@ -1,16 +1,18 @@
 #!/usr/bin/env python3
 """Comprehensive tests for the PyPIClient class."""
 
+import asyncio
 import json
 import os
 import tempfile
+import time
 import xml.etree.ElementTree as ET
 from io import StringIO
 from unittest.mock import AsyncMock, MagicMock, mock_open, patch
 
 import pytest
 
-from mcp_pypi.core import PyPIClient
+from mcp_pypi.core import SIMPLE_JSON_ACCEPT, PyPIClient
 from mcp_pypi.core.cache import AsyncCacheManager
 from mcp_pypi.core.http import AsyncHTTPClient
 from mcp_pypi.core.models import PyPIClientConfig
@@ -57,6 +59,14 @@ def client(mock_http_client, mock_cache_manager, mock_stats_service):
     return client
 
 
+def test_optional_dependencies_probe_top_level_packages(client):
+    """Test optional dependencies are located by package without importing."""
+    with patch("importlib.util.find_spec", return_value=None) as mock_find_spec:
+        assert client._check_import("plotly") is False
+
+    mock_find_spec.assert_called_once_with("plotly")
+
+
 @pytest.mark.asyncio
 async def test_get_newest_packages_success(client, mock_http_client):
     """Test get_newest_packages with successful response."""
@@ -177,11 +187,61 @@ async def test_get_latest_updates_error(client, mock_http_client):
     mock_http_client.fetch.assert_called_once_with("https://pypi.org/rss/updates.xml")
 
 
+@pytest.mark.asyncio
+async def test_get_dependencies_many(client, mock_http_client):
+    """Test that batched dependency lookups run concurrently, keyed by name."""
+    in_flight = 0
+    peak = 0
+
+    async def fetch(url):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        name = url.split("/")[-2]
+        return {"info": {"requires_dist": [f"{name}-dep>=1.0"]}}
+
+    mock_http_client.fetch.side_effect = fetch
+
+    result = await client.get_dependencies_many(["pkg-a", "pkg-b", "pkg-a"])
+
+    assert list(result) == ["pkg-a", "pkg-b"]
+    assert result["pkg-b"]["dependencies"][0]["name"] == "pkg-b-dep"
+    assert mock_http_client.fetch.call_count == 2
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_get_dependencies_many_respects_max_concurrency(
+    client, mock_http_client
+):
+    """Test that batched lookups never exceed config.max_concurrency."""
+    client.config.max_concurrency = 2
+    in_flight = 0
+    peak = 0
+
+    async def fetch(url):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"info": {"requires_dist": []}}
+
+    mock_http_client.fetch.side_effect = fetch
+
+    result = await client.get_dependencies_many([f"pkg-{i}" for i in range(5)])
+
+    assert len(result) == 5
+    assert peak == 2
+
+
 @pytest.mark.asyncio
 async def test_check_package_exists_success(client, mock_http_client):
     """Test check_package_exists with existing package."""
     # Setup mock response
-    mock_response = {"info": {"name": "test-package", "version": "1.0.0"}}
+    mock_response = {"name": "test-package", "versions": ["1.0.0"], "files": []}
     mock_http_client.fetch.return_value = mock_response
 
     # Execute
@@ -191,7 +251,8 @@ async def test_check_package_exists_success(client, mock_http_client):
     assert "exists" in result
     assert result["exists"] is True
     mock_http_client.fetch.assert_called_once_with(
-        "https://pypi.org/pypi/test-package/json"
+        "https://pypi.org/simple/test-package/",
+        headers={"Accept": SIMPLE_JSON_ACCEPT},
     )
 
 
@@ -210,36 +271,34 @@ async def test_check_package_exists_nonexistent(client, mock_http_client):
     assert "exists" in result
     assert result["exists"] is False
     mock_http_client.fetch.assert_called_once_with(
-        "https://pypi.org/pypi/nonexistent-package/json"
+        "https://pypi.org/simple/nonexistent-package/",
+        headers={"Accept": SIMPLE_JSON_ACCEPT},
     )
 
 
 @pytest.mark.asyncio
 async def test_get_dependency_tree_success(client, mock_http_client):
     """Test get_dependency_tree with successful responses."""
-    # Setup mock responses for main package
-    mock_http_client.fetch.side_effect = [
-        # First call - main package
-        {
-            "info": {
-                "name": "main-package",
-                "version": "1.0.0",
-                "requires_dist": ["dep1>=1.0.0", "dep2>=2.0.0"],
-            }
-        },
-        # Second call - dep1
-        {
-            "info": {
-                "name": "dep1",
-                "version": "1.0.0",
-                "requires_dist": ["dep3>=3.0.0"],
-            }
-        },
-        # Third call - dep2
-        {"info": {"name": "dep2", "version": "2.0.0", "requires_dist": []}},
-        # Fourth call - dep3
-        {"info": {"name": "dep3", "version": "3.0.0", "requires_dist": []}},
-    ]
+    # Setup mock responses: Simple API pages for latest versions, /json
+    # documents for dependencies
+    packages = {
+        "main-package": ("1.0.0", ["dep1>=1.0.0", "dep2>=2.0.0"]),
+        "dep1": ("1.0.0", ["dep3>=3.0.0"]),
+        "dep2": ("2.0.0", []),
+        "dep3": ("3.0.0", []),
+    }
+
+    async def fetch(url, *args, **kwargs):
+        if url.startswith("https://pypi.org/simple/"):
+            name = url.split("/")[-2]
+            return {"name": name, "versions": [packages[name][0]], "files": []}
+        name = url.split("/pypi/")[1].split("/")[0]
+        version, requires_dist = packages[name]
+        return {
+            "info": {"name": name, "version": version, "requires_dist": requires_dist}
+        }
+
+    mock_http_client.fetch.side_effect = fetch
 
     # Execute
     result = await client.get_dependency_tree("main-package", depth=2)
@@ -252,7 +311,144 @@ async def test_get_dependency_tree_success(client, mock_http_client):
     assert "dependencies" in tree
     # Check that HTTP calls were made
     assert mock_http_client.fetch.call_count >= 2
-    mock_http_client.fetch.assert_any_call("https://pypi.org/pypi/main-package/json")
+    mock_http_client.fetch.assert_any_call(
+        "https://pypi.org/pypi/main-package/1.0.0/json"
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_dependency_tree_resolves_levels_concurrently(
+    client, mock_http_client
+):
+    """Test get_dependency_tree fetches each level together, once per package."""
+    packages = {
+        "main-package": ["shared>=1.0", "dep1>=1.0"],
+        "dep1": ["shared>=1.0"],
+        "shared": [],
+    }
+    calls = []
+
+    async def fetch(url, *args, **kwargs):
+        calls.append(url)
+        await asyncio.sleep(0)
+        if url.startswith("https://pypi.org/simple/"):
+            return {"name": url.split("/")[-2], "versions": ["1.0.0"], "files": []}
+        name = url.split("/pypi/")[1].split("/")[0]
+        return {
+            "info": {
+                "name": name,
+                "version": "1.0.0",
+                "requires_dist": packages[name],
+            }
+        }
+
+    mock_http_client.fetch.side_effect = fetch
+
+    result = await client.get_dependency_tree("main-package", depth=2)
+
+    tree = result["tree"]
+    assert [dep["name"] for dep in tree["dependencies"]] == ["shared", "dep1"]
+    assert tree["dependencies"][1]["dependencies"][0].get("cycle") is True
+    assert result["flat_list"] == [
+        "main-package (1.0.0)",
+        "shared (1.0.0)",
+        "dep1 (1.0.0)",
+    ]
+    # Latest versions are resolved once per distinct dependency name
+    assert calls.count("https://pypi.org/simple/shared/") == 1
+
+
+@pytest.mark.asyncio
+async def test_get_dependency_tree_does_not_wait_for_slow_siblings(
+    client, mock_http_client
+):
+    """Test a deep branch is resolved while a sibling branch is still loading."""
+    packages = {"main-package": ["slow", "fast"], "fast": ["leaf"], "slow": []}
+    leaf_requested = asyncio.Event()
+
+    async def fetch(url, *args, **kwargs):
+        if url.startswith("https://pypi.org/simple/"):
+            return {"name": url.split("/")[-2], "versions": ["1.0.0"], "files": []}
+        name = url.split("/pypi/")[1].split("/")[0]
+        if name == "leaf":
+            leaf_requested.set()
+        elif name == "slow":
+            # Only answers once the next level of the fast branch is underway
+            await leaf_requested.wait()
+        return {
+            "info": {
+                "name": name,
+                "version": "1.0.0",
+                "requires_dist": packages.get(name, []),
+            }
+        }
+
+    mock_http_client.fetch.side_effect = fetch
+
+    result = await asyncio.wait_for(
+        client.get_dependency_tree("main-package", depth=3), timeout=5
+    )
+
+    assert result["flat_list"] == [
+        "main-package (1.0.0)",
+        "slow (1.0.0)",
+        "fast (1.0.0)",
+        "leaf (1.0.0)",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_dependency_tree_visualization(client, mock_http_client, tmp_path):
+    """Test the treemap follows real parent/child edges and loads plotly.js from a CDN."""
+    pytest.importorskip("plotly.io")
+    client.config.cache_dir = str(tmp_path)
+    client._has_plotly = True
+    packages = {"main-package": ["dep1", "dep2"], "dep1": ["dep2"], "dep2": []}
+
+    async def fetch(url, *args, **kwargs):
+        if url.startswith("https://pypi.org/simple/"):
+            return {"name": url.split("/")[-2], "versions": ["1.0.0"], "files": []}
+        name = url.split("/pypi/")[1].split("/")[0]
+        return {
+            "info": {"name": name, "version": "1.0.0", "requires_dist": packages[name]}
+        }
+
+    mock_http_client.fetch.side_effect = fetch
+
+    result = await client.get_dependency_tree("main-package", depth=2)
+
+    viz_file = result["visualization_url"][len("file://") :]
+    assert os.listdir(tmp_path) == [os.path.basename(viz_file)]
+    with open(viz_file) as f:
+        html = f.read()
+    assert "cdn.plot.ly" in html
+    assert '"ids":["main-package:1.0.0","dep1:1.0.0","dep2:1.0.0"]' in html
+    assert '"parents":["","main-package:1.0.0","main-package:1.0.0"]' in html
+
+
+@pytest.mark.asyncio
+async def test_get_dependency_tree_skips_large_visualization(
+    client, mock_http_client, tmp_path
+):
+    """Test that trees over the size cap are returned without a treemap."""
+    client.config.cache_dir = str(tmp_path)
+    client._has_plotly = True
+
+    async def fetch(url, *args, **kwargs):
+        if url.startswith("https://pypi.org/simple/"):
+            return {"name": url.split("/")[-2], "versions": ["1.0.0"], "files": []}
+        name = url.split("/pypi/")[1].split("/")[0]
+        requires = ["dep1", "dep2"] if name == "main-package" else []
+        return {"info": {"name": name, "version": "1.0.0", "requires_dist": requires}}
+
+    mock_http_client.fetch.side_effect = fetch
+
+    with patch("mcp_pypi.core.MAX_VISUALIZED_PACKAGES", 2):
+        result = await client.get_dependency_tree("main-package", depth=2)
+
+    assert len(result["flat_list"]) == 3
+    assert "visualization_url" not in result
+    assert os.listdir(tmp_path) == []
 
 
 @pytest.mark.asyncio
@@ -269,7 +465,8 @@ async def test_get_dependency_tree_error(client, mock_http_client):
     assert result["error"]["code"] == "unknown_error"
     assert "Network error" in result["error"]["message"]
     mock_http_client.fetch.assert_called_once_with(
-        "https://pypi.org/pypi/main-package/json"
+        "https://pypi.org/simple/main-package/",
+        headers={"Accept": SIMPLE_JSON_ACCEPT},
     )
 
 
@@ -285,9 +482,9 @@ async def test_check_requirements_file_success(client, mock_http_client):
         # Setup mock responses
         mock_http_client.fetch.side_effect = [
             # First call - package1
-            {"info": {"name": "package1", "version": "1.5.0"}},
+            {"name": "package1", "versions": ["1.5.0"], "files": []},
             # Second call - package2
-            {"info": {"name": "package2", "version": "2.0.0"}},
+            {"name": "package2", "versions": ["2.0.0"], "files": []},
         ]
 
         # Execute
@@ -306,14 +503,54 @@ async def test_check_requirements_file_success(client, mock_http_client):
         assert result["up_to_date"][0]["package"] == "package2"
 
         # Verify API calls
-        mock_http_client.fetch.assert_any_call("https://pypi.org/pypi/package1/json")
-        mock_http_client.fetch.assert_any_call("https://pypi.org/pypi/package2/json")
+        mock_http_client.fetch.assert_any_call(
+            "https://pypi.org/simple/package1/", headers={"Accept": SIMPLE_JSON_ACCEPT}
+        )
+        mock_http_client.fetch.assert_any_call(
+            "https://pypi.org/simple/package2/", headers={"Accept": SIMPLE_JSON_ACCEPT}
+        )
     finally:
         # Clean up
         if os.path.exists(requirements_path):
             os.unlink(requirements_path)
 
 
+@pytest.mark.asyncio
+async def test_check_requirements_file_checks_lines_concurrently(
+    client, mock_http_client
+):
+    """Test requirement lines are looked up together but reported in file order."""
+    with tempfile.NamedTemporaryFile(delete=False, mode="w", suffix=".txt") as tmp:
+        requirements_path = tmp.name
+        tmp.write("slow==1.0.0\nfast==1.0.0\nunpinned\n")
+
+    started = []
+    release = asyncio.Event()
+
+    async def fetch(url, *args, **kwargs):
+        name = url.split("/")[-2]
+        started.append(name)
+        if len(started) == 3:
+            release.set()
+        # Every lookup must be in flight before any of them completes
+        await release.wait()
+        if name == "slow":
+            await asyncio.sleep(0.01)
+        return {"name": name, "versions": ["2.0.0"], "files": []}
+
+    mock_http_client.fetch.side_effect = fetch
+
+    try:
+        result = await asyncio.wait_for(
+            client.check_requirements_file(requirements_path), timeout=5
+        )
+
+        assert [pkg["package"] for pkg in result["outdated"]] == ["slow", "fast"]
+        assert [pkg["package"] for pkg in result["up_to_date"]] == ["unpinned"]
+    finally:
+        os.unlink(requirements_path)
+
+
 @pytest.mark.asyncio
 async def test_check_requirements_file_error(client, mock_http_client):
     """Test check_requirements_file with file not found error."""
@@ -346,11 +583,11 @@ async def test_check_requirements_file_with_inline_comments(client, mock_http_cl
         # Setup mock responses
         mock_http_client.fetch.side_effect = [
             # Response for requests
-            {"info": {"version": "2.28.1", "name": "requests"}},
+            {"name": "requests", "versions": ["2.28.1"], "files": []},
             # Response for flask
-            {"info": {"version": "2.3.0", "name": "flask"}},
+            {"name": "flask", "versions": ["2.3.0"], "files": []},
             # Response for numpy
-            {"info": {"version": "1.21.6", "name": "numpy"}},
+            {"name": "numpy", "versions": ["1.21.6"], "files": []},
         ]
 
         # Check the requirements file
@@ -380,9 +617,15 @@ async def test_check_requirements_file_with_inline_comments(client, mock_http_cl
         assert len(result["up_to_date"]) == 2
 
         # Verify API calls were made correctly and comments were properly stripped
-        mock_http_client.fetch.assert_any_call("https://pypi.org/pypi/requests/json")
-        mock_http_client.fetch.assert_any_call("https://pypi.org/pypi/flask/json")
-        mock_http_client.fetch.assert_any_call("https://pypi.org/pypi/numpy/json")
+        mock_http_client.fetch.assert_any_call(
+            "https://pypi.org/simple/requests/", headers={"Accept": SIMPLE_JSON_ACCEPT}
+        )
+        mock_http_client.fetch.assert_any_call(
+            "https://pypi.org/simple/flask/", headers={"Accept": SIMPLE_JSON_ACCEPT}
+        )
+        mock_http_client.fetch.assert_any_call(
+            "https://pypi.org/simple/numpy/", headers={"Accept": SIMPLE_JSON_ACCEPT}
+        )
 
     finally:
         # Clean up
@@ -482,6 +725,21 @@ requires = ["typer>=0.9.0"]
             os.unlink(pyproject_path)
 
 
+def test_parse_requirement_is_memoized():
+    """Test that identical requirement strings are parsed only once."""
+    from packaging.requirements import InvalidRequirement
+
+    from mcp_pypi.core import _parse_requirement
+
+    req = _parse_requirement("requests[socks]>=2.0; python_version >= '3.8'")
+    assert req.name == "requests"
+    assert req.extras == {"socks"}
+    assert _parse_requirement("requests[socks]>=2.0; python_version >= '3.8'") is req
+
+    with pytest.raises(InvalidRequirement):
+        _parse_requirement("not a requirement ===")
+
+
 @pytest.mark.asyncio
 async def test_search_packages_success(client, mock_http_client):
     """Test search_packages with successful response."""
@@ -498,7 +756,9 @@ async def test_search_packages_success(client, mock_http_client):
     }
 
     # Patch Beautiful Soup
-    with patch.object(client, "_has_bs4", True):
+    with patch.object(client, "_has_bs4", True), patch.object(
+        client, "_has_selectolax", False
+    ):
         with patch("bs4.BeautifulSoup") as mock_bs:
             # Set up mock BS4 behavior
             mock_soup = MagicMock()
@@ -543,6 +803,45 @@ async def test_search_packages_success(client, mock_http_client):
     )
 
 
+@pytest.mark.asyncio
+async def test_search_packages_selectolax(client, mock_http_client):
+    """Test search_packages with the selectolax parser."""
+    pytest.importorskip("selectolax")
+
+    mock_http_client.fetch.return_value = {
+        "raw_data": """<html><body>
+        <a class="package-snippet" href="/project/package1/">
+          <h3><span class="package-snippet__name">package1</span>
+          <span class="package-snippet__version">1.0.0</span></h3>
+          <p class="package-snippet__description">Test package 1</p>
+        </a>
+        <a class="package-snippet" href="/project/package2/">
+          <h3><span class="package-snippet__name">package2</span>
+          <span class="package-snippet__version">2.0.0</span></h3>
+        </a>
+        </body></html>""",
+        "content_type": "text/html",
+    }
+
+    with patch.object(client, "_has_selectolax", True):
+        result = await client.search_packages("test")
+
+    assert result["results"] == [
+        {
+            "name": "package1",
+            "version": "1.0.0",
+            "description": "Test package 1",
+            "url": "https://pypi.org/project/package1/",
+        },
+        {
+            "name": "package2",
+            "version": "2.0.0",
+            "description": "",
+            "url": "https://pypi.org/project/package2/",
+        },
+    ]
+
+
 @pytest.mark.asyncio
 async def test_search_packages_error(client, mock_http_client):
     """Test search_packages with error response."""
@@ -657,20 +956,99 @@ async def test_get_package_info_error(client, mock_http_client):
 async def test_get_latest_version_success(client, mock_http_client):
     """Test getting latest version with successful response."""
     # Setup mock response
-    mock_response = {"info": {"name": "test-package", "version": "1.0.0"}}
+    mock_response = {
+        "name": "test-package",
+        "versions": ["0.9.0", "1.0.0", "0.10.0"],
+        "files": [],
+    }
     mock_http_client.fetch.return_value = mock_response
 
     # Execute
-    result = await client.get_latest_version("test-package")
+    result = await client.get_latest_version("Test_Package")
 
     # Verify
     assert "version" in result
     assert result["version"] == "1.0.0"
     mock_http_client.fetch.assert_called_once_with(
-        "https://pypi.org/pypi/test-package/json"
+        "https://pypi.org/simple/test-package/",
+        headers={"Accept": SIMPLE_JSON_ACCEPT},
     )
 
 
+@pytest.mark.asyncio
+async def test_get_latest_version_skips_prereleases_and_yanked(
+    client, mock_http_client
+):
+    """Test the latest version matches PyPI's: final and not yanked first."""
+    mock_http_client.fetch.return_value = {
+        "name": "test-package",
+        "versions": ["1.0.0", "1.1.0", "2.0.0b1"],
+        "files": [
+            {"filename": "test_package-1.0.0.tar.gz", "yanked": False},
+            {"filename": "test_package-1.1.0-py3-none-any.whl", "yanked": True},
+            {"filename": "test_package-1.1.0.tar.gz", "yanked": "Broken build"},
+            {"filename": "test_package-2.0.0b1.tar.gz", "yanked": False},
+        ],
+    }
+
+    result = await client.get_latest_version("test-package")
+
+    assert result == {"version": "1.0.0"}
+
+
+@pytest.mark.asyncio
+async def test_get_latest_version_prerelease_only(client, mock_http_client):
+    """Test a project with only pre-releases reports the newest one."""
+    mock_http_client.fetch.return_value = {
+        "name": "test-package",
+        "versions": ["1.0.0a1", "1.0.0rc1"],
+        "files": [],
+    }
+
+    result = await client.get_latest_version("test-package")
+
+    assert result == {"version": "1.0.0rc1"}
+
+
+@pytest.mark.asyncio
+async def test_get_latest_version_falls_back_to_json_api(client, mock_http_client):
+    """Test indexes without the JSON Simple API are served from /json."""
+    mock_http_client.fetch.side_effect = [
+        {"raw_data": "<html></html>", "content_type": "text/html"},
+        {"info": {"name": "test-package", "version": "1.0.0"}},
+        {"info": {"name": "other-package", "version": "2.0.0"}},
+    ]
+
+    assert await client.get_latest_version("test-package") == {"version": "1.0.0"}
+    # Later lookups go straight to /json
+    assert await client.get_latest_version("other-package") == {"version": "2.0.0"}
+    assert [call.args[0] for call in mock_http_client.fetch.call_args_list] == [
+        "https://pypi.org/simple/test-package/",
+        "https://pypi.org/pypi/test-package/json",
+        "https://pypi.org/pypi/other-package/json",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_latest_version_keeps_simple_api_after_odd_response(
+    client, mock_http_client
+):
+    """Test an unexpected Simple API reply falls back once without latching."""
+    mock_http_client.fetch.side_effect = [
+        {"raw_data": "upstream timeout", "content_type": "text/plain"},
+        {"info": {"name": "test-package", "version": "1.0.0"}},
+        {"name": "other-package", "versions": ["2.0.0"], "files": []},
+    ]
+
+    assert await client.get_latest_version("test-package") == {"version": "1.0.0"}
+    assert await client.get_latest_version("other-package") == {"version": "2.0.0"}
+    assert [call.args[0] for call in mock_http_client.fetch.call_args_list] == [
+        "https://pypi.org/simple/test-package/",
+        "https://pypi.org/pypi/test-package/json",
+        "https://pypi.org/simple/other-package/",
+    ]
+
+
 @pytest.mark.asyncio
 async def test_get_latest_version_error(client, mock_http_client):
     """Test getting latest version with error response."""
@@ -686,10 +1064,92 @@ async def test_get_latest_version_error(client, mock_http_client):
     assert "error" in result
     assert result["error"]["code"] == "not_found"
     mock_http_client.fetch.assert_called_once_with(
-        "https://pypi.org/pypi/nonexistent-package/json"
+        "https://pypi.org/simple/nonexistent-package/",
+        headers={"Accept": SIMPLE_JSON_ACCEPT},
     )
 
 
+@pytest.mark.asyncio
+async def test_get_latest_version_memoized(client, mock_http_client):
+    """Test repeated and concurrent version lookups share one fetch."""
+    mock_http_client.fetch.return_value = {
+        "name": "test-package",
+        "versions": ["1.0.0"],
+        "files": [],
+    }
+
+    results = await asyncio.gather(
+        client.get_latest_version("test-package"),
+        client.get_latest_version("test-package"),
+    )
+    results.append(await client.get_latest_version("test-package"))
+
+    assert results == [{"version": "1.0.0"}] * 3
+    assert len({id(result) for result in results}) == 3
+    mock_http_client.fetch.assert_called_once_with(
+        "https://pypi.org/simple/test-package/",
+        headers={"Accept": SIMPLE_JSON_ACCEPT},
+    )
+
+
+@pytest.mark.asyncio
+async def test_memoized_lookup_survives_first_caller_cancel(client, mock_http_client):
+    """Test cancelling the caller that started a lookup doesn't fail joiners."""
+    release = asyncio.Event()
+
+    async def fetch(*args, **kwargs):
+        await release.wait()
+        return {"name": "test-package", "versions": ["1.0.0"], "files": []}
+
+    mock_http_client.fetch.side_effect = fetch
+
+    first = asyncio.ensure_future(client.get_latest_version("test-package"))
+    await asyncio.sleep(0)
+    second = asyncio.ensure_future(client.get_latest_version("test-package"))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    release.set()
+
+    assert await second == {"version": "1.0.0"}
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    mock_http_client.fetch.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_latest_version_errors_not_memoized(client, mock_http_client):
+    """Test failed version lookups are retried on the next call."""
+    mock_http_client.fetch.side_effect = [
+        {"error": {"code": "network_error", "message": "Timed out"}},
+        {"name": "test-package", "versions": ["1.0.0"], "files": []},
+    ]
+
+    assert "error" in await client.get_latest_version("test-package")
+    assert await client.get_latest_version("test-package") == {"version": "1.0.0"}
+    assert mock_http_client.fetch.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_missing_packages_memoized_briefly(client, mock_http_client):
+    """Test "not found" answers are reused, but only for NEGATIVE_CACHE_TTL."""
+    mock_http_client.fetch.return_value = {
+        "error": {"code": "not_found", "message": "Resource not found"}
+    }
+
+    for _ in range(2):
+        assert (await client.get_latest_version("typo-package"))["error"][
+            "code"
+        ] == "not_found"
+        assert await client.check_package_exists("typo-package") == {"exists": False}
+    assert mock_http_client.fetch.call_count == 2
+
+    with patch("mcp_pypi.core.time.monotonic", return_value=time.monotonic() + 301):
+        await client.get_latest_version("typo-package")
+        await client.check_package_exists("typo-package")
+    assert mock_http_client.fetch.call_count == 4
+
+
 @pytest.mark.asyncio
 async def test_get_package_releases_success(client, mock_http_client):
     """Test getting package releases with successful response."""
@@ -841,6 +1301,44 @@ async def test_get_project_releases_success(client, mock_http_client):
     )
 
 
+@pytest.mark.asyncio
+async def test_get_project_releases_feed_streams_items(client, mock_http_client):
+    """Test the releases feed with bytes input and items missing fields."""
+    xml_response = b"""<?xml version="1.0" encoding="UTF-8"?>
+    <rss version="2.0">
+      <channel>
+        <title>test-package releases</title>
+        <item>
+          <title>test-package 1.0.0</title>
+          <link>https://pypi.org/project/test-package/1.0.0/</link>
+          <pubDate>Sat, 01 Jan 2023 12:00:00 GMT</pubDate>
+        </item>
+        <item>
+          <link>https://pypi.org/project/test-package/0.9.0/</link>
+        </item>
+      </channel>
+    </rss>"""
+    mock_http_client.fetch.return_value = {
+        "raw_data": xml_response,
+        "content_type": "application/xml",
+    }
+
+    result = await client.get_project_releases_feed("test-package")
+
+    assert result == {
+        "package_name": "test-package",
+        "releases": [
+            {
+                "version": "1.0.0",
+                "title": "test-package 1.0.0",
+                "link": "https://pypi.org/project/test-package/1.0.0/",
+                "description": "",
+                "published_date": "Sat, 01 Jan 2023 12:00:00 GMT",
+            }
+        ],
+    }
+
+
 @pytest.mark.asyncio
 async def test_get_project_releases_error(client, mock_http_client):
     """Test getting project releases with error response."""
@@ -901,6 +1399,27 @@ async def test_get_package_metadata_success(client, mock_http_client):
     )
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("web, async , http,", ["web", "async", "http"]),
+        ("web async http", ["web", "async", "http"]),
+        ("", []),
+        (None, []),
+    ],
+)
+async def test_get_package_metadata_keywords(client, mock_http_client, raw, expected):
+    """Test that keywords are split on commas, or whitespace in legacy metadata."""
+    mock_http_client.fetch.return_value = {
+        "info": {"name": "test-package", "version": "1.0.0", "keywords": raw}
+    }
+
+    result = await client.get_package_metadata("test-package")
+
+    assert result["metadata"]["keywords"] == expected
+
+
 @pytest.mark.asyncio
 async def test_get_package_metadata_with_version(client, mock_http_client):
     """Test getting package metadata with specific version."""
@@ -966,6 +1485,33 @@ async def test_get_package_stats_with_version(client, mock_stats_service):
     )
 
 
+@pytest.mark.asyncio
+async def test_get_package_stats_checks_existence_concurrently(
+    client, mock_http_client, mock_stats_service
+):
+    """Test the existence check overlaps the stats fetch and still gates it."""
+    stats_started = asyncio.Event()
+
+    async def fetch(url, *args, **kwargs):
+        # Only answers once the stats request is already underway
+        await stats_started.wait()
+        return {"error": {"code": "not_found", "message": "Package not found"}}
+
+    async def get_package_stats(*args):
+        stats_started.set()
+        return {"downloads": {}, "last_month": 0, "last_week": 0, "last_day": 0}
+
+    mock_http_client.fetch.side_effect = fetch
+    mock_stats_service.get_package_stats.side_effect = get_package_stats
+
+    result = await asyncio.wait_for(
+        client.get_package_stats("missing-package"), timeout=5
+    )
+
+    assert result["error"]["code"] == "not_found"
+    assert "missing-package" in result["error"]["message"]
+
+
 @pytest.mark.asyncio
 async def test_get_documentation_url_success(client, mock_http_client):
     """Test getting documentation URL with successful response."""
@@ -1029,3 +1575,13 @@ async def test_get_documentation_url_fallback(client, mock_http_client):
     mock_http_client.fetch.assert_called_once_with(
         "https://pypi.org/pypi/test-package/json"
     )
+
+
+@pytest.mark.asyncio
+async def test_client_context_manager_closes_http(client, mock_http_client):
+    """Test the client closes its HTTP session when used as a context manager."""
+    async with client as entered:
+        assert entered is client
+        mock_http_client.close.assert_not_called()
+
+    mock_http_client.close.assert_called_once()
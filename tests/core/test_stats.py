@@ -9,7 +9,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from mcp_pypi.core.models import ErrorCode, format_error
-from mcp_pypi.core.stats import PackageStatsService
+from mcp_pypi.core.stats import PackageStatsService, _recent_month_keys
 
 
 @pytest.fixture
@@ -241,6 +241,18 @@ def test_generate_synthetic_stats(stats_service):
     assert result["downloads"][months[1]] > result["downloads"][months[2]]
 
 
+def test_recent_month_keys():
+    """Test month keys are consecutive calendar months, newest first."""
+    keys = _recent_month_keys(14)
+
+    assert keys[0] == datetime.date.today().strftime("%Y-%m")
+    assert len(set(keys)) == 14
+    for newer, older in zip(keys, keys[1:]):
+        year, month = map(int, newer.split("-"))
+        expected = f"{year - 1}-12" if month == 1 else f"{year}-{month - 1:02d}"
+        assert older == expected
+
+
 @pytest.mark.asyncio
 async def test_get_package_stats_handle_raw_json_data(stats_service, mock_http_client):
     """Test handling raw JSON data in HTTP response."""
@@ -2,6 +2,7 @@
 
 import importlib.machinery
 import importlib.util
+import subprocess
 import sys
 from unittest.mock import MagicMock, patch
 
@@ -28,3 +29,14 @@ def test_main_entry_point():
             # Check that app and sys.exit were called
             mock_app.assert_called_once()
             mock_exit.assert_called_once_with(mock_app.return_value)
+
+
+def test_cli_import_defers_mcp_server():
+    """Test that importing the CLI and client leaves the MCP server unloaded."""
+    code = (
+        "import sys, mcp_pypi.cli.main, mcp_pypi.core; "
+        "assert 'mcp_pypi.server' not in sys.modules; "
+        "from mcp_pypi import PyPIMCPServer; "
+        "assert PyPIMCPServer.__module__ == 'mcp_pypi.server'"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -49,6 +49,13 @@ class TestCache(unittest.TestCase):
         cached_value = self.cache.get(key)
         self.assertEqual(cached_value, value)
 
+    def test_set_and_get_non_ascii(self):
+        """Test that non-ASCII text survives the on-disk encoding."""
+        value = {"summary": "Zürich ✓ 東京", "versions": ["1.0", "2.0"]}
+
+        self.assertTrue(self.cache.set("unicode_key", value))
+        self.assertEqual(self.cache.get("unicode_key"), value)
+
     def test_expiry(self):
         """Test cache entry expiry."""
         key = "test_key"
@@ -165,6 +172,24 @@ class TestCache(unittest.TestCase):
         entries = self.cache._get_cache_entries()
         self.assertLess(len(entries), 3)
 
+    def test_set_tracks_size_without_rescanning(self):
+        """Test that writes keep a running size instead of rescanning the directory."""
+        self.cache.set("key1", "value1")
+
+        # pylint: disable=protected-access
+        with mock.patch.object(
+            self.cache, "_get_cache_size", side_effect=AssertionError("rescanned")
+        ):
+            self.cache.set("key2", "value2")
+            self.cache.set("key1", "a longer value1")
+            self.cache.invalidate("key2")
+
+        actual_size = sum(
+            os.path.getsize(os.path.join(self.temp_dir, name))
+            for name in os.listdir(self.temp_dir)
+        )
+        self.assertEqual(self.cache._disk_size, actual_size)
+
     def test_get_stats(self):
         """Test getting cache statistics."""
         # Add some entries
@@ -50,6 +50,18 @@ class TestHybridCache(unittest.TestCase):
         self.assertEqual(stats["memory_hits"], 1)
         self.assertEqual(stats["memory_misses"], 0)
 
+    def test_memory_hit_skips_lock(self):
+        """Test that memory hits are served without taking the cache lock."""
+        self.cache.set("key1", "value1")
+
+        lock = mock.MagicMock()
+        lock.__enter__.side_effect = AssertionError("lock taken")
+        # pylint: disable=protected-access
+        with mock.patch.object(self.cache, "_lock", lock):
+            self.assertEqual(self.cache.get("key1"), "value1")
+
+        self.assertEqual(self.cache.get_enhanced_stats()["memory_hits"], 1)
+
     def test_memory_to_disk_fallback(self):
         """Test fallback from memory to disk cache."""
         key = "test_key"
@@ -101,6 +113,21 @@ class TestHybridCache(unittest.TestCase):
         self.assertTrue(stats["memory_misses"] >= 1)
         self.assertTrue(stats["disk_misses"] >= 1)
 
+    def test_expired_memory_entry_rereads_shared_disk(self):
+        """Test that an expired memory entry still finds a fresh disk entry."""
+        self.cache.set("key1", "value1", ttl=0.1)
+        time.sleep(0.2)
+
+        # Another instance sharing the directory rewrites the entry
+        other = HybridCache(cache_dir=self.temp_dir, ttl=1, max_size=10240)
+        other.set("key1", "value2")
+
+        self.assertEqual(self.cache.get("key1"), "value2")
+
+        stats = self.cache.get_enhanced_stats()
+        self.assertEqual(stats["memory_misses"], 1)
+        self.assertEqual(stats["disk_hits"], 1)
+
     def test_invalidate(self):
         """Test invalidating a specific cache entry."""
         # Add some entries
@@ -207,6 +234,29 @@ class TestHybridCache(unittest.TestCase):
         self.assertIn("key4", self.cache._memory_cache)
         self.assertNotIn("key3", self.cache._memory_cache)
 
+    def test_lfu_eviction_after_reset(self):
+        """Test that re-setting a key resets its LFU access count."""
+        self.cache.eviction_strategy = EvictionStrategy.LFU
+        self.cache.memory_max_size = 3
+
+        self.cache.set("key1", "value1")
+        for _ in range(3):
+            self.cache.get("key1")
+        self.cache.set("key2", "value2")
+        self.cache.set("key3", "value3")
+        for _ in range(2):
+            self.cache.get("key2")
+            self.cache.get("key3")
+
+        # Overwriting key1 drops its accumulated hits
+        self.cache.set("key1", "value1b")
+        self.cache.set("key4", "value4")
+
+        self.assertNotIn("key1", self.cache._memory_cache)
+        self.assertIn("key2", self.cache._memory_cache)
+        self.assertIn("key3", self.cache._memory_cache)
+        self.assertIn("key4", self.cache._memory_cache)
+
     def test_ttl_eviction(self):
         """Test TTL-based eviction strategy."""
         # Set eviction strategy
@@ -228,6 +278,23 @@ class TestHybridCache(unittest.TestCase):
         self.assertIn("key4", self.cache._memory_cache)
         self.assertNotIn("key3", self.cache._memory_cache)
 
+    def test_ttl_eviction_after_overwrite(self):
+        """Test that TTL eviction uses the expiry of the latest write."""
+        self.cache.eviction_strategy = EvictionStrategy.TTL
+        self.cache.memory_max_size = 3
+
+        self.cache.set("key1", "value1", ttl=5)
+        self.cache.set("key2", "value2", ttl=3)
+        self.cache.set("key3", "value3", ttl=1)
+
+        # Extending key3 makes key2 the entry closest to expiry
+        self.cache.set("key3", "value3b", ttl=10)
+        self.cache.set("key4", "value4", ttl=4)
+
+        self.assertEqual(len(self.cache._memory_cache), 3)
+        self.assertNotIn("key2", self.cache._memory_cache)
+        self.assertIn("key3", self.cache._memory_cache)
+
     def test_thread_safety(self):
         """Test that the cache is thread-safe."""
 
@@ -256,6 +323,22 @@ class TestHybridCache(unittest.TestCase):
             expected = f"value_{i}"
             self.assertEqual(self.cache.get(key), expected)
 
+    def test_disk_io_uses_per_key_stripes(self):
+        """Test that a busy disk stripe doesn't block other keys."""
+        # pylint: disable=protected-access
+        busy = self.cache._disk_lock_for("busy_key")
+        other = next(
+            f"key_{i}"
+            for i in range(100)
+            if self.cache._disk_lock_for(f"key_{i}") is not busy
+        )
+
+        with busy, ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self.cache.set, other, "value")
+            self.assertTrue(future.result(timeout=5))
+
+        self.assertEqual(self.cache.get(other), "value")
+
     def test_enhanced_stats(self):
         """Test getting enhanced cache statistics."""
         # Add some entries
@@ -0,0 +1,57 @@
+"""
+Tests for the JSON serialization utilities.
+"""
+
+import json
+import unittest
+from unittest import mock
+
+from mcp_pypi.utils.common import serialization
+from mcp_pypi.utils.common.serialization import (
+    JSONDecodeError,
+    json_dumps,
+    json_dumps_bytes,
+    json_dumps_pretty,
+    json_loads,
+)
+
+
+class TestSerialization(unittest.TestCase):
+    """Test the JSON helpers with whichever backend is installed."""
+
+    def test_round_trip(self):
+        """Test that encoded documents decode back to the same object."""
+        data = {"name": "requests", "versions": ["2.31.0", "2.32.0"], "n": 1}
+        self.assertEqual(json_loads(json_dumps(data)), data)
+        self.assertEqual(json_loads(json_dumps_bytes(data)), data)
+
+    def test_loads_accepts_bytes(self):
+        """Test decoding raw bytes without a str round-trip."""
+        self.assertEqual(json_loads(b'{"id": 1}'), {"id": 1})
+
+    def test_invalid_json_raises_stdlib_error(self):
+        """Test that decode errors are catchable as json.JSONDecodeError."""
+        with self.assertRaises(json.JSONDecodeError):
+            json_loads(b"not json")
+        self.assertIs(JSONDecodeError, json.JSONDecodeError)
+
+    def test_dumps_pretty_matches_stdlib_layout(self):
+        """Test that pretty output is identical with either backend."""
+        data = {"name": "café", "deps": ["a", "b"], "info": {"n": 1}}
+        expected = json.dumps(data, indent=2, ensure_ascii=False)
+        self.assertEqual(json_dumps_pretty(data), expected)
+        with mock.patch.object(serialization, "HAS_ORJSON", False):
+            self.assertEqual(json_dumps_pretty(data), expected)
+
+    def test_stdlib_fallback(self):
+        """Test the helpers when orjson is unavailable."""
+        with mock.patch.object(serialization, "HAS_ORJSON", False):
+            self.assertEqual(json_dumps({"a": [1, 2]}), '{"a":[1,2]}')
+            self.assertEqual(json_dumps_bytes({"a": 1}), b'{"a":1}')
+            self.assertEqual(json_loads(b'{"a": 1}'), {"a": 1})
+            with self.assertRaises(JSONDecodeError):
+                json_loads("{")
+
+
+if __name__ == "__main__":
+    unittest.main()